@@ -1,10 +1,13 @@
+import struct
 import typing
 import warnings
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from decimal import Decimal, localcontext
+from itertools import product
 from math import atan2, copysign, cos, degrees, hypot, isclose, radians, sin, sqrt
 
-__all__ = ('Vector',)
+__all__ = ('Vector', 'CachedVector')
 
 #: ppb_vector's current version.
 #: It follows the semantic versioning convention.
@@ -20,6 +23,119 @@ VectorLike = typing.Union[
 ]
 
 
+# Bounds on the magnitude of products of coordinates, outside of which
+#  rounding errors (or overflow) make them unsuitable for computing angles.
+_TINY = 2.0 ** -969
+_INF = float('inf')
+
+
+def _direction(x: float, y: float, length: float) -> typing.Tuple[float, float]:
+    """Get the unit vector along a non-null vector of the given length."""
+    if length < 1e-300:
+        # Subnormal coordinates are too imprecise to divide by the length;
+        #  scaling by a power of 2 is exact, and does not change the direction.
+        x, y = x * 2.0 ** 600, y * 2.0 ** 600
+        length = hypot(x, y)
+
+    return x / length, y / length
+
+
+# Binary layouts of a single vector, keyed by (typecode, byteorder).
+#  The typecodes are those of the array and struct modules.
+_STRUCTS = {
+    (typecode, byteorder): struct.Struct(prefix + 2 * typecode)
+    for typecode in ('f', 'd')
+    for byteorder, prefix in (('little', '<'), ('big', '>'))
+}
+
+
+def _vector_struct(typecode: str, byteorder: str) -> struct.Struct:
+    try:
+        return _STRUCTS[typecode, byteorder]
+    except KeyError:
+        raise ValueError(
+            f"Expected typecode 'f' or 'd' and byteorder 'little' or 'big', "
+            f"got {typecode!r} and {byteorder!r}",
+        ) from None
+
+
+# π, to more digits than needed for correctly rounding its multiples to floats
+_PI = Decimal('3.14159265358979323846264338327950288')
+
+
+def _offset(x: float, ulps: int) -> float:
+    """Offset a positive float by a number of units in the last place."""
+    bits, = struct.unpack('<q', struct.pack('<d', x))
+    return struct.unpack('<d', struct.pack('<q', bits + ulps))[0]
+
+
+def _bracket(x: float, exact: Decimal) -> typing.List[float]:
+    """List the floats on either side of an exact value, given the closest one."""
+    if Decimal(x) == exact:
+        return [x]
+
+    return [x, _offset(x, 1 if Decimal(x) < exact else -1)]
+
+
+def _exact_trig(angle: int) -> typing.Tuple[float, float]:
+    """Compute the cosine and sine of an integral angle between 0° and 45°.
+
+    The result is the pair of correctly rounded values if ``r_cos * r_cos +
+    r_sin * r_sin == 1.0`` exactly. Otherwise, it is the closest pair of faithfully
+    rounded values (each less than an ulp away from the exact value) that keeps
+    lengths exactly, if any; there is none for 4°, 6°, 8°, 10° and 12°, whose
+    correctly rounded values are used instead.
+    """
+    with localcontext() as ctx:
+        ctx.prec = 40
+        r = _PI * angle / 180
+        term, r_cos, r_sin = Decimal(1), Decimal(0), Decimal(0)
+        for k in range(40):
+            # Taylor series of cos and sin, where term is r**k / k!
+            if k % 4 == 0:
+                r_cos += term
+            elif k % 4 == 1:
+                r_sin += term
+            elif k % 4 == 2:
+                r_cos -= term
+            else:
+                r_sin -= term
+            term = term * r / (k + 1)
+
+    # float(Decimal) is correctly rounded
+    c, s = float(r_cos), float(r_sin)
+    if c * c + s * s == 1.0:
+        return c, s
+
+    def error(pair: typing.Tuple[float, float]) -> Decimal:
+        return abs(Decimal(pair[0]) - r_cos) + abs(Decimal(pair[1]) - r_sin)
+
+    exact = [
+        (c_i, s_j)
+        for c_i, s_j in product(_bracket(c, r_cos), _bracket(s, r_sin))
+        if c_i * c_i + s_j * s_j == 1.0
+    ]
+    return min(exact, key=error) if exact else (c, s)
+
+
+def _trig_table() -> typing.Tuple[typing.Tuple[float, float], ...]:
+    octant = [_exact_trig(angle) for angle in range(46)]
+    # cos(90° - θ) = sin(θ), and conversely
+    quadrant = octant + [(r_sin, r_cos) for r_cos, r_sin in reversed(octant[1:45])]
+
+    # Rotating by 90° maps (cos, sin) to (-sin, cos)
+    table = list(quadrant)
+    for _ in range(3):
+        table += [(-r_sin, r_cos) for r_cos, r_sin in table[-90:]]
+
+    # Adding 0.0 turns negative zeros into positive ones
+    return tuple((r_cos + 0.0, r_sin + 0.0) for r_cos, r_sin in table)
+
+
+# Cosine and sine of the integral angles from 0° to 359°, see Vector._trig
+_TRIG_TABLE = _trig_table()
+
+
 @dataclass(eq=False, frozen=True, init=False, repr=False)
 class Vector:
     """The immutable, 2D vector class of the PursuedPyBear project.
@@ -151,6 +267,39 @@ class Vector:
         else:
             raise ValueError(f"Cannot use {value} as a vector-like")
 
+    def to_bytes(self, typecode: str = 'd', byteorder: str = 'little') -> bytes:
+        """Pack a vector's coordinates into bytes.
+
+        :param typecode: ``'d'`` for 64-bit floats, or ``'f'`` for 32-bit floats.
+        :param byteorder: ``'little'`` or ``'big'``, as in :py:meth:`int.to_bytes`.
+
+        >>> Vector(1, 2).to_bytes('f', 'big')
+        b'?\\x80\\x00\\x00@\\x00\\x00\\x00'
+
+        The conversion can be reversed using :py:meth:`from_bytes`.
+        For encoding many vectors at once, see :py:func:`ppb_vector.codec.encode_many`.
+        """
+        return _vector_struct(typecode, byteorder).pack(self.x, self.y)
+
+    @classmethod
+    def from_bytes(cls, buffer, typecode: str = 'd', byteorder: str = 'little') -> 'Vector':
+        """Unpack a vector from bytes produced by :py:meth:`to_bytes`.
+
+        :param buffer: any object supporting the buffer protocol, such as
+          :py:class:`bytes`, :py:class:`bytearray` or :py:class:`memoryview`.
+          Its size must be exactly that of two floats of the given ``typecode``.
+
+        >>> Vector.from_bytes(Vector(1, 2).to_bytes())
+        Vector(1.0, 2.0)
+        """
+        layout = _vector_struct(typecode, byteorder)
+        try:
+            x, y = layout.unpack(buffer)
+        except struct.error:
+            raise ValueError(f"Expected a buffer of {layout.size} bytes") from None
+
+        return cls(x, y)
+
     def __bool__(self) -> bool:
         """Check whether the vector is non-zero.
 
@@ -239,6 +388,81 @@ class Vector:
         other_x, other_y = Vector._unpack(other)
         return self.x * other_x + self.y * other_y
 
+    def cross(self, other: VectorLike) -> float:
+        """Compute the cross product of two vectors.
+
+        :param other: A :py:class:`Vector` or a vector-like.
+          For a description of vector-likes, see :py:func:`__new__`.
+
+        In 2D, the cross product is the scalar ``self.x * other.y - self.y * other.x``:
+        the Z coordinate of the cross product of the vectors, extended to 3D.
+        It is positive when ``other`` is counter-clockwise from ``self``.
+
+        >>> Vector(1, 0).cross((0, 2))
+        2.0
+        >>> Vector(1, 0).cross((0, -2))
+        -2.0
+
+        Equivalently, it is the dot product of :py:meth:`self.perp() <perp>` and ``other``:
+
+        >>> assert Vector(1, 2).cross((3, 4)) == Vector(1, 2).perp() * (3, 4)
+        """
+        other_x, other_y = Vector._unpack(other)
+        return self.x * other_y - self.y * other_x
+
+    def perp(self) -> 'Vector':
+        """Compute the perpendicular vector, rotated by 90° counter-clockwise.
+
+        >>> Vector(1, 2).perp()
+        Vector(-2.0, 1.0)
+
+        This is equivalent to, but faster and more accurate than,
+        :py:meth:`rotate(90) <rotate>`:
+
+        >>> assert Vector(1, 2).perp() == Vector(1, 2).rotate(90)
+        """
+        return Vector(-self.y, self.x)
+
+    def project_onto(self, other: VectorLike) -> 'Vector':
+        """Compute the projection of a vector onto another.
+
+        :param other: A :py:class:`Vector` or a vector-like.
+          For a description of vector-likes, see :py:func:`__new__`.
+
+        The result is the component of ``self`` parallel to ``other``:
+
+        >>> Vector(3, 4).project_onto( (2, 0) )
+        Vector(3.0, 0.0)
+
+        Projecting onto a null vector raises :py:exc:`ZeroDivisionError`,
+        as with :py:meth:`normalize`.
+        """
+        other_x, other_y = Vector._unpack(other)
+        unit_x, unit_y = _direction(other_x, other_y, hypot(other_x, other_y))
+
+        d = self.x * unit_x + self.y * unit_y
+        return Vector(d * unit_x, d * unit_y)
+
+    def reject_from(self, other: VectorLike) -> 'Vector':
+        """Compute the rejection of a vector from another.
+
+        :param other: A :py:class:`Vector` or a vector-like.
+          For a description of vector-likes, see :py:func:`__new__`.
+
+        The result is the component of ``self`` orthogonal to ``other``:
+
+        >>> Vector(3, 4).reject_from( (2, 0) )
+        Vector(0.0, 4.0)
+
+        It is equivalent to ``self - self.project_onto(other)``, but creates
+        no intermediate :py:class:`Vector`.
+        """
+        other_x, other_y = Vector._unpack(other)
+        unit_x, unit_y = _direction(other_x, other_y, hypot(other_x, other_y))
+
+        d = self.x * unit_x + self.y * unit_y
+        return Vector(self.x - d * unit_x, self.y - d * unit_y)
+
     def scale_by(self, scalar: typing.SupportsFloat) -> 'Vector':
         """Compute a vector-scalar multiplication.
 
@@ -309,7 +533,11 @@ class Vector:
         >>> Vector(3, 3) / 3
         Vector(1.0, 1.0)
         """
-        other = float(other)
+        try:
+            other = float(other)
+        except TypeError:
+            return NotImplemented
+
         return Vector(self.x / other, self.y / other)
 
     def __getitem__(self, item: typing.Union[str, int]) -> float:
@@ -381,9 +609,24 @@ class Vector:
 
         :py:meth:`angle` is guaranteed to produce an angle between -180° and 180°.
         """
-        other_x, other_y = Vector._unpack(other)
+        if isinstance(other, Vector):
+            other_x, other_y = other.x, other.y
+        else:
+            other_x, other_y = Vector._unpack(other)
+
+        x, y = self.x, self.y
+        # The angle is that of the complex number (x - iy)(other_x + i other_y),
+        #  whose real and imaginary parts are the dot and cross products.
+        cross = x * other_y - y * other_x
+        dot = x * other_x + y * other_y
+        if _TINY < abs(cross) + abs(dot) < _INF:
+            rv = degrees(atan2(cross, dot))
+        else:
+            # The products over- or underflowed, so fall back on computing the
+            #  difference of the vectors' angles, which is slower but insensitive
+            #  to their magnitude.
+            rv = degrees(atan2(other_x, -other_y) - atan2(x, -y))
 
-        rv = degrees(atan2(other_x, -other_y) - atan2(self.x, -self.y))
         # This normalizes the value to (-180, +180], which is the opposite of
         # what Python usually does but is normal for angles
         if rv <= -180:
@@ -434,6 +677,17 @@ class Vector:
 
     @staticmethod
     def _trig(angle: typing.SupportsFloat) -> typing.Tuple[float, float]:
+        # Rotations by whole degrees are the most common, and their cosine
+        #  and sine are precomputed: they are exact for multiples of 90°,
+        #  and otherwise less than an ulp from the exact values, keeping
+        #  r_cos² + r_sin² exactly 1 for all but a few angles (see _exact_trig).
+        if isinstance(angle, int):
+            return _TRIG_TABLE[angle % 360]
+
+        angle = float(angle)
+        if angle.is_integer():
+            return _TRIG_TABLE[int(angle % 360)]
+
         r = radians(angle)
         r_cos, r_sin = cos(r), sin(r)
 
@@ -466,6 +720,55 @@ class Vector:
         y = self.x * r_sin + self.y * r_cos
         return Vector(x, y)
 
+    def to_polar(self) -> typing.Tuple[float, float]:
+        """Convert a vector to polar coordinates.
+
+        Return the vector's :py:attr:`length` and its heading: the angle, in
+        degrees, from the X axis to the vector.
+
+        >>> Vector(0, 2).to_polar()
+        (2.0, 90.0)
+
+        As with :py:meth:`angle`, the heading is between -180° and 180°,
+        and :py:meth:`to_polar` is reversed by :py:meth:`from_polar`:
+
+        >>> Vector.from_polar(*Vector(0, 2).to_polar())
+        Vector(0.0, 2.0)
+
+        The heading of the null vector is 0°, whatever the signs of its zeros:
+
+        >>> Vector(-0.0, 0).to_polar()
+        (0.0, 0.0)
+        """
+        length = self.length
+        if not length:
+            # atan2 would give 180° for -0.0
+            return length, 0.0
+
+        heading = degrees(atan2(self.y, self.x))
+        if heading <= -180:
+            heading += 360
+
+        return length, heading
+
+    @classmethod
+    def from_polar(cls, length: typing.SupportsFloat,
+                   angle: typing.SupportsFloat) -> 'Vector':
+        """Make a vector from polar coordinates.
+
+        :param length: the length of the vector.
+        :param angle: the angle, in degrees, from the X axis to the vector.
+
+        >>> Vector.from_polar(2, 90)
+        Vector(0.0, 2.0)
+
+        This is equivalent to ``Vector(length, 0).rotate(angle)``,
+        but faster.
+        """
+        length = float(length)
+        r_cos, r_sin = Vector._trig(angle)
+        return cls(length * r_cos, length * r_sin)
+
     def normalize(self) -> 'Vector':
         """Return a vector with the same direction and unit length.
 
@@ -555,3 +858,52 @@ class Vector:
 
 
 Sequence.register(Vector)
+
+
+class CachedVector(Vector):
+    """A :py:class:`Vector` which caches its length and heading.
+
+    :py:class:`CachedVector` behaves exactly like :py:class:`Vector`, but
+    computes its :py:attr:`length` and :py:meth:`to_polar` coordinates lazily,
+    at most once. This is worthwhile for vectors that are queried many times,
+    such as headings shared by many entities:
+
+    >>> from ppb_vector import CachedVector
+    >>> v = CachedVector(3, 4)
+    >>> v.length
+    5.0
+    >>> assert v.to_polar() == Vector(3, 4).to_polar()
+
+    Operations on a :py:class:`CachedVector` return plain :py:class:`Vector`
+    instances, as the values they produce are usually only used once:
+
+    >>> v + (1, 1)
+    Vector(4.0, 5.0)
+    """
+    _length: float
+    _polar: typing.Tuple[float, float]
+
+    __slots__ = ('_length', '_polar')
+
+    def __reduce__(self):
+        return CachedVector, (self.x, self.y)
+
+    def __repr__(self) -> str:
+        return f"CachedVector({self.x}, {self.y})"
+
+    @property
+    def length(self) -> float:
+        try:
+            return self._length
+        except AttributeError:
+            length = hypot(self.x, self.y)
+            object.__setattr__(self, '_length', length)
+            return length
+
+    def to_polar(self) -> typing.Tuple[float, float]:
+        try:
+            return self._polar
+        except AttributeError:
+            polar = super().to_polar()
+            object.__setattr__(self, '_polar', polar)
+            return polar
@@ -0,0 +1,640 @@
+"""Broad-phase collision detection between axis-aligned bounding boxes.
+
+A broad phase finds the pairs of objects whose bounding boxes overlap, so that
+the exact, and more expensive, collision tests only run on those pairs.
+Bounding boxes are given by their minimum and maximum corners, as vector-likes.
+
+A :py:class:`SweepAndPrune` keeps boxes sorted along the X axis from one frame to
+the next. As objects move little between frames, keeping them sorted takes
+nearly linear time, and only the pairs which started or stopped overlapping are
+reported:
+
+>>> from ppb_vector.broadphase import SweepAndPrune
+>>> boxes = SweepAndPrune()
+>>> ship = boxes.add((0, 0), (2, 2))
+>>> rock = boxes.add((3, 1), (4, 2))
+>>> boxes.step()
+(set(), set())
+>>> boxes.move(ship, (1.5, 0), (3.5, 2))
+>>> boxes.step()
+({(0, 1)}, set())
+
+An :py:class:`AABBTree` answers queries about boxes, such as which boxes contain
+a point or are hit by a ray, in logarithmic time. It suits objects of very
+different sizes, and objects which move every frame:
+
+>>> from ppb_vector.broadphase import AABBTree
+>>> tree = AABBTree()
+>>> wall = tree.add((0, 0), (100, 1))
+>>> crate = tree.add((10, 5), (11, 6))
+>>> tree.query_point((10.5, 5.5))
+[1]
+>>> tree.query_ray((10.5, 20), (0, -1))
+[(14.0, 1), (19.0, 0)]
+"""
+import itertools
+import typing
+from heapq import heappop, heappush
+from math import hypot, inf
+
+from ppb_vector import Vector, VectorLike
+from ppb_vector.packed import _broadcast, _direction
+
+__all__ = ('SweepAndPrune', 'AABBTree')
+
+Box = typing.Tuple[float, float, float, float]
+Pair = typing.Tuple[int, int]
+
+
+def _box(min_corner: VectorLike, max_corner: VectorLike) -> Box:
+    min_x, min_y = Vector._unpack(min_corner)
+    max_x, max_y = Vector._unpack(max_corner)
+    if not (min_x <= max_x and min_y <= max_y):
+        raise ValueError(f"Invalid bounding box from {(min_x, min_y)} to {(max_x, max_y)}")
+
+    return min_x, min_y, max_x, max_y
+
+
+def _union(a: Box, b: Box) -> Box:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def _perimeter(box: Box) -> float:
+    return 2 * (box[2] - box[0] + box[3] - box[1])
+
+
+def _contains(outer: Box, inner: Box) -> bool:
+    x_contained = outer[0] <= inner[0] <= inner[2] <= outer[2]
+    return x_contained and outer[1] <= inner[1] <= inner[3] <= outer[3]
+
+
+def _overlap(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _enlarge(box: Box, margin: float) -> Box:
+    return box[0] - margin, box[1] - margin, box[2] + margin, box[3] + margin
+
+
+def _distance(box: Box, x: float, y: float) -> float:
+    """Compute the distance from a point to a box."""
+    return hypot(max(box[0] - x, 0.0, x - box[2]), max(box[1] - y, 0.0, y - box[3]))
+
+
+def _ray_entry(box: Box, x: float, y: float, inverse_dx: float, inverse_dy: float,
+               max_distance: float) -> typing.Optional[float]:
+    """Compute where a ray enters a box, or None if it misses it.
+
+    The ray's direction is given by the inverses of its coordinates, which are
+    infinite for zero coordinates.
+    """
+    t_min, t_max = 0.0, max_distance
+    for low, high, origin, inverse in ((box[0], box[2], x, inverse_dx),
+                                       (box[1], box[3], y, inverse_dy)):
+        if inverse == inf:
+            # The ray is parallel to this axis' slab
+            if not low <= origin <= high:
+                return None
+            continue
+
+        t1, t2 = (low - origin) * inverse, (high - origin) * inverse
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_min, t_max = max(t_min, t1), min(t_max, t2)
+
+    return t_min if t_min <= t_max else None
+
+
+class SweepAndPrune:
+    """An incremental sweep-and-prune broad phase.
+
+    Each box is identified by the handle returned by :py:meth:`add`, which remains
+    valid until the box is removed. Boxes include their boundary, so boxes which
+    merely touch overlap.
+
+    Changes made by :py:meth:`add`, :py:meth:`move` and :py:meth:`remove` take
+    effect at the next :py:meth:`step`, which returns the pairs of handles which
+    started and stopped overlapping since the previous step. Pairs are tuples of
+    handles, with the smallest handle first.
+
+    The endpoints of the boxes along the X axis are kept sorted, with an insertion
+    sort: its cost is proportional to the number of boxes, plus the number of
+    endpoints which changed order since the previous step. The pairs of boxes which
+    overlap along the X axis are tracked as endpoints are swapped, and their
+    overlap along the Y axis is checked at each step.
+    """
+    __slots__ = (
+        '_boxes', '_values', '_codes', '_added', '_removed', '_x_pairs', '_pairs',
+        '_counter',
+    )
+
+    #: Above this many boxes added in a step, the endpoints are sorted from scratch.
+    REBUILD_THRESHOLD = 16
+
+    def __init__(self) -> None:
+        self._boxes: typing.Dict[int, Box] = {}
+        # The X coordinates of the endpoints, in order, and their codes:
+        #  handle * 2, plus 1 for maximum endpoints.
+        self._values: typing.List[float] = []
+        self._codes: typing.List[int] = []
+        self._added: typing.List[int] = []
+        self._removed = False
+        self._x_pairs: typing.Set[Pair] = set()
+        self._pairs: typing.Set[Pair] = set()
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, handle: typing.Any) -> bool:
+        return handle in self._boxes
+
+    def __getitem__(self, handle: int) -> typing.Tuple[Vector, Vector]:
+        """Get the minimum and maximum corners of a box."""
+        min_x, min_y, max_x, max_y = self._boxes[handle]
+        return Vector(min_x, min_y), Vector(max_x, max_y)
+
+    @property
+    def pairs(self) -> typing.FrozenSet[Pair]:
+        """The pairs of boxes which overlapped at the last step."""
+        return frozenset(self._pairs)
+
+    def add(self, min_corner: VectorLike, max_corner: VectorLike) -> int:
+        """Add a box, and return its handle."""
+        box = _box(min_corner, max_corner)
+        handle = next(self._counter)
+        self._boxes[handle] = box
+        self._added.append(handle)
+        return handle
+
+    def move(self, handle: int, min_corner: VectorLike, max_corner: VectorLike) -> None:
+        """Change the corners of a box."""
+        if handle not in self._boxes:
+            raise KeyError(handle)
+
+        self._boxes[handle] = _box(min_corner, max_corner)
+
+    def move_many(self, handles: typing.Iterable[int],
+                  min_corners: typing.Any, max_corners: typing.Any) -> None:
+        """Change the corners of many boxes at once.
+
+        :param min_corners: a :py:class:`~ppb_vector.packed.VectorArray`, or an
+          iterable of vector-likes, with one corner per handle.
+        :param max_corners: likewise.
+        """
+        handles = list(handles)
+        _, [(min_xs, min_ys), (max_xs, max_ys)] = _broadcast(
+            min_corners, max_corners, n=len(handles),
+        )
+
+        boxes = self._boxes
+        for handle in handles:
+            if handle not in boxes:
+                raise KeyError(handle)
+
+        new_boxes = [_box(min_corner, max_corner) for min_corner, max_corner in zip(
+            zip(min_xs, min_ys), zip(max_xs, max_ys),
+        )]
+        boxes.update(zip(handles, new_boxes))
+
+    def remove(self, handle: int) -> None:
+        """Remove a box.
+
+        If it overlapped other boxes, those pairs are reported as ended at the next step.
+        """
+        del self._boxes[handle]
+        if handle in self._added:
+            self._added.remove(handle)
+        else:
+            self._removed = True
+
+    def _x_overlap(self, a: int, b: int) -> bool:
+        box_a, box_b = self._boxes[a], self._boxes[b]
+        return box_a[0] <= box_b[2] and box_b[0] <= box_a[2]
+
+    def _rebuild(self) -> None:
+        """Sort all endpoints from scratch, and sweep them to find overlaps along X."""
+        endpoints = []
+        for handle, (min_x, _, max_x, _) in self._boxes.items():
+            endpoints.append((min_x, 0, handle))
+            endpoints.append((max_x, 1, handle))
+        endpoints.sort()
+
+        x_pairs: typing.Set[Pair] = set()
+        active: typing.Set[int] = set()
+        for _, is_max, handle in endpoints:
+            if is_max:
+                active.discard(handle)
+                continue
+
+            x_pairs.update((other, handle) if other < handle else (handle, other)
+                           for other in active)
+            active.add(handle)
+
+        self._values = [value for value, _, _ in endpoints]
+        self._codes = [handle << 1 | is_max for _, is_max, handle in endpoints]
+        self._x_pairs = x_pairs
+
+    def _sort(self) -> None:
+        """Insertion sort the endpoints, updating the overlaps along X as they swap."""
+        values, codes, x_pairs = self._values, self._codes, self._x_pairs
+        for i in range(1, len(values)):
+            value, code = values[i], codes[i]
+            j = i
+            while j > 0:
+                previous_value, previous_code = values[j - 1], codes[j - 1]
+                if previous_value < value or (
+                    previous_value == value and previous_code & 1 <= code & 1
+                ):
+                    break
+
+                if (code ^ previous_code) & 1:
+                    # A minimum and a maximum endpoint swap
+                    a, b = code >> 1, previous_code >> 1
+                    pair = (a, b) if a < b else (b, a)
+                    if code & 1:
+                        x_pairs.discard(pair)
+                    elif self._x_overlap(a, b):
+                        x_pairs.add(pair)
+
+                values[j], codes[j] = previous_value, previous_code
+                j -= 1
+
+            values[j], codes[j] = value, code
+
+    def step(self) -> typing.Tuple[typing.Set[Pair], typing.Set[Pair]]:
+        """Update the overlapping pairs after boxes were added, moved or removed.
+
+        Return the set of pairs which started overlapping since the last step,
+        and the set of pairs which stopped overlapping, including pairs with a
+        removed box.
+        """
+        boxes = self._boxes
+        if self._removed:
+            kept = [code >> 1 in boxes for code in self._codes]
+            self._codes = list(itertools.compress(self._codes, kept))
+            self._x_pairs = {(a, b) for a, b in self._x_pairs if a in boxes and b in boxes}
+            self._removed = False
+
+        if len(self._added) > self.REBUILD_THRESHOLD:
+            self._rebuild()
+        else:
+            for handle in self._added:
+                # New endpoints start at the end, as if the box were further right
+                #  than all others, and are sorted like endpoints of moved boxes.
+                self._codes += (handle << 1, handle << 1 | 1)
+
+            self._values = [boxes[code >> 1][(code & 1) << 1] for code in self._codes]
+            self._sort()
+
+        self._added.clear()
+
+        pairs = {
+            (a, b) for a, b in self._x_pairs
+            if boxes[a][1] <= boxes[b][3] and boxes[b][1] <= boxes[a][3]
+        }
+        began, ended = pairs - self._pairs, self._pairs - pairs
+        self._pairs = pairs
+        return began, ended
+
+
+class AABBTree:
+    """A dynamic bounding volume hierarchy of boxes.
+
+    :param margin: how much the boxes stored in the tree are enlarged, in each
+      direction, relative to the boxes given.
+
+    Each box is identified by the handle returned by :py:meth:`add`, which remains
+    valid until the box is removed. Boxes include their boundary.
+
+    The tree stores enlarged ("fat") boxes, so that a box moving by less than
+    ``margin`` stays within its fat box, and :py:meth:`move` does not need to
+    update the tree. Queries test the exact boxes given, though.
+
+    Boxes are inserted next to the boxes that increase the perimeters of the tree's
+    nodes the least, and the tree is rebalanced with rotations as boxes are
+    inserted and removed, so that its height stays logarithmic in the number of boxes.
+    """
+    margin: float
+
+    __slots__ = (
+        'margin', '_boxes', '_parents', '_children', '_heights', '_handles', '_free',
+        '_root', '_leaves', '_tight', '_counter',
+    )
+
+    def __init__(self, margin: typing.SupportsFloat = 0.1) -> None:
+        self.margin = float(margin)
+        if not self.margin >= 0:
+            raise ValueError("AABBTree takes a non-negative margin.")
+
+        # Nodes are stored in parallel lists: their (fat) boxes, their parents,
+        #  their two children (None for leaves), their heights (0 for leaves, -1 for
+        #  free nodes), and for leaves, the handle of their box.
+        self._boxes: typing.List[Box] = []
+        self._parents: typing.List[int] = []
+        self._children: typing.List[typing.Optional[typing.Tuple[int, int]]] = []
+        self._heights: typing.List[int] = []
+        self._handles: typing.List[typing.Optional[int]] = []
+        self._free: typing.List[int] = []
+        self._root = -1
+
+        self._leaves: typing.Dict[int, int] = {}
+        self._tight: typing.Dict[int, Box] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __contains__(self, handle: typing.Any) -> bool:
+        return handle in self._leaves
+
+    def __getitem__(self, handle: int) -> typing.Tuple[Vector, Vector]:
+        """Get the minimum and maximum corners of a box."""
+        min_x, min_y, max_x, max_y = self._tight[handle]
+        return Vector(min_x, min_y), Vector(max_x, max_y)
+
+    @property
+    def height(self) -> int:
+        """The height of the tree: 0 for a single box, and -1 for an empty tree."""
+        return -1 if self._root < 0 else self._heights[self._root]
+
+    def add(self, min_corner: VectorLike, max_corner: VectorLike) -> int:
+        """Add a box, and return its handle."""
+        box = _box(min_corner, max_corner)
+        handle = next(self._counter)
+        leaf = self._allocate(_enlarge(box, self.margin), None, handle)
+        self._leaves[handle] = leaf
+        self._tight[handle] = box
+        self._insert(leaf)
+        return handle
+
+    def remove(self, handle: int) -> None:
+        """Remove a box."""
+        leaf = self._leaves.pop(handle)
+        del self._tight[handle]
+        self._extract(leaf)
+        self._heights[leaf] = -1
+        self._handles[leaf] = None
+        self._free.append(leaf)
+
+    def move(self, handle: int, min_corner: VectorLike, max_corner: VectorLike) -> bool:
+        """Change the corners of a box.
+
+        Return whether the tree was updated: this is only needed when the box
+        leaves its fat box, or, with a positive margin, is much smaller than it.
+        """
+        box = _box(min_corner, max_corner)
+        leaf = self._leaves[handle]
+        self._tight[handle] = box
+
+        fat = self._boxes[leaf]
+        if _contains(fat, box):
+            # Without a margin, the fat box always contains the enlarged box
+            margin = self.margin
+            if not margin or not _contains(fat, _enlarge(box, 4 * margin)):
+                return False
+
+        self._extract(leaf)
+        self._boxes[leaf] = _enlarge(box, self.margin)
+        self._insert(leaf)
+        return True
+
+    def _allocate(self, box: Box, children: typing.Optional[typing.Tuple[int, int]],
+                  handle: typing.Optional[int] = None) -> int:
+        height = 0 if children is None else 1 + max(self._heights[c] for c in children)
+        if self._free:
+            node = self._free.pop()
+            self._boxes[node], self._parents[node], self._children[node] = box, -1, children
+            self._heights[node], self._handles[node] = height, handle
+        else:
+            node = len(self._boxes)
+            self._boxes.append(box)
+            self._parents.append(-1)
+            self._children.append(children)
+            self._heights.append(height)
+            self._handles.append(handle)
+
+        return node
+
+    def _replace_child(self, parent: int, old: int, new: int) -> None:
+        """Replace a child of a node, or the root if ``parent`` is -1."""
+        self._parents[new] = parent
+        if parent < 0:
+            self._root = new
+            return
+
+        first, second = self._children[parent]  # type: ignore
+        self._children[parent] = (new, second) if first == old else (first, new)
+
+    def _refit(self, node: int) -> None:
+        """Rebalance and update the ancestors of a node, from the node to the root."""
+        boxes, heights, children = self._boxes, self._heights, self._children
+        while node >= 0:
+            node = self._balance(node)
+            first, second = children[node]  # type: ignore
+            boxes[node] = _union(boxes[first], boxes[second])
+            heights[node] = 1 + max(heights[first], heights[second])
+            node = self._parents[node]
+
+    def _insert(self, leaf: int) -> None:
+        if self._root < 0:
+            self._root = leaf
+            self._parents[leaf] = -1
+            return
+
+        # Descend towards the sibling which minimizes the perimeters of the nodes,
+        #  both created (the sibling's new parent) and enlarged (its ancestors).
+        boxes, children = self._boxes, self._children
+        box = boxes[leaf]
+        node = self._root
+        while children[node] is not None:
+            perimeter = _perimeter(boxes[node])
+            combined = _perimeter(_union(boxes[node], box))
+            cost = 2 * combined
+            inheritance = 2 * (combined - perimeter)
+
+            child_costs = []
+            for child in children[node]:  # type: ignore
+                cost_child = _perimeter(_union(box, boxes[child])) + inheritance
+                if children[child] is not None:
+                    cost_child -= _perimeter(boxes[child])
+                child_costs.append(cost_child)
+
+            if cost < min(child_costs):
+                break
+
+            node = children[node][child_costs[1] < child_costs[0]]  # type: ignore
+
+        sibling = node
+        parent = self._allocate(_union(boxes[sibling], box), (sibling, leaf))
+        self._replace_child(self._parents[sibling], sibling, parent)
+        self._parents[sibling] = self._parents[leaf] = parent
+        self._refit(self._parents[parent])
+
+    def _extract(self, leaf: int) -> None:
+        """Remove a leaf from the tree, without freeing it."""
+        if leaf == self._root:
+            self._root = -1
+            return
+
+        parent = self._parents[leaf]
+        first, second = self._children[parent]  # type: ignore
+        sibling = second if first == leaf else first
+        grandparent = self._parents[parent]
+
+        self._replace_child(grandparent, parent, sibling)
+        self._children[parent] = None
+        self._heights[parent] = -1
+        self._free.append(parent)
+        self._refit(grandparent)
+
+    def _rotate(self, node: int, child: int, other: int, child_is_second: bool) -> int:
+        """Rotate a child up, in place of its parent ``node``.
+
+        ``other`` is the node's other child. The child's taller grandchild stays under
+        it, and its other grandchild moves under ``node``.
+        """
+        boxes, heights, children = self._boxes, self._heights, self._children
+        first, second = children[child]  # type: ignore
+        tall, short = (first, second) if heights[first] > heights[second] else (second, first)
+
+        self._replace_child(self._parents[node], node, child)
+        children[child] = (node, tall)
+        self._parents[node] = child
+        children[node] = (other, short) if child_is_second else (short, other)
+        self._parents[short] = node
+
+        boxes[node] = _union(boxes[other], boxes[short])
+        heights[node] = 1 + max(heights[other], heights[short])
+        boxes[child] = _union(boxes[node], boxes[tall])
+        heights[child] = 1 + max(heights[node], heights[tall])
+        return child
+
+    def _balance(self, node: int) -> int:
+        """Rotate a node's taller child up if the node is unbalanced, and return
+        the node which took its place."""
+        if self._heights[node] < 2:
+            return node
+
+        first, second = self._children[node]  # type: ignore
+        balance = self._heights[second] - self._heights[first]
+        if balance > 1:
+            return self._rotate(node, second, first, True)
+        if balance < -1:
+            return self._rotate(node, first, second, False)
+        return node
+
+    def _query(self, test: typing.Callable[[Box], bool]) -> typing.List[int]:
+        """Find the boxes for which a test holds, assuming it holds for boxes
+        containing them."""
+        if self._root < 0:
+            return []
+
+        boxes, children, handles, tight = self._boxes, self._children, self._handles, self._tight
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if not test(boxes[node]):
+                continue
+
+            node_children = children[node]
+            if node_children is None:
+                handle = handles[node]
+                if test(tight[handle]):  # type: ignore
+                    found.append(handle)
+            else:
+                stack.extend(node_children)
+
+        return found  # type: ignore
+
+    def query_point(self, point: VectorLike) -> typing.List[int]:
+        """Find the boxes which contain a point, in no particular order."""
+        x, y = Vector._unpack(point)
+        return self._query(lambda box: box[0] <= x <= box[2] and box[1] <= y <= box[3])
+
+    def query_box(self, min_corner: VectorLike, max_corner: VectorLike) -> typing.List[int]:
+        """Find the boxes which overlap a box, in no particular order."""
+        query = _box(min_corner, max_corner)
+        return self._query(lambda box: _overlap(box, query))
+
+    def query_radius(self, center: VectorLike,
+                     radius: typing.SupportsFloat) -> typing.List[int]:
+        """Find the boxes which are within some distance of a point, in no particular order.
+
+        >>> tree = AABBTree()
+        >>> _ = tree.add((0, 0), (1, 1)), tree.add((3, 0), (4, 1))
+        >>> tree.query_radius((1.5, 2), 1.2)
+        [0]
+        """
+        x, y = Vector._unpack(center)
+        radius = float(radius)
+        return self._query(lambda box: _distance(box, x, y) <= radius)
+
+    def query_ray(self, origin: VectorLike, direction: VectorLike,
+                  max_distance: typing.SupportsFloat = inf,
+                  ) -> typing.List[typing.Tuple[float, int]]:
+        """Find the boxes hit by a ray, sorted by distance.
+
+        Return a list of ``(distance, handle)`` pairs, where ``distance`` is the
+        distance from the origin to where the ray enters the box, in the units of
+        the coordinates: ``direction`` does not need to be normalized. Boxes
+        containing the origin are at distance 0, and boxes further than
+        ``max_distance`` are not reported.
+
+        A null direction raises :py:exc:`ZeroDivisionError`.
+        """
+        return list(self.iter_ray(origin, direction, max_distance))
+
+    def iter_ray(self, origin: VectorLike, direction: VectorLike,
+                 max_distance: typing.SupportsFloat = inf,
+                 ) -> typing.Iterator[typing.Tuple[float, int]]:
+        """Lazily find the boxes hit by a ray, by increasing distance.
+
+        This is like :py:meth:`query_ray`, but the tree is explored as hits are
+        consumed, nearest first; stopping early, such as after the first hit
+        which matters, skips exploring the rest of the tree.
+        """
+        x, y = Vector._unpack(origin)
+        dx, dy = Vector._unpack(direction)
+        dx, dy = _direction(dx, dy, hypot(dx, dy))
+        # Treat tiny coordinates as zero, as their inverses would overflow
+        inverse_dx = 1 / dx if abs(dx) > 1e-300 else inf
+        inverse_dy = 1 / dy if abs(dy) > 1e-300 else inf
+        max_distance = float(max_distance)
+
+        if self._root < 0:
+            return
+
+        def entry(box: Box) -> typing.Optional[float]:
+            return _ray_entry(box, x, y, inverse_dx, inverse_dy, max_distance)
+
+        boxes, children, handles, tight = self._boxes, self._children, self._handles, self._tight
+
+        # A best-first search: nodes are explored by increasing entry distance, a
+        #  lower bound on that of their boxes. Nodes sort before hits at the same
+        #  distance, so that hits are found in order of (distance, handle).
+        heap: typing.List[typing.Tuple[float, bool, int]] = []
+        distance = entry(boxes[self._root])
+        if distance is not None:
+            heap.append((distance, False, self._root))
+
+        while heap:
+            distance, is_hit, item = heappop(heap)
+            if is_hit:
+                yield distance, item
+                continue
+
+            node_children = children[item]
+            if node_children is None:
+                # A leaf: test its exact box
+                handle: int = handles[item]  # type: ignore
+                distance = entry(tight[handle])
+                if distance is not None:
+                    heappush(heap, (distance, True, handle))
+                continue
+
+            for child in node_children:
+                distance = entry(boxes[child])
+                if distance is not None:
+                    heappush(heap, (distance, False, child))
@@ -0,0 +1,253 @@
+"""Bulk encoding and decoding of vectors.
+
+Sequences of vectors are encoded as packed arrays of floats, in one of two
+layouts:
+
+- ``'interleaved'``: ``x0, y0, x1, y1, ...``
+- ``'planar'``: ``x0, x1, ..., y0, y1, ...``
+
+Coordinates are stored as 32-bit (typecode ``'f'``) or 64-bit (``'d'``)
+IEEE 754 floats, in either byte order.
+
+>>> from ppb_vector import Vector
+>>> data = encode_many([Vector(1, 2), Vector(3, 4)], typecode='f')
+>>> len(data)
+16
+>>> decode_many(data, typecode='f')
+[Vector(1.0, 2.0), Vector(3.0, 4.0)]
+
+Sequences of vectors can also be encoded as JSON, in the same layouts:
+``[[x0, y0], [x1, y1], ...]`` or ``{"x": [x0, x1, ...], "y": [y0, y1, ...]}``.
+
+>>> encode_json([Vector(1, 2), Vector(3, 4)], layout='planar')
+'{"x":[1.0,3.0],"y":[2.0,4.0]}'
+"""
+import json
+import sys
+import typing
+from array import array
+
+from ppb_vector import _vector_struct, Vector, VectorLike
+from ppb_vector.packed import _check_typecode, _floats, VectorArray
+
+__all__ = ('encode_many', 'decode_many', 'decode_array',
+           'encode_json', 'decode_json', 'decode_json_array')
+
+LAYOUTS = ('interleaved', 'planar')
+
+
+def _check_format(typecode: str, byteorder: str, layout: str) -> None:
+    _vector_struct(typecode, byteorder)  # Raises ValueError on bad formats
+    if layout not in LAYOUTS:
+        raise ValueError(f"Expected layout 'interleaved' or 'planar', got {layout!r}")
+
+
+Columns = typing.Tuple[typing.Sequence[float], typing.Sequence[float]]
+
+
+def _columns(vectors: typing.Iterable[VectorLike]) -> Columns:
+    if isinstance(vectors, VectorArray):
+        return vectors.x, vectors.y
+
+    vs = [Vector(v) for v in vectors]
+    return [v.x for v in vs], [v.y for v in vs]
+
+
+def encode_many(vectors: typing.Iterable[VectorLike], typecode: str = 'd',
+                byteorder: str = 'little', layout: str = 'interleaved') -> bytes:
+    """Pack a sequence of vector-likes into bytes.
+
+    :param typecode: ``'d'`` for 64-bit floats, or ``'f'`` for 32-bit floats.
+    :param byteorder: ``'little'`` or ``'big'``.
+    :param layout: ``'interleaved'`` or ``'planar'``.
+
+    Encoding a :py:class:`~ppb_vector.packed.VectorArray` reads its
+    coordinates directly, without converting them to :py:class:`Vector`.
+
+    This is equivalent to, but much faster than, concatenating the results of
+    :py:meth:`Vector.to_bytes` when ``layout`` is ``'interleaved'``:
+
+    >>> from ppb_vector import Vector
+    >>> vs = [Vector(1, 2), Vector(3, 4)]
+    >>> assert encode_many(vs) == b''.join(v.to_bytes() for v in vs)
+    """
+    _check_format(typecode, byteorder, layout)
+    xs, ys = _columns(vectors)
+
+    if layout == 'interleaved':
+        data = _floats(typecode, [0.0]) * (2 * len(xs))
+        data[0::2] = _floats(typecode, xs)
+        data[1::2] = _floats(typecode, ys)
+    else:
+        data = _floats(typecode, xs)
+        data.extend(ys)
+
+    if byteorder != sys.byteorder:
+        data.byteswap()
+
+    return data.tobytes()
+
+
+def _load(buffer, typecode: str, byteorder: str) -> typing.Sequence[float]:
+    """Interpret a buffer as a sequence of floats, without copying if possible."""
+    raw = memoryview(buffer).cast('B')
+    itemsize = array(typecode).itemsize
+    if len(raw) % (2 * itemsize):
+        raise ValueError(f"Expected a buffer size multiple of {2 * itemsize} bytes, "
+                         f"got {len(raw)}")
+
+    if byteorder == sys.byteorder:
+        return raw.cast(typecode)  # type: ignore
+
+    data = array(typecode)
+    data.frombytes(raw)
+    data.byteswap()
+    return data
+
+
+def decode_many(buffer, typecode: str = 'd', byteorder: str = 'little',
+                layout: str = 'interleaved') -> typing.List[Vector]:
+    """Unpack a list of vectors from bytes produced by :py:func:`encode_many`.
+
+    :param buffer: any object supporting the buffer protocol, such as
+      :py:class:`bytes`, :py:class:`bytearray` or :py:class:`memoryview`.
+
+    The buffer is read in place when its byte order is the platform's native one,
+    and coordinates are never boxed into intermediate tuples.
+    """
+    _check_format(typecode, byteorder, layout)
+    data = _load(buffer, typecode, byteorder)
+
+    n = len(data) // 2
+    if layout == 'interleaved':
+        xs, ys = data[0::2], data[1::2]
+    else:
+        xs, ys = data[:n], data[n:]
+
+    return list(map(Vector, xs, ys))
+
+
+def decode_array(buffer, typecode: str = 'd', byteorder: str = 'little',
+                 layout: str = 'interleaved',
+                 storage: typing.Optional[str] = None) -> VectorArray:
+    """Unpack a :py:class:`~ppb_vector.packed.VectorArray` from bytes.
+
+    This is like :py:func:`decode_many`, but avoids creating a :py:class:`Vector`
+    per element.
+
+    :param storage: the typecode of the resulting array; by default, that of
+      the encoded data.
+
+    >>> decode_array(encode_many([(1, 2), (3, 4)], typecode='f'), typecode='f')
+    VectorArray([Vector(1.0, 2.0), Vector(3.0, 4.0)], typecode='f')
+    """
+    _check_format(typecode, byteorder, layout)
+    storage = typecode if storage is None else storage
+    data = _load(buffer, typecode, byteorder)
+
+    n = len(data) // 2
+    if layout == 'interleaved':
+        xs, ys = data[0::2], data[1::2]
+    else:
+        xs, ys = data[:n], data[n:]
+
+    return VectorArray.from_xy(xs, ys, storage)
+
+
+def encode_json(vectors: typing.Iterable[VectorLike], layout: str = 'interleaved') -> str:
+    """Encode a sequence of vector-likes as compact JSON.
+
+    :param layout: ``'interleaved'``, for a list of ``[x, y]`` pairs, or ``'planar'``,
+      for an object with lists of ``"x"`` and ``"y"`` coordinates.
+
+    >>> encode_json([(1, 2), (3, 4)])
+    '[[1.0,2.0],[3.0,4.0]]'
+
+    This is much faster than encoding the result of :py:meth:`Vector.asdict` for
+    each vector, as coordinates are passed to :py:mod:`json` in bulk, and
+    :py:class:`~ppb_vector.packed.VectorArray` coordinates are read directly.
+
+    JSON has no representation of infinite or NaN coordinates, which raise
+    :py:exc:`ValueError`:
+
+    >>> encode_json([(1, float('inf'))])
+    Traceback (most recent call last):
+      ...
+    ValueError: Out of range float values are not JSON compliant
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Expected layout 'interleaved' or 'planar', got {layout!r}")
+
+    xs, ys = _columns(vectors)
+    if not isinstance(xs, list):
+        # Packed coordinates, from a VectorArray
+        xs, ys = xs.tolist(), ys.tolist()  # type: ignore
+
+    data: typing.Any = list(zip(xs, ys)) if layout == 'interleaved' else {'x': xs, 'y': ys}
+    return json.dumps(data, separators=(',', ':'), allow_nan=False)
+
+
+def _json_columns(data: typing.Any) -> typing.Tuple[typing.Any, typing.Any]:
+    """Get the coordinate columns of a vector sequence encoded as JSON, in either layout."""
+    if isinstance(data, (str, bytes, bytearray)):
+        data = json.loads(data)
+
+    if isinstance(data, dict):
+        if data.keys() != {'x', 'y'}:
+            raise ValueError(f"Expected an object with keys 'x' and 'y', got {sorted(data)}")
+
+        xs, ys = data['x'], data['y']
+        if not isinstance(xs, list) or not isinstance(ys, list) or len(xs) != len(ys):
+            raise ValueError("Expected lists of x and y coordinates of the same length")
+
+        return xs, ys
+
+    if isinstance(data, list):
+        if not all(isinstance(pair, list) and len(pair) == 2 for pair in data):
+            raise ValueError("Expected a list of [x, y] pairs")
+
+        return [x for x, _ in data], [y for _, y in data]
+
+    raise ValueError(f"Expected a JSON array or object, got {type(data).__name__}")
+
+
+def _json_floats(typecode: str, values: typing.List[typing.Any]) -> array:
+    if not all(type(value) in (int, float) for value in values):
+        raise ValueError("Expected numeric coordinates")
+
+    return _floats(typecode, values)
+
+
+def decode_json(data: typing.Any) -> typing.List[Vector]:
+    """Decode a list of vectors from JSON produced by :py:func:`encode_json`.
+
+    :param data: a JSON document, as :py:class:`str` or :py:class:`bytes`, in either
+      layout. It can also be a value which was already parsed, such as part of a
+      larger document.
+
+    >>> decode_json('{"x": [1, 3], "y": [2, 4]}')
+    [Vector(1.0, 2.0), Vector(3.0, 4.0)]
+    """
+    xs, ys = _json_columns(data)
+    return list(map(Vector, _json_floats('d', xs), _json_floats('d', ys)))
+
+
+def decode_json_array(data: typing.Any, typecode: str = 'd') -> VectorArray:
+    """Decode a :py:class:`~ppb_vector.packed.VectorArray` from JSON.
+
+    This is like :py:func:`decode_json`, but avoids creating a :py:class:`Vector`
+    per element.
+
+    >>> decode_json_array('[[1, 2], [3, 4]]', typecode='f')
+    VectorArray([Vector(1.0, 2.0), Vector(3.0, 4.0)], typecode='f')
+
+    As when building a :py:class:`~ppb_vector.packed.VectorArray`, coordinates
+    are rounded to the precision of ``typecode``; those out of the range of
+    single-precision floats become infinite:
+
+    >>> decode_json_array('[[1e300, -1e300]]', typecode='f')
+    VectorArray([Vector(inf, -inf)], typecode='f')
+    """
+    _check_typecode(typecode)
+    xs, ys = _json_columns(data)
+    return VectorArray._wrap(_json_floats(typecode, xs), _json_floats(typecode, ys))
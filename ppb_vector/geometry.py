@@ -0,0 +1,496 @@
+"""Batch geometry kernels over packed arrays of vectors.
+
+The functions in this module take :py:class:`~ppb_vector.packed.VectorArray`
+arguments, or any iterable of vector-likes, and process all of their elements
+in a single pass, without creating a :py:class:`Vector` per element.
+"""
+import typing
+from array import array
+from itertools import repeat
+from math import frexp, fsum, hypot, isfinite, ldexp
+from operator import add, mul, sub
+
+from ppb_vector import Vector, VectorLike
+from ppb_vector.packed import _broadcast, _floats, VectorArray
+
+__all__ = (
+    'segment_intersections', 'points_in_polygon', 'pairwise_distances',
+    'pairwise_distance_blocks', 'pairs_within',
+    'polygon_area', 'polygon_centroid', 'convex_hull',
+)
+
+NAN = float('nan')
+
+TILE_SIZE = 256
+
+# Bounds on the magnitude of cross products of coordinate differences, outside of
+#  which they may have overflowed or underflowed.
+_SAFE_MIN, _SAFE_MAX = 2.0 ** -900, 2.0 ** 900
+
+
+def _rescale(*values: float) -> typing.Tuple[int, typing.List[float]]:
+    """Scale values by a power of 2, exactly, so that the largest magnitude is in [0.5, 1).
+
+    Return the exponent of the scale and the scaled values. Values which are all
+    null, or not all finite, are left unchanged.
+    """
+    magnitude = max(map(abs, values))
+    if not magnitude or not isfinite(magnitude):
+        return 0, list(values)
+
+    exponent = -frexp(magnitude)[1]
+    return exponent, [ldexp(value, exponent) for value in values]
+
+
+def _collinear_intersection(rx: float, ry: float, sx: float, sy: float,
+                            dx: float, dy: float) -> typing.Optional[int]:
+    """Intersect parallel segments, from p along r and from q = p + d along s.
+
+    Return which point their intersection closest to p is: 0 for p, 1 for q and
+    2 for q + s; or None if they do not intersect. Zero-length segments are
+    treated as points.
+    """
+    if dx * ry - dy * rx != 0 or dx * sy - dy * sx != 0:
+        # The segments lie on distinct lines
+        return None
+
+    rr, ss = rx * rx + ry * ry, sx * sx + sy * sy
+    if not rr:
+        if not ss:
+            return None if dx or dy else 0
+
+        # The first segment is a point, on the line of the second one
+        u = -(dx * sx + dy * sy) / ss
+        return 0 if 0 <= u <= 1 else None
+
+    # Project the second segment onto the first one, and intersect the ranges
+    t0 = (dx * rx + dy * ry) / rr
+    t1 = t0 + (sx * rx + sy * ry) / rr
+    if max(t0, t1) < 0 or min(t0, t1) > 1:
+        return None
+    if min(t0, t1) <= 0:
+        return 0
+    return 1 if t0 <= t1 else 2
+
+
+def segment_intersections(
+    a_starts: typing.Any, a_ends: typing.Any, b_starts: typing.Any, b_ends: typing.Any,
+) -> typing.Tuple[typing.List[bool], VectorArray]:
+    """Intersect pairs of segments.
+
+    The ``i``-th segment of ``a``, from ``a_starts[i]`` to ``a_ends[i]``, is
+    intersected with the ``i``-th segment of ``b``. Any argument may also be
+    a single vector-like, which is then used for all pairs.
+
+    Return a mask, which is true for the pairs which intersect, and an array
+    of the intersection points. Points are NaN for pairs that do not intersect.
+
+    >>> mask, points = segment_intersections([(0, 0), (0, 0)], [(2, 2), (1, 0)],
+    ...                                      (0, 2), (2, 0))
+    >>> mask
+    [True, False]
+    >>> points[0]
+    Vector(1.0, 1.0)
+
+    Segments include their endpoints, so segments that merely touch intersect.
+    Collinear segments which overlap intersect at the point of their overlap
+    closest to the start of the segment of ``a``, as that is where a line of
+    sight along it is blocked; zero-length segments are points, which intersect
+    the segments they lie on:
+
+    >>> mask, points = segment_intersections([(0, 0), (1, 1)], [(4, 0), (1, 1)],
+    ...                                      [(3, 0), (0, 0)], [(2, 0), (2, 2)])
+    >>> points
+    VectorArray([Vector(2.0, 0.0), Vector(1.0, 1.0)])
+
+    Collinearity is tested exactly, so segments whose endpoints are rounded
+    off their common line are only reported to intersect where they cross.
+    """
+    n, [(asx, asy), (aex, aey), (bsx, bsy), (bex, bey)] = _broadcast(
+        a_starts, a_ends, b_starts, b_ends,
+    )
+
+    mask = [False] * n
+    xs = [NAN] * n
+    ys = [NAN] * n
+    segments = zip(asx, asy, aex, aey, bsx, bsy, bex, bey)
+    for i, (px, py, pex, pey, qx, qy, qex, qey) in enumerate(segments):
+        rx, ry = pex - px, pey - py
+        sx, sy = qex - qx, qey - qy
+        dx, dy = qx - px, qy - py
+
+        denom = rx * sy - ry * sx
+        if not _SAFE_MIN < abs(denom) < _SAFE_MAX:
+            # The products may have overflowed or underflowed: scaling by a
+            #  power of 2 leaves the parameters unchanged.
+            _, (rx, ry, sx, sy, dx, dy) = _rescale(rx, ry, sx, sy, dx, dy)
+            denom = rx * sy - ry * sx
+
+        if denom == 0:
+            point = _collinear_intersection(rx, ry, sx, sy, dx, dy)
+            if point is not None:
+                mask[i] = True
+                xs[i], ys[i] = ((px, py), (qx, qy), (qex, qey))[point]
+            continue
+
+        t = (dx * sy - dy * sx) / denom
+        u = (dx * ry - dy * rx) / denom
+        if 0 <= t <= 1 and 0 <= u <= 1:
+            mask[i] = True
+            xs[i], ys[i] = px + t * (pex - px), py + t * (pey - py)
+
+    return mask, VectorArray._wrap(_floats('d', xs), _floats('d', ys))
+
+
+def points_in_polygon(points: typing.Any,
+                      polygon: typing.Iterable[VectorLike]) -> typing.List[bool]:
+    """Test whether points lie inside a polygon.
+
+    :param polygon: the vertices of a simple polygon, in order; the last
+      vertex is implicitly connected to the first one.
+
+    >>> square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    >>> points_in_polygon([(1, 1), (3, 1), (1, -1)], square)
+    [True, False, False]
+
+    This uses the even-odd crossing rule, with edges treated as half-open:
+    a point exactly on the boundary is reported consistently, such that a point
+    on an edge shared by two adjacent polygons is inside exactly one of them.
+    Polygons with less than 3 vertices contain no point.
+    """
+    _, [(xs, ys)] = _broadcast(points)
+    vertices = VectorArray(polygon)
+    inside = [False] * len(xs)
+
+    vxs, vys = vertices.x, vertices.y
+    for j in range(len(vxs)):
+        x1, y1 = vxs[j - 1], vys[j - 1]
+        x2, y2 = vxs[j], vys[j]
+        if y1 == y2:
+            # Horizontal edges never cross the ray cast from the point
+            continue
+
+        slope = (x2 - x1) / (y2 - y1)
+        inside = [
+            c ^ (((y1 > py) != (y2 > py)) and px < x1 + (py - y1) * slope)
+            for c, px, py in zip(inside, xs, ys)
+        ]
+
+    return inside
+
+
+def _columns(points: typing.Any) -> typing.Tuple[typing.Sequence[float], typing.Sequence[float]]:
+    if isinstance(points, VectorArray):
+        return points.x, points.y
+
+    vectors = VectorArray(points)
+    return vectors.x, vectors.y
+
+
+def _distances(x: float, y: float,
+               xs: typing.Sequence[float], ys: typing.Sequence[float]) -> typing.Iterator[float]:
+    """Compute the distances from a point to each of the given points."""
+    return map(hypot, map(sub, xs, repeat(x)), map(sub, ys, repeat(y)))
+
+
+def _distance_blocks(axs: typing.Sequence[float], ays: typing.Sequence[float],
+                     bxs: typing.Sequence[float], bys: typing.Sequence[float],
+                     condensed: bool, tile_size: int) -> typing.Iterator[typing.Tuple[int, array]]:
+    """Compute the blocks of rows of pairwise distances, see pairwise_distance_blocks."""
+    for start in range(0, len(axs), tile_size):
+        distances = _floats('d')
+        for i in range(start, min(start + tile_size, len(axs))):
+            first = i + 1 if condensed else 0
+            distances.extend(_distances(axs[i], ays[i], bxs[first:], bys[first:]))
+
+        yield start, distances
+
+
+def pairwise_distance_blocks(a: typing.Any, b: typing.Any = None,
+                             tile_size: int = TILE_SIZE,
+                             ) -> typing.Iterator[typing.Tuple[int, array]]:
+    """Compute the distances between all pairs of points, by blocks of rows.
+
+    Yield pairs ``(start, distances)``, where ``distances`` holds the rows of
+    :py:func:`pairwise_distances` for the points ``a[start:start + tile_size]``,
+    flattened:
+
+    >>> for start, distances in pairwise_distance_blocks([(0, 0), (3, 4), (6, 8)],
+    ...                                                  [(0, 0), (0, 4)], tile_size=2):
+    ...     print(start, distances)
+    0 array('d', [0.0, 4.0, 5.0, 3.0])
+    2 array('d', [10.0, 7.211102550927978])
+
+    If ``b`` is not given, the rows are those of the condensed form, so the row of
+    ``a[i]`` holds its distances to ``a[i + 1:]``. Each block is computed when it
+    is requested, so memory use is bounded by ``8 * tile_size * len(b)`` bytes,
+    however many rows there are.
+    """
+    axs, ays = _columns(a)
+    bxs, bys = (axs, ays) if b is None else _columns(b)
+    return _distance_blocks(axs, ays, bxs, bys, b is None, tile_size)
+
+
+def pairwise_distances(a: typing.Any, b: typing.Any = None,
+                       tile_size: int = TILE_SIZE) -> array:
+    """Compute the distances between all pairs of points.
+
+    If ``b`` is given, return the distances from each point of ``a`` to each point
+    of ``b``, as a ``len(a) * len(b)`` matrix, flattened row by row:
+
+    >>> pairwise_distances([(0, 0), (3, 4)], [(0, 0), (0, 4), (6, 8)])
+    array('d', [0.0, 4.0, 10.0, 5.0, 3.0, 5.0])
+
+    Otherwise, return the distances between distinct points of ``a``, in the
+    condensed form of the upper triangle of the matrix: the distances from ``a[0]``
+    to ``a[1:]``, then from ``a[1]`` to ``a[2:]``, and so on.
+
+    >>> pairwise_distances([(0, 0), (3, 4), (6, 8)])
+    array('d', [5.0, 10.0, 5.0])
+
+    Distances are computed as ``(a[i] - b[j]).length``, by blocks of ``tile_size``
+    rows, into a preallocated packed array: memory use is 8 bytes per distance,
+    that is quadratic in the number of points. When the results would not fit in
+    memory, iterate over :py:func:`pairwise_distance_blocks` instead, which only
+    holds one block of rows at a time, or use :py:func:`pairs_within` to only get
+    the distances that are below a given radius.
+    """
+    axs, ays = _columns(a)
+    n = len(axs)
+    if b is None:
+        bxs, bys = axs, ays
+        size = n * (n - 1) // 2
+    else:
+        bxs, bys = _columns(b)
+        size = n * len(bxs)
+
+    result = _floats('d', [0.0]) * size
+    position = 0
+    for _, distances in _distance_blocks(axs, ays, bxs, bys, b is None, tile_size):
+        result[position:position + len(distances)] = distances
+        position += len(distances)
+
+    return result
+
+
+def _spread(n: int) -> int:
+    """Interleave the bits of an 8-bit integer with zeros."""
+    spread = 0
+    for bit in range(8):
+        spread |= (n >> bit & 1) << (2 * bit)
+    return spread
+
+
+_SPREAD = [_spread(n) for n in range(256)]
+
+
+def _tiles(xs: typing.Sequence[float], ys: typing.Sequence[float],
+           tile_size: int) -> typing.List[typing.Tuple[typing.Any, ...]]:
+    """Split points into tiles of nearby points, with their bounding boxes.
+
+    Points are sorted along a Z-order curve, so that consecutive points are close to
+    each other, and split into tiles of consecutive points. Points with infinite
+    or NaN coordinates are left out.
+    """
+    indices = [i for i, (x, y) in enumerate(zip(xs, ys)) if isfinite(x) and isfinite(y)]
+    if not indices:
+        return []
+
+    # Quantize coordinates to 16 bits; halving them first avoids overflows
+    min_x, max_x = min(xs[i] for i in indices) / 2, max(xs[i] for i in indices) / 2
+    min_y, max_y = min(ys[i] for i in indices) / 2, max(ys[i] for i in indices) / 2
+    span_x, span_y = max_x - min_x, max_y - min_y
+
+    def quantize(value: float, low: float, span: float) -> int:
+        # Dividing by the span first keeps the ratio finite, even for tiny spans
+        return int(min((value / 2 - low) / span * 65535, 65535.0)) if span else 0
+
+    def key(i: int) -> int:
+        qx = quantize(xs[i], min_x, span_x)
+        qy = quantize(ys[i], min_y, span_y)
+        spread_x = _SPREAD[qx & 255] | _SPREAD[qx >> 8] << 16
+        spread_y = _SPREAD[qy & 255] | _SPREAD[qy >> 8] << 16
+        return spread_x | spread_y << 1
+
+    indices.sort(key=key)
+
+    tiles = []
+    for start in range(0, len(indices), tile_size):
+        tile = indices[start:start + tile_size]
+        txs, tys = [xs[i] for i in tile], [ys[i] for i in tile]
+        tiles.append((tile, txs, tys, (min(txs), min(tys), max(txs), max(tys))))
+
+    return tiles
+
+
+def _box_distance(x: float, y: float, box: typing.Tuple[float, float, float, float]) -> float:
+    """Compute the distance from a point to a bounding box."""
+    min_x, min_y, max_x, max_y = box
+    return hypot(max(min_x - x, 0.0, x - max_x), max(min_y - y, 0.0, y - max_y))
+
+
+def _boxes_distance(a: typing.Tuple[float, float, float, float],
+                    b: typing.Tuple[float, float, float, float]) -> float:
+    """Compute the distance between two bounding boxes."""
+    return hypot(max(b[0] - a[2], 0.0, a[0] - b[2]), max(b[1] - a[3], 0.0, a[1] - b[3]))
+
+
+def pairs_within(a: typing.Any, radius: typing.SupportsFloat, b: typing.Any = None,
+                 tile_size: int = 64) -> typing.Tuple[array, array, array]:
+    """Find the pairs of points which are at most ``radius`` apart.
+
+    Return three packed arrays ``i``, ``j`` and ``distances``, such that
+    ``distances[k]`` is the distance between ``a[i[k]]`` and ``b[j[k]]``, for all
+    pairs within the radius. If ``b`` is not given, return the pairs of distinct
+    points of ``a``, with ``i[k] < j[k]``.
+
+    >>> i, j, distances = pairs_within([(0, 0), (3, 4), (0, 1), (9, 9)], radius=5)
+    >>> sorted(zip(i, j, distances))
+    [(0, 1, 5.0), (0, 2, 1.0), (1, 2, 4.242640687119285)]
+
+    Pairs are reported in no particular order. Points are grouped in tiles of at
+    most ``tile_size`` nearby points (smaller tiles prune more pairs, but there are
+    more pairs of tiles to check), and pairs of tiles whose bounding boxes are
+    further apart than the radius are skipped, so this is much faster than
+    :py:func:`pairwise_distances` when few pairs are close. Memory use is
+    proportional to the number of points and pairs found.
+
+    Points with infinite or NaN coordinates are not within any radius of other points.
+    """
+    radius = float(radius)
+    a_tiles = _tiles(*_columns(a), tile_size)
+    b_tiles = a_tiles if b is None else _tiles(*_columns(b), tile_size)
+
+    result_i, result_j, result_distances = array('q'), array('q'), _floats('d')
+    for k, (a_indices, a_xs, a_ys, a_box) in enumerate(a_tiles):
+        for m in range(k if b is None else 0, len(b_tiles)):
+            b_indices, b_xs, b_ys, b_box = b_tiles[m]
+            if not _boxes_distance(a_box, b_box) <= radius:
+                continue
+
+            same = b is None and k == m
+            for p, (i, x, y) in enumerate(zip(a_indices, a_xs, a_ys)):
+                if not _box_distance(x, y, b_box) <= radius:
+                    continue
+
+                # Within a tile, only consider each pair of points once
+                start = p + 1 if same else 0
+                candidates = zip(b_indices[start:], _distances(x, y, b_xs[start:], b_ys[start:]))
+                for j, distance in candidates:
+                    if distance <= radius:
+                        if b is None and j < i:
+                            result_i.append(j)
+                            result_j.append(i)
+                        else:
+                            result_i.append(i)
+                            result_j.append(j)
+                        result_distances.append(distance)
+
+    return result_i, result_j, result_distances
+
+
+def _relative(polygon: typing.Iterable[VectorLike]) -> typing.Tuple[
+        float, float, typing.List[float], typing.List[float], typing.List[float]]:
+    """Get the vertices of a polygon relative to the first one, and the shoelace terms.
+
+    Working relative to a vertex avoids cancellation in polygons far from the
+    origin. The terms of the edges from and to the first vertex are zero, and
+    are left out.
+    """
+    xs, ys = _columns(polygon)
+    if not len(xs):
+        return 0.0, 0.0, [], [], []
+
+    x0, y0 = xs[0], ys[0]
+    dxs = [x - x0 for x in xs]
+    dys = [y - y0 for y in ys]
+    terms = list(map(sub, map(mul, dxs[:-1], dys[1:]), map(mul, dxs[1:], dys[:-1])))
+    return x0, y0, dxs, dys, terms
+
+
+def polygon_area(polygon: typing.Iterable[VectorLike]) -> float:
+    """Compute the signed area of a polygon.
+
+    :param polygon: the vertices of a simple polygon, in order; the last
+      vertex is implicitly connected to the first one.
+
+    The area is positive if the vertices go counter-clockwise, and negative
+    if they go clockwise:
+
+    >>> polygon_area([(0, 0), (2, 0), (2, 2), (0, 2)])
+    4.0
+    >>> polygon_area([(0, 0), (0, 2), (2, 2), (2, 0)])
+    -4.0
+    """
+    *_, terms = _relative(polygon)
+    return fsum(terms) / 2
+
+
+def polygon_centroid(polygon: typing.Iterable[VectorLike]) -> Vector:
+    """Compute the centroid of a polygon, its center of mass if it were uniformly dense.
+
+    The parameter is as in :py:func:`polygon_area`.
+
+    >>> polygon_centroid([(0, 0), (4, 0), (4, 2), (0, 2)])
+    Vector(2.0, 1.0)
+
+    Polygons with a null area, such as those with less than 3 vertices,
+    have no centroid, and raise :py:exc:`ZeroDivisionError`.
+    """
+    x0, y0, dxs, dys, terms = _relative(polygon)
+    twice_area = fsum(terms)
+    if not twice_area:
+        raise ZeroDivisionError("Polygons with a null area have no centroid.")
+
+    x = fsum(map(mul, map(add, dxs[:-1], dxs[1:]), terms))
+    y = fsum(map(mul, map(add, dys[:-1], dys[1:]), terms))
+    return Vector(x0 + x / (3 * twice_area), y0 + y / (3 * twice_area))
+
+
+def _half_hull(points: typing.Iterable[typing.Tuple[float, float]],
+               ) -> typing.List[typing.Tuple[float, float]]:
+    """Get the lower half of the convex hull of points sorted by increasing X then Y.
+
+    Passing the points in the reverse order gets the upper half instead.
+    """
+    hull: typing.List[typing.Tuple[float, float]] = []
+    for x, y in points:
+        while len(hull) >= 2:
+            (ax, ay), (bx, by) = hull[-2], hull[-1]
+            # Pop the last point unless it makes a counter-clockwise turn
+            if (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0:
+                break
+            hull.pop()
+
+        hull.append((x, y))
+
+    return hull
+
+
+def convex_hull(points: typing.Any) -> VectorArray:
+    """Compute the convex hull of points.
+
+    Return the vertices of the hull, counter-clockwise, starting from the point
+    with the lowest X coordinate (and the lowest Y coordinate among those):
+
+    >>> convex_hull([(1, 1), (2, 2), (0, 2), (2, 0), (0, 0), (1, 0)])
+    VectorArray([Vector(0.0, 0.0), Vector(2.0, 0.0), Vector(2.0, 2.0), Vector(0.0, 2.0)])
+
+    Points which lie on the edges of the hull, such as ``(1, 0)`` above, are
+    not included. If all points are collinear, the hull is the segment between
+    the furthest two, or a single point; points with infinite or NaN coordinates
+    are ignored.
+
+    This uses Andrew's monotone chain algorithm, which takes ``O(n log n)`` time
+    to sort the points, and linear time otherwise.
+    """
+    xs, ys = _columns(points)
+    unique = sorted({(x, y) for x, y in zip(xs, ys) if isfinite(x) and isfinite(y)})
+    if len(unique) < 3:
+        hull = unique
+    else:
+        # Each half ends with the first point of the other one
+        hull = _half_hull(unique)[:-1] + _half_hull(reversed(unique))[:-1]
+
+    return VectorArray._wrap(_floats('d', [x for x, _ in hull]),
+                             _floats('d', [y for _, y in hull]))
@@ -0,0 +1,200 @@
+"""Fixed-timestep integration of particle systems.
+
+The integrators in this module advance the positions and velocities of many
+particles, stored in :py:class:`~ppb_vector.packed.VectorArray`, in place:
+
+>>> from ppb_vector.packed import VectorArray
+>>> positions = VectorArray([(0, 0), (1, 1)])
+>>> velocities = VectorArray([(1, 0), (0, 2)])
+>>> semi_implicit_euler(positions, velocities, (0, -10), dt=0.1)
+>>> positions
+VectorArray([Vector(0.1, -0.1), Vector(1.0, 1.1)])
+>>> velocities
+VectorArray([Vector(1.0, -1.0), Vector(0.0, 1.0)])
+
+All integrators take the same arguments:
+
+- ``positions``, a :py:class:`~ppb_vector.packed.VectorArray`;
+- ``velocities``, a :py:class:`~ppb_vector.packed.VectorArray` of the same
+  length, except for :py:func:`verlet` which takes the previous positions instead;
+- ``accelerations``, either an array or iterable of the same length,
+  or a single vector-like (such as gravity) applied to all particles;
+- ``dt``, the timestep;
+- ``max_speed``, optionally, a speed which velocities are truncated to,
+  with the same semantics as :py:meth:`Vector.truncate`.
+"""
+import typing
+from itertools import repeat
+
+from ppb_vector.packed import _broadcast, _scale_columns, _store, VectorArray
+
+__all__ = ('euler', 'semi_implicit_euler', 'verlet', 'FixedTimestep')
+
+
+def _check_arrays(*arrays: typing.Any) -> None:
+    for array in arrays:
+        if not isinstance(array, VectorArray):
+            raise TypeError(f"Expected a VectorArray, got {type(array).__name__}")
+
+
+def _check_max_speed(max_speed: typing.Optional[typing.SupportsFloat]) -> typing.Optional[float]:
+    if max_speed is None:
+        return None
+
+    max_speed = float(max_speed)
+    if max_speed < 0:
+        raise ValueError("Speeds can only be truncated to non-negative lengths.")
+
+    return max_speed
+
+
+def euler(positions: VectorArray, velocities: VectorArray, accelerations: typing.Any,
+          dt: typing.SupportsFloat,
+          max_speed: typing.Optional[typing.SupportsFloat] = None) -> None:
+    """Advance particles by one step of the explicit Euler method.
+
+    Positions are advanced using the velocities from the start of the step,
+    then velocities are advanced. This is the first-order method that code
+    like ``pos = pos + vel.scale_by(dt)`` implements; it tends to gain energy,
+    so :py:func:`semi_implicit_euler` is usually preferable.
+    """
+    _check_arrays(positions, velocities)
+    dt, max_speed = float(dt), _check_max_speed(max_speed)
+    _, [(pxs, pys), (vxs, vys), (axs, ays)] = _broadcast(positions, velocities, accelerations)
+
+    _store(positions, positions.typecode,
+           [px + vx * dt for px, vx in zip(pxs, vxs)],
+           [py + vy * dt for py, vy in zip(pys, vys)])
+
+    new_vxs = [vx + ax * dt for vx, ax in zip(vxs, axs)]
+    new_vys = [vy + ay * dt for vy, ay in zip(vys, ays)]
+    if max_speed is not None:
+        new_vxs, new_vys = _scale_columns(new_vxs, new_vys, repeat(max_speed), truncate=True)
+
+    _store(velocities, velocities.typecode, new_vxs, new_vys)
+
+
+def semi_implicit_euler(positions: VectorArray, velocities: VectorArray,
+                        accelerations: typing.Any, dt: typing.SupportsFloat,
+                        max_speed: typing.Optional[typing.SupportsFloat] = None) -> None:
+    """Advance particles by one step of the semi-implicit (symplectic) Euler method.
+
+    Velocities are advanced first, and (after truncation to ``max_speed``)
+    used to advance the positions. This is as cheap as :py:func:`euler`, but
+    conserves energy much better.
+    """
+    _check_arrays(positions, velocities)
+    dt, max_speed = float(dt), _check_max_speed(max_speed)
+    _, [(pxs, pys), (vxs, vys), (axs, ays)] = _broadcast(positions, velocities, accelerations)
+
+    new_vxs = [vx + ax * dt for vx, ax in zip(vxs, axs)]
+    new_vys = [vy + ay * dt for vy, ay in zip(vys, ays)]
+    if max_speed is not None:
+        new_vxs, new_vys = _scale_columns(new_vxs, new_vys, repeat(max_speed), truncate=True)
+
+    _store(velocities, velocities.typecode, new_vxs, new_vys)
+    # Use the stored velocities, so that positions are consistent with them
+    #  even when velocities are stored in single precision.
+    _store(positions, positions.typecode,
+           [px + vx * dt for px, vx in zip(pxs, velocities.x)],
+           [py + vy * dt for py, vy in zip(pys, velocities.y)])
+
+
+def verlet(positions: VectorArray, previous: VectorArray, accelerations: typing.Any,
+           dt: typing.SupportsFloat,
+           max_speed: typing.Optional[typing.SupportsFloat] = None) -> None:
+    """Advance particles by one step of the (position) Verlet method.
+
+    Velocities are implicit in this method: ``previous`` holds the positions
+    from the previous step, and is updated to the current positions.
+    The displacement over a step is truncated to ``max_speed * dt``.
+
+    Verlet integration is second-order accurate and time-reversible, which
+    makes it well-suited to constrained systems such as cloth or ragdolls.
+    """
+    _check_arrays(positions, previous)
+    dt, max_speed = float(dt), _check_max_speed(max_speed)
+    _, [(pxs, pys), (qxs, qys), (axs, ays)] = _broadcast(positions, previous, accelerations)
+
+    dt2 = dt * dt
+    dxs = [px - qx + ax * dt2 for px, qx, ax in zip(pxs, qxs, axs)]
+    dys = [py - qy + ay * dt2 for py, qy, ay in zip(pys, qys, ays)]
+    if max_speed is not None:
+        dxs, dys = _scale_columns(dxs, dys, repeat(max_speed * dt), truncate=True)
+
+    new_xs = [px + dx for px, dx in zip(pxs, dxs)]
+    new_ys = [py + dy for py, dy in zip(pys, dys)]
+    _store(previous, previous.typecode, pxs, pys)
+    _store(positions, positions.typecode, new_xs, new_ys)
+
+
+Integrator = typing.Callable[..., None]
+
+
+class FixedTimestep:
+    """Run an integrator with a fixed timestep, regardless of the frame rate.
+
+    :param dt: the fixed timestep.
+    :param integrator: one of :py:func:`euler`, :py:func:`semi_implicit_euler`
+      or :py:func:`verlet`.
+    :param max_speed: passed to the integrator.
+    :param max_steps: the maximum number of steps taken by a single call to
+      :py:meth:`advance`; leftover time is dropped, so that the simulation
+      slows down rather than falling further and further behind.
+
+    >>> from ppb_vector.packed import VectorArray
+    >>> positions, velocities = VectorArray([(0, 0)]), VectorArray([(1, 0)])
+    >>> physics = FixedTimestep(dt=0.25)
+    >>> physics.advance(0.625, positions, velocities, (0, 0))
+    2
+    >>> positions
+    VectorArray([Vector(0.5, 0.0)])
+
+    The remaining time is carried over to the next call, and :py:attr:`alpha`
+    tells how far the simulation is between its last two steps, for
+    interpolating positions when rendering.
+
+    >>> physics.alpha
+    0.5
+    """
+    dt: float
+    integrator: Integrator
+    max_speed: typing.Optional[float]
+    max_steps: typing.Optional[int]
+    accumulator: float
+
+    __slots__ = ('dt', 'integrator', 'max_speed', 'max_steps', 'accumulator')
+
+    def __init__(self, dt: typing.SupportsFloat, integrator: Integrator = semi_implicit_euler,
+                 max_speed: typing.Optional[typing.SupportsFloat] = None,
+                 max_steps: typing.Optional[int] = None):
+        self.dt = float(dt)
+        if self.dt <= 0:
+            raise ValueError("FixedTimestep takes a positive timestep.")
+
+        self.integrator = integrator
+        self.max_speed = _check_max_speed(max_speed)
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """The fraction of a timestep elapsed since the last step."""
+        return self.accumulator / self.dt
+
+    def advance(self, elapsed: typing.SupportsFloat, positions: VectorArray,
+                velocities: VectorArray, accelerations: typing.Any) -> int:
+        """Advance the simulation by ``elapsed`` time, and return the number of steps taken."""
+        self.accumulator += float(elapsed)
+
+        steps = 0
+        while self.accumulator >= self.dt:
+            if self.max_steps is not None and steps >= self.max_steps:
+                self.accumulator = 0.0
+                break
+
+            self.integrator(positions, velocities, accelerations, self.dt, self.max_speed)
+            self.accumulator -= self.dt
+            steps += 1
+
+        return steps
@@ -0,0 +1,205 @@
+"""Interpolation between vectors, and along Bézier curves.
+
+Each interpolation function comes in two forms: one working on single
+vector-likes and returning a :py:class:`Vector`,
+
+>>> lerp((0, 0), (10, 20), 0.25)
+Vector(2.5, 5.0)
+
+and a batch form, suffixed with ``_many``, which returns a
+:py:class:`~ppb_vector.packed.VectorArray`. Any of its arguments may be
+an array, or a single value used for all elements, so the batch forms can
+sample one curve at many parameters, or many curves at once:
+
+>>> lerp_many((0, 0), (10, 20), [0, 0.5, 1])
+VectorArray([Vector(0.0, 0.0), Vector(5.0, 10.0), Vector(10.0, 20.0)])
+"""
+import typing
+from math import hypot
+
+from ppb_vector import Vector, VectorLike
+from ppb_vector.packed import (
+    _broadcast, _broadcast_scalars, _direction, _floats, angles, VectorArray,
+)
+
+__all__ = (
+    'lerp', 'slerp', 'quadratic_bezier', 'cubic_bezier',
+    'lerp_many', 'slerp_many', 'quadratic_bezier_many', 'cubic_bezier_many',
+)
+
+
+def _broadcast_curves(points: typing.Sequence[typing.Any],
+                      t: typing.Any) -> typing.Tuple[typing.List[typing.Any], typing.List[float]]:
+    """Broadcast control points and parameters together."""
+    if hasattr(t, '__float__'):
+        n, columns = _broadcast(*points)
+        _, [ts] = _broadcast_scalars(t, n=n)
+    else:
+        ts = [float(x) for x in t]
+        _, columns = _broadcast(*points, n=len(ts))
+
+    return columns, ts
+
+
+def lerp(a: VectorLike, b: VectorLike, t: typing.SupportsFloat) -> Vector:
+    """Linearly interpolate between two vectors.
+
+    Return ``a`` when ``t`` is 0, ``b`` when ``t`` is 1, and points along
+    the segment between them otherwise:
+
+    >>> lerp((0, 0), (4, 2), 0.5)
+    Vector(2.0, 1.0)
+
+    This is equivalent to ``a + (b - a) * t``, but creates no intermediate
+    :py:class:`Vector`, and is exact at both ends.
+    """
+    a_x, a_y = Vector._unpack(a)
+    b_x, b_y = Vector._unpack(b)
+    t = float(t)
+    u = 1 - t
+    return Vector(u * a_x + t * b_x, u * a_y + t * b_y)
+
+
+def slerp(a: VectorLike, b: VectorLike, t: typing.SupportsFloat) -> Vector:
+    """Interpolate between two vectors along an arc.
+
+    The direction of the result is rotated from ``a`` to ``b`` at a constant
+    angular rate, while its length is linearly interpolated between theirs:
+
+    >>> slerp((1, 0), (0, 3), 0.5)
+    Vector(1.4142135623730951, 1.414213562373095)
+
+    The rotation goes the shortest way around, as given by :py:meth:`Vector.angle`,
+    and uses the same accurate trigonometry as :py:meth:`Vector.rotate`.
+    If either vector is null, its direction is undefined, and :py:func:`slerp`
+    falls back to :py:func:`lerp`.
+    """
+    a, b = Vector(a), Vector(b)
+    a_length, b_length = a.length, b.length
+    if not a_length or not b_length:
+        return lerp(a, b, t)
+
+    t = float(t)
+    r_cos, r_sin = Vector._trig(t * a.angle(b))
+    length = (1 - t) * a_length + t * b_length
+    unit_x, unit_y = _direction(a.x, a.y, a_length)
+    return Vector(
+        length * (unit_x * r_cos - unit_y * r_sin),
+        length * (unit_x * r_sin + unit_y * r_cos),
+    )
+
+
+def quadratic_bezier(p0: VectorLike, p1: VectorLike, p2: VectorLike,
+                     t: typing.SupportsFloat) -> Vector:
+    """Evaluate a quadratic Bézier curve.
+
+    :param p0: the start point, reached when ``t`` is 0.
+    :param p1: the control point.
+    :param p2: the end point, reached when ``t`` is 1.
+
+    >>> quadratic_bezier((0, 0), (1, 2), (2, 0), 0.5)
+    Vector(1.0, 1.0)
+    """
+    x0, y0 = Vector._unpack(p0)
+    x1, y1 = Vector._unpack(p1)
+    x2, y2 = Vector._unpack(p2)
+    t = float(t)
+    u = 1 - t
+    k0, k1, k2 = u * u, 2 * u * t, t * t
+    return Vector(k0 * x0 + k1 * x1 + k2 * x2, k0 * y0 + k1 * y1 + k2 * y2)
+
+
+def cubic_bezier(p0: VectorLike, p1: VectorLike, p2: VectorLike, p3: VectorLike,
+                 t: typing.SupportsFloat) -> Vector:
+    """Evaluate a cubic Bézier curve.
+
+    :param p0: the start point, reached when ``t`` is 0.
+    :param p1: the first control point.
+    :param p2: the second control point.
+    :param p3: the end point, reached when ``t`` is 1.
+
+    >>> cubic_bezier((0, 0), (0, 4), (4, 4), (4, 0), 0.5)
+    Vector(2.0, 3.0)
+    """
+    x0, y0 = Vector._unpack(p0)
+    x1, y1 = Vector._unpack(p1)
+    x2, y2 = Vector._unpack(p2)
+    x3, y3 = Vector._unpack(p3)
+    t = float(t)
+    u = 1 - t
+    k0, k1, k2, k3 = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+    return Vector(k0 * x0 + k1 * x1 + k2 * x2 + k3 * x3,
+                  k0 * y0 + k1 * y1 + k2 * y2 + k3 * y3)
+
+
+def lerp_many(a: typing.Any, b: typing.Any, t: typing.Any) -> VectorArray:
+    """Batch form of :py:func:`lerp`."""
+    [(a_xs, a_ys), (b_xs, b_ys)], ts = _broadcast_curves([a, b], t)
+    return VectorArray._wrap(
+        _floats('d', [(1 - t) * a_x + t * b_x for a_x, b_x, t in zip(a_xs, b_xs, ts)]),
+        _floats('d', [(1 - t) * a_y + t * b_y for a_y, b_y, t in zip(a_ys, b_ys, ts)]),
+    )
+
+
+def slerp_many(a: typing.Any, b: typing.Any, t: typing.Any) -> VectorArray:
+    """Batch form of :py:func:`slerp`.
+
+    >>> slerp_many((2, 0), (0, 2), [0, 0.5, 1])[1]
+    Vector(1.4142135623730951, 1.414213562373095)
+    """
+    [(a_xs, a_ys), (b_xs, b_ys)], ts = _broadcast_curves([a, b], t)
+    thetas = angles(VectorArray.from_xy(a_xs, a_ys), VectorArray.from_xy(b_xs, b_ys))
+
+    xs, ys = [], []
+    for a_x, a_y, b_x, b_y, t, theta in zip(a_xs, a_ys, b_xs, b_ys, ts, thetas):
+        # See slerp
+        u = 1 - t
+        a_length, b_length = hypot(a_x, a_y), hypot(b_x, b_y)
+        if not a_length or not b_length:
+            xs.append(u * a_x + t * b_x)
+            ys.append(u * a_y + t * b_y)
+            continue
+
+        r_cos, r_sin = Vector._trig(t * theta)
+        length = u * a_length + t * b_length
+        unit_x, unit_y = _direction(a_x, a_y, a_length)
+        xs.append(length * (unit_x * r_cos - unit_y * r_sin))
+        ys.append(length * (unit_x * r_sin + unit_y * r_cos))
+
+    return VectorArray._wrap(_floats('d', xs), _floats('d', ys))
+
+
+def quadratic_bezier_many(p0: typing.Any, p1: typing.Any, p2: typing.Any,
+                          t: typing.Any) -> VectorArray:
+    """Batch form of :py:func:`quadratic_bezier`.
+
+    >>> quadratic_bezier_many((0, 0), (1, 2), (2, 0), [0, 0.5, 1])
+    VectorArray([Vector(0.0, 0.0), Vector(1.0, 1.0), Vector(2.0, 0.0)])
+    """
+    [(xs0, ys0), (xs1, ys1), (xs2, ys2)], ts = _broadcast_curves([p0, p1, p2], t)
+
+    xs, ys = [], []
+    for x0, y0, x1, y1, x2, y2, t in zip(xs0, ys0, xs1, ys1, xs2, ys2, ts):
+        u = 1 - t
+        k0, k1, k2 = u * u, 2 * u * t, t * t
+        xs.append(k0 * x0 + k1 * x1 + k2 * x2)
+        ys.append(k0 * y0 + k1 * y1 + k2 * y2)
+
+    return VectorArray._wrap(_floats('d', xs), _floats('d', ys))
+
+
+def cubic_bezier_many(p0: typing.Any, p1: typing.Any, p2: typing.Any, p3: typing.Any,
+                      t: typing.Any) -> VectorArray:
+    """Batch form of :py:func:`cubic_bezier`."""
+    [(xs0, ys0), (xs1, ys1), (xs2, ys2), (xs3, ys3)], ts = _broadcast_curves(
+        [p0, p1, p2, p3], t,
+    )
+
+    xs, ys = [], []
+    for x0, y0, x1, y1, x2, y2, x3, y3, t in zip(xs0, ys0, xs1, ys1, xs2, ys2, xs3, ys3, ts):
+        u = 1 - t
+        k0, k1, k2, k3 = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+        xs.append(k0 * x0 + k1 * x1 + k2 * x2 + k3 * x3)
+        ys.append(k0 * y0 + k1 * y1 + k2 * y2 + k3 * y3)
+
+    return VectorArray._wrap(_floats('d', xs), _floats('d', ys))
@@ -0,0 +1,151 @@
+"""Memoization of expensive :py:class:`Vector` operations.
+
+Some programs compute the same rotations, normalizations and angles over and
+over, such as rotating the same few grid directions by the same few angles.
+A :py:class:`VectorCache` remembers the results of recent calls, so that
+repeated calls skip the trigonometry entirely:
+
+>>> from ppb_vector.memo import VectorCache
+>>> cache = VectorCache(maxsize=256)
+>>> cache.rotate((1, 0), 90)
+Vector(0.0, 1.0)
+>>> cache.rotate(Vector(1, 0), 90.0)
+Vector(0.0, 1.0)
+>>> cache.info()
+CacheInfo(hits=1, misses=1, evictions=0, maxsize=256, currsize=1)
+
+Memoization is opt-in: :py:class:`Vector` methods are never cached.
+"""
+import typing
+from collections import OrderedDict
+
+from ppb_vector import Vector, VectorLike
+
+__all__ = ('VectorCache', 'CacheInfo')
+
+
+class CacheInfo(typing.NamedTuple):
+    """Statistics about a :py:class:`VectorCache`."""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+Key = typing.Tuple[typing.Any, ...]
+
+_MISSING = object()
+
+
+def _coordinates(vector: VectorLike) -> typing.Tuple[float, float]:
+    if isinstance(vector, Vector):
+        return vector.x, vector.y
+
+    return Vector._unpack(vector)
+
+
+class VectorCache:
+    """A bounded cache for the results of :py:class:`Vector` operations.
+
+    :param maxsize: the maximum number of results remembered. When the cache is
+      full, the least recently used result is evicted.
+
+    Results are looked up by the coordinates of the vectors involved, so vectors
+    which are equal, such as ``Vector(1, 0)`` and ``(1.0, 0.0)``, share cache
+    entries. Vectors with NaN coordinates are not equal to anything, and their
+    results are never cached.
+
+    Cached results are identical to those of the corresponding :py:class:`Vector`
+    methods, and exceptions they raise are not cached. Every call counts as either
+    a hit or a miss in :py:meth:`info`, including calls whose results are not
+    cached.
+    """
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+    __slots__ = ('maxsize', 'hits', 'misses', 'evictions', '_results')
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = int(maxsize)
+        if self.maxsize < 1:
+            raise ValueError("VectorCache takes a positive maxsize.")
+
+        self._results: 'OrderedDict[Key, typing.Any]' = OrderedDict()
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def info(self) -> CacheInfo:
+        """Return the cache's statistics."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self))
+
+    def clear(self) -> None:
+        """Forget all cached results, and reset the statistics."""
+        self._results.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def _get(self, key: Key) -> typing.Any:
+        """Look up a result, or return _MISSING."""
+        results = self._results
+        result = results.get(key, _MISSING)
+        if result is _MISSING:
+            # Like functools.lru_cache, count misses even if the result is not
+            #  cached afterwards, so that each call is either a hit or a miss.
+            self.misses += 1
+        else:
+            results.move_to_end(key)
+            self.hits += 1
+
+        return result
+
+    def _put(self, key: Key, result: typing.Any) -> typing.Any:
+        """Cache a result, unless its key contains NaN, and return it."""
+        # NaN is the only float not equal to itself. The key's coordinates must
+        #  be compared one by one, as tuples compare their items by identity first.
+        if any(coordinate != coordinate for coordinate in key[1:]):
+            return result
+
+        results = self._results
+        results[key] = result
+        if len(results) > self.maxsize:
+            results.popitem(last=False)
+            self.evictions += 1
+
+        return result
+
+    def rotate(self, vector: VectorLike, angle: typing.SupportsFloat) -> Vector:
+        """Memoized form of :py:meth:`Vector.rotate`."""
+        x, y = _coordinates(vector)
+        # Like Vector._trig, reduce ints exactly: converting them to floats would
+        #  merge distinct angles, such as 2**53 and 2**53 + 1.
+        key = ('rotate', x, y, angle % 360 if isinstance(angle, int) else float(angle))
+        result = self._get(key)
+        if result is _MISSING:
+            result = self._put(key, Vector(x, y).rotate(angle))
+
+        return result
+
+    def normalize(self, vector: VectorLike) -> Vector:
+        """Memoized form of :py:meth:`Vector.normalize`."""
+        x, y = _coordinates(vector)
+        key = ('normalize', x, y)
+        result = self._get(key)
+        if result is _MISSING:
+            result = self._put(key, Vector(x, y).normalize())
+
+        return result
+
+    def angle(self, vector: VectorLike, other: VectorLike) -> float:
+        """Memoized form of :py:meth:`Vector.angle`."""
+        x, y = _coordinates(vector)
+        other_x, other_y = _coordinates(other)
+        key = ('angle', x, y, other_x, other_y)
+        result = self._get(key)
+        if result is _MISSING:
+            result = self._put(key, Vector(x, y).angle((other_x, other_y)))
+
+        return result
@@ -0,0 +1,125 @@
+"""Narrow-phase collision detection and resolution between circles.
+
+The broad phase, such as :py:class:`~ppb_vector.broadphase.SweepAndPrune` or
+:py:func:`~ppb_vector.geometry.pairs_within`, finds the pairs of objects which
+may collide. The functions in this module test all such pairs of circles at
+once, given as two sequences of indices into the circles' centers and radii:
+
+>>> from ppb_vector.narrowphase import circle_contacts
+>>> centers = [(0, 0), (3, 0), (10, 0)]
+>>> contacts = circle_contacts(centers, [2, 2, 1], i=[0, 0], j=[1, 2])
+>>> contacts.overlapping
+[True, False]
+>>> contacts.separations
+VectorArray([Vector(1.0, 0.0), Vector(0.0, 0.0)])
+
+Pairs of indices from the broad phase, such as the pairs of handles of a
+:py:class:`~ppb_vector.broadphase.SweepAndPrune`, can be split into the two
+sequences with ``i, j = zip(*pairs)``.
+"""
+import typing
+from array import array
+from math import hypot
+
+from ppb_vector.packed import _broadcast_circles, _direction, _floats, VectorArray
+
+__all__ = ('Contacts', 'circle_contacts', 'separate_circles')
+
+
+class Contacts(typing.NamedTuple):
+    """The contacts between pairs of circles ``i[k]`` and ``j[k]``.
+
+    Each attribute has one element per pair.
+    """
+    #: Whether the circles overlap; circles which merely touch do not.
+    overlapping: typing.List[bool]
+    #: How deep the circles overlap, which is negative if they are apart.
+    depths: array
+    #: The vectors to move circles ``j`` by, away from circles ``i``, so that
+    #: they just touch; null if they do not overlap.
+    separations: VectorArray
+
+
+def circle_contacts(centers: typing.Any, radii: typing.Any,
+                    i: typing.Iterable[int], j: typing.Iterable[int]) -> Contacts:
+    """Test pairs of circles for overlaps.
+
+    :param centers: the centers of the circles.
+    :param radii: the radii of the circles; a scalar, or one radius per circle.
+    :param i: the indices of the first circle of each pair.
+    :param j: the indices of the second circle of each pair.
+
+    Indices must be in ``range(len(centers))``, or :py:exc:`IndexError` is raised.
+
+    Circles with the same center are separated along the X axis:
+
+    >>> circle_contacts([(1, 1), (1, 1)], 0.5, [0], [1]).separations
+    VectorArray([Vector(1.0, 0.0)])
+    """
+    n, cxs, cys, radii = _broadcast_circles(centers, radii)
+    i, j = array('q', i), array('q', j)
+    if len(i) != len(j):
+        raise ValueError(f"Expected as many indices in i and j, got {len(i)} and {len(j)}")
+
+    for indices in (i, j):
+        # Negative indices would silently pick circles from the end
+        if indices and not 0 <= min(indices) <= max(indices) < n:
+            bad = min(indices) if min(indices) < 0 else max(indices)
+            raise IndexError(f"Index {bad} out of range for {n} circles")
+
+    overlapping, depths, xs, ys = [], [], [], []
+    for a, b in zip(i, j):
+        wx, wy = cxs[b] - cxs[a], cys[b] - cys[a]
+        distance = hypot(wx, wy)
+        depth = radii[a] + radii[b] - distance
+        depths.append(depth)
+        if not depth > 0:
+            overlapping.append(False)
+            xs.append(0.0)
+            ys.append(0.0)
+            continue
+
+        # Unlike Vector.scale_to, this needs a direction for coincident centers
+        nx, ny = _direction(wx, wy, distance) if distance else (1.0, 0.0)
+        overlapping.append(True)
+        xs.append(nx * depth)
+        ys.append(ny * depth)
+
+    return Contacts(
+        overlapping,
+        _floats('d', depths),
+        VectorArray._wrap(_floats('d', xs), _floats('d', ys)),
+    )
+
+
+def separate_circles(centers: typing.Any, radii: typing.Any,
+                     i: typing.Iterable[int], j: typing.Iterable[int]) -> VectorArray:
+    """Push overlapping pairs of circles apart, and return their new centers.
+
+    The parameters are as in :py:func:`circle_contacts`. Each circle of an
+    overlapping pair is moved by half of the pair's separation, so that they just
+    touch:
+
+    >>> separate_circles([(0, 0), (1, 0), (5, 5)], 1, [0, 0], [1, 2])
+    VectorArray([Vector(-0.5, 0.0), Vector(1.5, 0.0), Vector(5.0, 5.0)])
+
+    The moves of circles in several pairs are added up, which may leave some of
+    them overlapping, or push them too far apart; calling :py:func:`separate_circles`
+    again, with the new centers, resolves more of the overlaps.
+    """
+    _, cxs, cys, radii = _broadcast_circles(centers, radii)
+    i, j = array('q', i), array('q', j)
+    contacts = circle_contacts(VectorArray.from_xy(cxs, cys), radii, i, j)
+
+    xs, ys = list(cxs), list(cys)
+    separations = contacts.separations
+    for a, b, overlap, sx, sy in zip(i, j, contacts.overlapping,
+                                     separations.x, separations.y):
+        if overlap:
+            sx, sy = sx / 2, sy / 2
+            xs[a] -= sx
+            ys[a] -= sy
+            xs[b] += sx
+            ys[b] += sy
+
+    return VectorArray._wrap(_floats('d', xs), _floats('d', ys))
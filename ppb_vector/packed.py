@@ -0,0 +1,835 @@
+"""Packed arrays of vectors.
+
+A :py:class:`VectorArray` stores many vectors as two packed arrays of floats,
+one per coordinate, rather than as a list of :py:class:`Vector` objects.
+This makes it much cheaper in memory, and lets batch operations run over
+whole arrays without allocating a :py:class:`Vector` per element.
+"""
+import operator
+import typing
+from array import array
+from itertools import compress
+from math import atan2, degrees, hypot
+
+from ppb_vector import _direction, _INF, _TINY, Vector, VectorLike
+
+__all__ = ('VectorArray', 'angles', 'headings')
+
+TYPECODES = ('f', 'd')
+
+
+def _floats(typecode: str, values: typing.Iterable[float] = ()) -> array:
+    """Build a packed array of floats with the given typecode."""
+    data: array = array(typecode)
+    if isinstance(values, array) and values.typecode != typecode:
+        # array.extend only accepts arrays with the same typecode
+        values = values.tolist()
+
+    data.extend(values)
+    return data
+
+
+def _check_typecode(typecode: str) -> None:
+    if typecode not in TYPECODES:
+        raise ValueError(f"Expected typecode 'f' or 'd', got {typecode!r}")
+
+
+Columns = typing.Tuple[typing.Sequence[float], typing.Sequence[float]]
+
+
+def _broadcast(*values: typing.Any,
+               n: typing.Optional[int] = None) -> typing.Tuple[int, typing.List[Columns]]:
+    """Get the coordinate columns of arrays and single vectors, broadcast together.
+
+    Each value can be a :py:class:`VectorArray`, an iterable of vector-likes,
+    or a single vector-like which is repeated to the length of the arrays, or to ``n``.
+    """
+    parsed: typing.List[typing.Union[VectorArray, typing.Tuple[float, float]]] = []
+    for value in values:
+        if isinstance(value, VectorArray):
+            parsed.append(value)
+            continue
+
+        try:
+            parsed.append(Vector._unpack(value))
+        except (TypeError, ValueError):
+            parsed.append(VectorArray(value))
+
+    lengths = {len(value) for value in parsed if isinstance(value, VectorArray)}
+    if n is not None:
+        lengths.add(n)
+    if len(lengths) > 1:
+        raise ValueError(f"Cannot broadcast arrays of lengths {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+
+    columns: typing.List[Columns] = []
+    for value in parsed:
+        if isinstance(value, VectorArray):
+            columns.append((value.x, value.y))
+        else:
+            columns.append(([value[0]] * n, [value[1]] * n))
+
+    return n, columns
+
+
+def _broadcast_scalars(*values: typing.Any, n: typing.Optional[int] = None,
+                       ) -> typing.Tuple[int, typing.List[typing.List[float]]]:
+    """Get lists of floats from scalars and iterables of scalars, broadcast together.
+
+    Single scalars are repeated to the length of the iterables, or to ``n``.
+    """
+    lists = [
+        None if hasattr(value, '__float__') else [float(x) for x in value]
+        for value in values
+    ]
+
+    lengths = {len(floats) for floats in lists if floats is not None}
+    if n is not None:
+        lengths.add(n)
+    if len(lengths) > 1:
+        raise ValueError(f"Cannot broadcast sequences of lengths {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+
+    return n, [
+        [float(value)] * n if floats is None else floats
+        for value, floats in zip(values, lists)
+    ]
+
+
+def _broadcast_circles(centers: typing.Any, radii: typing.Any) -> typing.Tuple[
+        int, typing.Sequence[float], typing.Sequence[float], typing.List[float]]:
+    """Get the columns of the centers and the radii of circles, broadcast together."""
+    n = None if hasattr(radii, '__float__') else len(radii)
+    n, [(cxs, cys)] = _broadcast(centers, n=n)
+    n, [radii] = _broadcast_scalars(radii, n=n)
+    if not all(r >= 0 for r in radii):
+        raise ValueError("Circles take non-negative radii.")
+
+    return n, cxs, cys, radii
+
+
+def _store(out: typing.Optional['VectorArray'], typecode: str,
+           xs: typing.Iterable[float], ys: typing.Iterable[float]) -> 'VectorArray':
+    """Store the results of a batch operation, in a new array or in ``out``."""
+    if out is None:
+        return VectorArray._wrap(_floats(typecode, xs), _floats(typecode, ys))
+
+    new_xs, new_ys = _floats(out.typecode, xs), _floats(out.typecode, ys)
+    if len(new_xs) != len(out):
+        raise ValueError(f"Expected an output array of length {len(new_xs)}, got {len(out)}")
+
+    out.x[:], out.y[:] = new_xs, new_ys
+    return out
+
+
+class VectorArray:
+    """A mutable, packed array of 2D vectors.
+
+    :py:class:`VectorArray` can be built from any iterable of vector-likes:
+
+    >>> from ppb_vector.packed import VectorArray
+    >>> a = VectorArray([(1, 2), Vector(3, 4)])
+    >>> a
+    VectorArray([Vector(1.0, 2.0), Vector(3.0, 4.0)])
+
+    Elements are converted to :py:class:`Vector` when accessed:
+
+    >>> a[1]
+    Vector(3.0, 4.0)
+    >>> a[0] = {'x': 5, 'y': 6}
+    >>> list(a)
+    [Vector(5.0, 6.0), Vector(3.0, 4.0)]
+
+    The coordinates are stored in two :py:class:`array.array`, exposed as the
+    :py:attr:`x` and :py:attr:`y` attributes.
+
+    >>> a.x
+    array('d', [5.0, 3.0])
+
+    Slicing returns a view, which shares its storage with the original array,
+    like slicing a :py:class:`memoryview` does:
+
+    >>> c = VectorArray([(0, 0), (1, 1), (2, 2), (3, 3)])
+    >>> evens = c[::2]
+    >>> evens[1] = (-2, -2)
+    >>> c
+    VectorArray([Vector(0.0, 0.0), Vector(1.0, 1.0), Vector(-2.0, -2.0), Vector(3.0, 3.0)])
+
+    The :py:attr:`x` and :py:attr:`y` attributes of a view are :py:class:`memoryview`
+    objects. Views cannot be resized, and neither can an array while views of it exist.
+    To get an independent array, use :py:meth:`copy`.
+
+    Indexing with a mask (a sequence of :py:class:`bool`, as returned by batch
+    predicates) selects the vectors for which it is true, in a new array:
+
+    >>> c[[True, False, False, True]]
+    VectorArray([Vector(0.0, 0.0), Vector(3.0, 3.0)])
+
+    By default, coordinates are stored as 64-bit floats, like in :py:class:`Vector`.
+    Passing ``typecode='f'`` stores them as 32-bit floats instead, halving
+    memory use and bandwidth at the cost of precision:
+
+    >>> b = VectorArray([(0.1, 1)], typecode='f')
+    >>> b.nbytes
+    8
+    >>> b[0]
+    Vector(0.10000000149011612, 1.0)
+
+    Batch operations are always computed in double precision, using the same
+    formulas as the corresponding :py:class:`Vector` methods, then stored with
+    the array's typecode:
+
+    - with ``typecode='d'``, results are identical to the :py:class:`Vector` ones;
+    - with ``typecode='f'``, results are the :py:class:`Vector` ones (applied to
+      the stored, single-precision inputs) rounded to single precision, which
+      means a relative error of at most 2⁻²⁴ (about 6e-8) on each coordinate.
+
+    Arithmetic operators work like those of :py:class:`Vector`, element-wise,
+    and broadcast single vectors and scalars against arrays:
+
+    >>> a = VectorArray([(1, 2), (3, 4)])
+    >>> Vector(1, 1) + a
+    VectorArray([Vector(2.0, 3.0), Vector(4.0, 5.0)])
+    >>> a * 2
+    VectorArray([Vector(2.0, 4.0), Vector(6.0, 8.0)])
+
+    As with :py:class:`Vector`, multiplying by a vector computes dot products:
+
+    >>> a * (1, 0)
+    array('d', [1.0, 3.0])
+
+    Results are stored with the typecode of the array operand; when both
+    operands are arrays, results are stored as 32-bit floats only if both are.
+    The augmented assignments ``+=``, ``-=``, ``*=`` and ``/=`` modify arrays
+    in place.
+
+    Note that :py:class:`VectorArray` is not a vector-like, even when it
+    contains two vectors.
+    """
+    x: array
+    y: array
+
+    __slots__ = ('x', 'y', '__weakref__')
+
+    def __init__(self, vectors: typing.Iterable[VectorLike] = (), typecode: str = 'd'):
+        _check_typecode(typecode)
+
+        if isinstance(vectors, VectorArray):
+            self.x = _floats(typecode, vectors.x)
+            self.y = _floats(typecode, vectors.y)
+            return
+
+        vs = [Vector(v) for v in vectors]
+        self.x = _floats(typecode, [v.x for v in vs])
+        self.y = _floats(typecode, [v.y for v in vs])
+
+    @classmethod
+    def _wrap(cls, x: array, y: array) -> 'VectorArray':
+        """Build a VectorArray from coordinate storage, without copying it."""
+        self = cls.__new__(cls)
+        self.x, self.y = x, y
+        return self
+
+    @classmethod
+    def from_xy(cls, xs: typing.Iterable[typing.SupportsFloat],
+                ys: typing.Iterable[typing.SupportsFloat],
+                typecode: str = 'd') -> 'VectorArray':
+        """Build a :py:class:`VectorArray` from separate sequences of coordinates.
+
+        >>> VectorArray.from_xy([1, 2], [3, 4])
+        VectorArray([Vector(1.0, 3.0), Vector(2.0, 4.0)])
+        """
+        _check_typecode(typecode)
+        x = _floats(typecode, map(float, xs))
+        y = _floats(typecode, map(float, ys))
+        if len(x) != len(y):
+            raise ValueError(f"Got {len(x)} x coordinates but {len(y)} y coordinates")
+
+        return cls._wrap(x, y)
+
+    @classmethod
+    def zeros(cls, n: int, typecode: str = 'd') -> 'VectorArray':
+        """Build a :py:class:`VectorArray` of ``n`` null vectors.
+
+        >>> VectorArray.zeros(2)
+        VectorArray([Vector(0.0, 0.0), Vector(0.0, 0.0)])
+        """
+        _check_typecode(typecode)
+        return cls._wrap(_floats(typecode, [0.0]) * n, _floats(typecode, [0.0]) * n)
+
+    @classmethod
+    def from_polar(cls, lengths: typing.Any, angles: typing.Any,
+                   typecode: str = 'd') -> 'VectorArray':
+        """Build a :py:class:`VectorArray` from polar coordinates.
+
+        This is the batch form of :py:meth:`Vector.from_polar`;
+        ``lengths`` and ``angles`` can each be a sequence or a single scalar.
+
+        >>> VectorArray.from_polar(2, [0, 90])
+        VectorArray([Vector(2.0, 0.0), Vector(0.0, 2.0)])
+        """
+        _check_typecode(typecode)
+        _, [lengths, angles] = _broadcast_scalars(lengths, angles)
+
+        xs, ys = [], []
+        for length, angle in zip(lengths, angles):
+            r_cos, r_sin = Vector._trig(angle)
+            xs.append(length * r_cos)
+            ys.append(length * r_sin)
+
+        return cls._wrap(_floats(typecode, xs), _floats(typecode, ys))
+
+    @property
+    def typecode(self) -> str:
+        """The typecode of the coordinates' storage: ``'f'`` or ``'d'``."""
+        x = self.x
+        return x.typecode if isinstance(x, array) else x.format
+
+    @property
+    def nbytes(self) -> int:
+        """The size, in bytes, of the coordinates' storage."""
+        return 2 * len(self.x) * self.x.itemsize
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def _mask(self, mask: typing.Iterable[bool]) -> typing.List[bool]:
+        """Check that ``mask`` is a sequence of booleans, one per vector."""
+        mask = list(mask)
+        if not all(isinstance(m, bool) for m in mask):
+            raise TypeError("Masks must only contain booleans; use take() to select by indices")
+
+        if len(mask) != len(self):
+            raise ValueError(f"Expected a mask of length {len(self)}, got {len(mask)}")
+
+        return mask
+
+    def _check_resizable(self) -> None:
+        if not isinstance(self.x, array):
+            raise TypeError("Cannot resize a view of a VectorArray")
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Vector: pass
+
+    @typing.overload
+    def __getitem__(self, index: typing.Union[slice, typing.Iterable[bool]]) -> 'VectorArray': pass
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorArray._wrap(memoryview(self.x)[index], memoryview(self.y)[index])
+
+        if hasattr(index, '__index__'):
+            index = operator.index(index)
+            return Vector(self.x[index], self.y[index])
+
+        mask = self._mask(index)
+        return VectorArray._wrap(
+            _floats(self.typecode, compress(self.x, mask)),
+            _floats(self.typecode, compress(self.y, mask)),
+        )
+
+    def __setitem__(self, index: typing.Any, value: typing.Any) -> None:
+        """Set vectors at an index, a slice or a mask.
+
+        When setting a slice or a mask, ``value`` can be a single vector-like,
+        or an iterable with one vector-like per selected element.
+        """
+        if isinstance(index, slice):
+            n = len(range(*index.indices(len(self))))
+            _, [(xs, ys)] = _broadcast(value, n=n)
+            memoryview(self.x)[index] = _floats(self.typecode, xs)
+            memoryview(self.y)[index] = _floats(self.typecode, ys)
+
+        elif hasattr(index, '__index__'):
+            index = operator.index(index)
+            x, y = Vector._unpack(value)
+            self.x[index], self.y[index] = x, y
+
+        else:
+            mask = self._mask(index)
+            self.put(compress(range(len(self)), mask), value)
+
+    def __iter__(self) -> typing.Iterator[Vector]:
+        return map(Vector, self.x, self.y)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+
+        return self.x == other.x and self.y == other.y
+
+    def __repr__(self) -> str:
+        suffix = "" if self.typecode == 'd' else f", typecode={self.typecode!r}"
+        return f"VectorArray({self.tolist()}{suffix})"
+
+    def append(self, value: VectorLike) -> None:
+        """Append a vector-like at the end of the array."""
+        self._check_resizable()
+        x, y = Vector._unpack(value)
+        self.x.append(x)
+        self.y.append(y)
+
+    def extend(self, values: typing.Iterable[VectorLike]) -> None:
+        """Append vector-likes from an iterable at the end of the array."""
+        self._check_resizable()
+        other = values if isinstance(values, VectorArray) else VectorArray(values)
+        self.x.extend(_floats(self.typecode, other.x))
+        self.y.extend(_floats(self.typecode, other.y))
+
+    def take(self, indices: typing.Iterable[int]) -> 'VectorArray':
+        """Select vectors by their indices, in a new array.
+
+        >>> VectorArray([(0, 0), (1, 1), (2, 2)]).take([2, 0, 2])
+        VectorArray([Vector(2.0, 2.0), Vector(0.0, 0.0), Vector(2.0, 2.0)])
+        """
+        xs, ys = self.x, self.y
+        indices = list(indices)
+        return VectorArray._wrap(
+            _floats(self.typecode, [xs[i] for i in indices]),
+            _floats(self.typecode, [ys[i] for i in indices]),
+        )
+
+    def put(self, indices: typing.Iterable[int], values: typing.Any) -> None:
+        """Set vectors at the given indices.
+
+        :param values: a single vector-like, or an iterable with one vector-like
+          per index.
+
+        >>> a = VectorArray.zeros(3)
+        >>> a.put([0, 2], [(1, 1), (2, 2)])
+        >>> a
+        VectorArray([Vector(1.0, 1.0), Vector(0.0, 0.0), Vector(2.0, 2.0)])
+
+        All indices are checked before any vector is set.
+        """
+        n = len(self)
+        indices = [operator.index(i) for i in indices]
+        for i in indices:
+            if not -n <= i < n:
+                raise IndexError(f"Index {i} out of range for a VectorArray of length {n}")
+
+        _, [(new_xs, new_ys)] = _broadcast(values, n=len(indices))
+        xs, ys = self.x, self.y
+        for i, x, y in zip(indices, new_xs, new_ys):
+            xs[i], ys[i] = x, y
+
+    def compress(self, mask: typing.Iterable[bool]) -> None:
+        """Remove the vectors for which ``mask`` is false, in place.
+
+        The remaining vectors keep their order.
+
+        >>> a = VectorArray([(0, 0), (1, 1), (2, 2)])
+        >>> a.compress([True, False, True])
+        >>> a
+        VectorArray([Vector(0.0, 0.0), Vector(2.0, 2.0)])
+        """
+        self._check_resizable()
+        mask = self._mask(mask)
+        self.x[:] = _floats(self.typecode, compress(self.x, mask))
+        self.y[:] = _floats(self.typecode, compress(self.y, mask))
+
+    def tolist(self) -> typing.List[Vector]:
+        """Convert the array to a list of :py:class:`Vector`."""
+        return list(self)
+
+    def copy(self) -> 'VectorArray':
+        """Return a copy of the array, with the same typecode."""
+        return self.astype(self.typecode)
+
+    def astype(self, typecode: str) -> 'VectorArray':
+        """Return a copy of the array, stored with the given typecode.
+
+        >>> VectorArray([(1, 2)]).astype('f')
+        VectorArray([Vector(1.0, 2.0)], typecode='f')
+        """
+        return VectorArray(self, typecode)
+
+    def _operand(self, other: typing.Any) -> typing.Any:
+        """Convert the other operand of an arithmetic operator.
+
+        Return a :py:class:`VectorArray` or a pair of coordinates,
+        or ``None`` if ``other`` is neither an array nor a vector-like.
+        """
+        if isinstance(other, VectorArray):
+            return other
+
+        try:
+            return Vector._unpack(other)
+        except (TypeError, ValueError):
+            pass
+
+        if hasattr(other, '__float__') or isinstance(other, (str, bytes)):
+            return None
+
+        try:
+            return VectorArray(other)
+        except (TypeError, ValueError):
+            return None
+
+    def _typecode(self, other: typing.Any) -> str:
+        """The typecode of the result of an operation with ``other``."""
+        if isinstance(other, VectorArray) and other.typecode != self.typecode:
+            return 'd'
+
+        return self.typecode
+
+    def _add(self, other: typing.Any, sign: float,
+             out: typing.Optional['VectorArray'] = None) -> 'VectorArray':
+        """Compute ``self + sign * other``, or NotImplemented."""
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+
+        _, [(xs, ys), (other_xs, other_ys)] = _broadcast(self, operand)
+        if sign > 0:
+            rv_xs = [x + other_x for x, other_x in zip(xs, other_xs)]
+            rv_ys = [y + other_y for y, other_y in zip(ys, other_ys)]
+        else:
+            rv_xs = [x - other_x for x, other_x in zip(xs, other_xs)]
+            rv_ys = [y - other_y for y, other_y in zip(ys, other_ys)]
+
+        return _store(out, self._typecode(operand), rv_xs, rv_ys)
+
+    def __add__(self, other: typing.Any) -> 'VectorArray':
+        return self._add(other, 1)
+
+    def __radd__(self, other: typing.Any) -> 'VectorArray':
+        return self._add(other, 1)
+
+    def __iadd__(self, other: typing.Any) -> 'VectorArray':
+        return self._add(other, 1, out=self)
+
+    def __sub__(self, other: typing.Any) -> 'VectorArray':
+        return self._add(other, -1)
+
+    def __rsub__(self, other: typing.Any) -> 'VectorArray':
+        # other - self == -(self - other), but without rounding differences
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+
+        _, [(xs, ys), (other_xs, other_ys)] = _broadcast(self, operand)
+        return _store(None, self._typecode(operand),
+                      [other_x - x for x, other_x in zip(xs, other_xs)],
+                      [other_y - y for y, other_y in zip(ys, other_ys)])
+
+    def __isub__(self, other: typing.Any) -> 'VectorArray':
+        return self._add(other, -1, out=self)
+
+    def __mul__(self, other: typing.Any) -> typing.Any:
+        """Scale vectors by a scalar, or compute dot products, like :py:meth:`Vector.__mul__`."""
+        if isinstance(other, (float, int)):
+            return self.scale_by(other)
+
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+
+        return self.dot(operand)
+
+    def __rmul__(self, other: typing.Any) -> typing.Any:
+        return self.__mul__(other)
+
+    def __imul__(self, other: typing.Any) -> 'VectorArray':
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+
+        return self.scale_by(other, out=self)
+
+    def __truediv__(self, other: typing.Any) -> 'VectorArray':
+        """Divide vectors by a scalar, like :py:meth:`Vector.__truediv__`."""
+        try:
+            other = float(other)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+        return VectorArray._wrap(
+            _floats(self.typecode, [x / other for x in self.x]),
+            _floats(self.typecode, [y / other for y in self.y]),
+        )
+
+    def __itruediv__(self, other: typing.Any) -> 'VectorArray':
+        result = self / other
+        if result is NotImplemented:
+            return NotImplemented
+
+        return _store(self, self.typecode, result.x, result.y)
+
+    def __neg__(self) -> 'VectorArray':
+        return self.scale_by(-1)
+
+    def scale_by(self, scalar: typing.Any,
+                 out: typing.Optional['VectorArray'] = None) -> 'VectorArray':
+        """Multiply vectors by scalars, like :py:meth:`Vector.scale_by`.
+
+        :param scalar: a single scalar, or a sequence of scalars for each vector.
+        :param out: optionally, an array of the same length to store the result
+          in, such as ``self``; by default, a new array is returned.
+
+        >>> VectorArray([(1, 2), (3, 4)]).scale_by([2, -1])
+        VectorArray([Vector(2.0, 4.0), Vector(-3.0, -4.0)])
+        """
+        _, [scalars] = _broadcast_scalars(scalar, n=len(self))
+        return _store(out, self.typecode,
+                      [k * x for k, x in zip(scalars, self.x)],
+                      [k * y for k, y in zip(scalars, self.y)])
+
+    def dot(self, other: typing.Any) -> array:
+        """Compute dot products, like :py:meth:`Vector.dot`.
+
+        :param other: a :py:class:`VectorArray` of the same length, an iterable
+          of vector-likes, or a single vector-like.
+
+        Return an array of 64-bit floats.
+
+        >>> VectorArray([(1, 2), (3, 4)]).dot((1, -1))
+        array('d', [-1.0, -1.0])
+        """
+        _, [(xs, ys), (other_xs, other_ys)] = _broadcast(self, other)
+        return _floats('d', [
+            x * other_x + y * other_y
+            for x, y, other_x, other_y in zip(xs, ys, other_xs, other_ys)
+        ])
+
+    def angle(self, other: typing.Any) -> array:
+        """Compute the angles between pairs of vectors, like :py:meth:`Vector.angle`.
+
+        :param other: a :py:class:`VectorArray` of the same length, an iterable
+          of vector-likes, or a single vector-like.
+
+        See :py:func:`angles`.
+        """
+        return angles(self, other)
+
+    def cross(self, other: typing.Any) -> array:
+        """Compute cross products, like :py:meth:`Vector.cross`.
+
+        :param other: a :py:class:`VectorArray` of the same length, an iterable
+          of vector-likes, or a single vector-like.
+
+        >>> VectorArray([(1, 0), (0, 1)]).cross((0, 2))
+        array('d', [2.0, 0.0])
+        """
+        _, [(xs, ys), (other_xs, other_ys)] = _broadcast(self, other)
+        return _floats('d', [
+            x * other_y - y * other_x
+            for x, y, other_x, other_y in zip(xs, ys, other_xs, other_ys)
+        ])
+
+    def perp(self) -> 'VectorArray':
+        """Rotate all vectors by 90° counter-clockwise, like :py:meth:`Vector.perp`.
+
+        >>> VectorArray([(1, 2), (0, -1)]).perp()
+        VectorArray([Vector(-2.0, 1.0), Vector(1.0, 0.0)])
+        """
+        return VectorArray._wrap(
+            _floats(self.typecode, [-y for y in self.y]),
+            _floats(self.typecode, self.x),
+        )
+
+    def _project(self, other: typing.Any, reject: bool) -> 'VectorArray':
+        _, [(xs, ys), (other_xs, other_ys)] = _broadcast(self, other)
+        rv_xs, rv_ys = [], []
+        for x, y, other_x, other_y in zip(xs, ys, other_xs, other_ys):
+            # See Vector.project_onto for the details of this computation.
+            unit_x, unit_y = _direction(other_x, other_y, hypot(other_x, other_y))
+
+            d = x * unit_x + y * unit_y
+            if reject:
+                rv_xs.append(x - d * unit_x)
+                rv_ys.append(y - d * unit_y)
+            else:
+                rv_xs.append(d * unit_x)
+                rv_ys.append(d * unit_y)
+
+        return VectorArray._wrap(_floats(self.typecode, rv_xs), _floats(self.typecode, rv_ys))
+
+    def project_onto(self, other: typing.Any) -> 'VectorArray':
+        """Project vectors onto others, like :py:meth:`Vector.project_onto`.
+
+        :param other: a :py:class:`VectorArray` of the same length, an iterable
+          of vector-likes, or a single vector-like.
+
+        >>> VectorArray([(3, 4), (1, 1)]).project_onto((2, 0))
+        VectorArray([Vector(3.0, 0.0), Vector(1.0, 0.0)])
+        """
+        return self._project(other, reject=False)
+
+    def reject_from(self, other: typing.Any) -> 'VectorArray':
+        """Compute rejections of vectors, like :py:meth:`Vector.reject_from`.
+
+        :param other: a :py:class:`VectorArray` of the same length, an iterable
+          of vector-likes, or a single vector-like.
+
+        >>> VectorArray([(3, 4), (-1, 1)]).reject_from((2, 0))
+        VectorArray([Vector(0.0, 4.0), Vector(0.0, 1.0)])
+        """
+        return self._project(other, reject=True)
+
+    def to_polar(self) -> typing.Tuple[array, array]:
+        """Convert all vectors to polar coordinates, like :py:meth:`Vector.to_polar`.
+
+        Return two arrays of 64-bit floats, of the lengths and the headings.
+
+        >>> lengths, headings = VectorArray([(2, 0), (0, -3)]).to_polar()
+        >>> lengths
+        array('d', [2.0, 3.0])
+        >>> headings
+        array('d', [0.0, -90.0])
+        """
+        lengths = _floats('d', map(hypot, self.x, self.y))
+        headings = _floats('d')
+        for x, y, length in zip(self.x, self.y, lengths):
+            # See Vector.to_polar
+            heading = degrees(atan2(y, x)) if length else 0.0
+            headings.append(heading + 360 if heading <= -180 else heading)
+
+        return lengths, headings
+
+    def rotate(self, angle: typing.Any) -> 'VectorArray':
+        """Rotate vectors, like :py:meth:`Vector.rotate`.
+
+        :param angle: a single angle, or a sequence of angles for each vector.
+
+        >>> VectorArray([(1, 0), (0, 2)]).rotate(90)
+        VectorArray([Vector(0.0, 1.0), Vector(-2.0, 0.0)])
+        >>> VectorArray([(1, 0), (0, 2)]).rotate([90, -90])
+        VectorArray([Vector(0.0, 1.0), Vector(2.0, 0.0)])
+        """
+        xs, ys = self.x, self.y
+        if hasattr(angle, '__float__'):
+            r_cos, r_sin = Vector._trig(angle)
+            return VectorArray._wrap(
+                _floats(self.typecode, [x * r_cos - y * r_sin for x, y in zip(xs, ys)]),
+                _floats(self.typecode, [x * r_sin + y * r_cos for x, y in zip(xs, ys)]),
+            )
+
+        _, [angles] = _broadcast_scalars(angle, n=len(self))
+        rv_xs, rv_ys = [], []
+        for x, y, angle in zip(xs, ys, angles):
+            r_cos, r_sin = Vector._trig(angle)
+            rv_xs.append(x * r_cos - y * r_sin)
+            rv_ys.append(x * r_sin + y * r_cos)
+
+        return VectorArray._wrap(_floats(self.typecode, rv_xs), _floats(self.typecode, rv_ys))
+
+    def normalize(self, out: typing.Optional['VectorArray'] = None) -> 'VectorArray':
+        """Scale all vectors to unit length, like :py:meth:`Vector.normalize`.
+
+        :param out: optionally, an array of the same length to store the result
+          in, such as ``self``; by default, a new array is returned.
+
+        >>> VectorArray([(3, 4), (0, -2)]).normalize()
+        VectorArray([Vector(0.6, 0.8), Vector(0.0, -1.0)])
+
+        As with :py:meth:`Vector.normalize`, null vectors cannot be normalized.
+        """
+        return self.scale_to(1, out)
+
+    def scale_to(self, length: typing.Any,
+                 out: typing.Optional['VectorArray'] = None) -> 'VectorArray':
+        """Scale vectors to given lengths, like :py:meth:`Vector.scale_to`.
+
+        :param length: a single length, or a sequence of lengths for each vector.
+        :param out: optionally, an array of the same length to store the result
+          in, such as ``self``; by default, a new array is returned.
+
+        >>> VectorArray([(3, 4), (0, -2)]).scale_to([10, 1])
+        VectorArray([Vector(6.0, 8.0), Vector(0.0, -1.0)])
+
+        As with :py:meth:`Vector.scale_to`, lengths must be non-negative, and
+        null vectors can only be scaled to a length of 0. Otherwise, an exception
+        is raised, and ``out`` is left unchanged.
+        """
+        _, [lengths] = _broadcast_scalars(length, n=len(self))
+        return _store(out, self.typecode, *_scale_columns(self.x, self.y, lengths))
+
+    def truncate(self, max_length: typing.Any,
+                 out: typing.Optional['VectorArray'] = None) -> 'VectorArray':
+        """Scale vectors down to given lengths, if they are larger, like :py:meth:`Vector.truncate`.
+
+        :param max_length: a single length, or a sequence of lengths for each vector.
+        :param out: optionally, an array of the same length to store the result
+          in, such as ``self``; by default, a new array is returned.
+
+        This is typically used to clamp the velocities of many agents to their
+        maximum speed, in place:
+
+        >>> velocities = VectorArray([(3, 4), (0, -2)])
+        >>> _ = velocities.truncate(3, out=velocities)
+        >>> velocities
+        VectorArray([Vector(1.8, 2.4), Vector(0.0, -2.0)])
+        """
+        _, [lengths] = _broadcast_scalars(max_length, n=len(self))
+        return _store(out, self.typecode,
+                      *_scale_columns(self.x, self.y, lengths, truncate=True))
+
+
+def _scale_columns(xs: typing.Iterable[float], ys: typing.Iterable[float],
+                   lengths: typing.Iterable[float], truncate: bool = False,
+                   ) -> typing.Tuple[typing.List[float], typing.List[float]]:
+    """Scale vectors to lengths, with the semantics of Vector.scale_to or Vector.truncate."""
+    rv_xs, rv_ys = [], []
+    for x, y, length in zip(xs, ys, lengths):
+        norm = hypot(x, y)
+        if truncate and norm <= length:
+            rv_xs.append(x)
+            rv_ys.append(y)
+            continue
+
+        # See Vector.scale_to
+        if length < 0:
+            raise ValueError("VectorArray.scale_to takes non-negative lengths.")
+
+        if length == 0:
+            rv_xs.append(0.0)
+            rv_ys.append(0.0)
+        else:
+            rv_xs.append((length * x) / norm)
+            rv_ys.append((length * y) / norm)
+
+    return rv_xs, rv_ys
+
+
+def angles(a: typing.Any, b: typing.Any) -> array:
+    """Compute the angles between pairs of vectors.
+
+    The result is an array of 64-bit floats, with the same values and range
+    as :py:meth:`Vector.angle`. Either argument may be a single vector-like.
+
+    >>> angles([(1, 0), (0, 1)], [(0, 1), (-1, 0)])
+    array('d', [90.0, 90.0])
+    >>> angles((0, 1), [(1, 0), (0, -1)])
+    array('d', [-90.0, 180.0])
+    """
+    _, [(xs, ys), (other_xs, other_ys)] = _broadcast(a, b)
+
+    rv = _floats('d')
+    for x, y, other_x, other_y in zip(xs, ys, other_xs, other_ys):
+        # See Vector.angle for the details of this computation.
+        cross = x * other_y - y * other_x
+        dot = x * other_x + y * other_y
+        if _TINY < abs(cross) + abs(dot) < _INF:
+            angle = degrees(atan2(cross, dot))
+        else:
+            angle = degrees(atan2(other_x, -other_y) - atan2(x, -y))
+
+        if angle <= -180:
+            angle += 360
+        elif angle > 180:
+            angle -= 360
+
+        rv.append(angle)
+
+    return rv
+
+
+def headings(vectors: typing.Any) -> array:
+    """Compute the headings of vectors, i.e. their angle relative to the X axis.
+
+    This is equivalent to computing ``Vector(1, 0).angle(v)`` for each vector:
+
+    >>> headings([(1, 1), (0, -2), (-1, 0)])
+    array('d', [45.0, -90.0, 180.0])
+    """
+    return angles((1, 0), vectors)
@@ -0,0 +1,267 @@
+"""Batch raycasting against segments and circles.
+
+Line-of-sight checks and hitscan bullets cast many rays against the same level
+geometry. The functions in this module cast all rays in a single call, and
+return the nearest hit of each ray, as packed arrays:
+
+>>> from ppb_vector.raycast import raycast_segments
+>>> walls = [(-5, 2), (2, -5)], [(5, 2), (2, 5)]
+>>> hits = raycast_segments((0, 0), [(0, 1), (1, 0), (-1, 0)], *walls)
+>>> hits.indices
+array('q', [0, 1, -1])
+>>> hits.points[:2]
+VectorArray([Vector(0.0, 2.0), Vector(2.0, 0.0)])
+
+The normals of the surfaces hit are normalized, and face the rays, so that they
+can be passed to :py:meth:`Vector.reflect` to bounce the rays:
+
+>>> from ppb_vector import Vector
+>>> hits.normals[0]
+Vector(0.0, -1.0)
+>>> Vector(0, 1).reflect(hits.normals[0])
+Vector(0.0, -1.0)
+
+For large numbers of shapes, an :py:class:`~ppb_vector.broadphase.AABBTree` of
+their bounding boxes, made with :py:func:`segment_index` or :py:func:`circle_index`,
+lets each ray only be tested against the shapes along its path. The results
+are the same as without an index, except that rays which merely graze a shape,
+within rounding errors, may hit it in one case and not in the other.
+"""
+import typing
+from array import array
+from itertools import repeat
+from math import copysign, frexp, hypot, inf, ldexp, sqrt
+
+from ppb_vector.broadphase import AABBTree
+from ppb_vector.geometry import _rescale, _SAFE_MAX, _SAFE_MIN
+from ppb_vector.packed import (
+    _broadcast, _broadcast_circles, _broadcast_scalars, _direction, _floats, VectorArray,
+)
+
+__all__ = ('RayHits', 'raycast_segments', 'raycast_circles', 'segment_index', 'circle_index')
+
+NAN = float('nan')
+
+Candidates = typing.Iterable[typing.Tuple[float, int]]
+
+
+class RayHits(typing.NamedTuple):
+    """The nearest hits of a batch of rays.
+
+    Each attribute has one element per ray. For rays which hit nothing,
+    distances are infinite, points and normals are NaN, and indices are -1.
+    """
+    #: The distances from the rays' origins to their hits.
+    distances: array
+    #: The points hit.
+    points: VectorArray
+    #: The unit normals of the surfaces hit, facing the rays' origins.
+    normals: VectorArray
+    #: The indices of the shapes hit.
+    indices: array
+
+
+def _rays(origins: typing.Any, directions: typing.Any,
+          max_distance: typing.Any) -> typing.Tuple[int, typing.Iterator[typing.Tuple[float, ...]]]:
+    """Broadcast rays together, and normalize their directions."""
+    n = None if hasattr(max_distance, '__float__') else len(max_distance)
+    n, [(oxs, oys), (dxs, dys)] = _broadcast(origins, directions, n=n)
+    n, [limits] = _broadcast_scalars(max_distance, n=n)
+
+    lengths = list(map(hypot, dxs, dys))
+    if not all(lengths):
+        raise ZeroDivisionError("Rays require non-null directions.")
+
+    units = [_direction(dx, dy, length) for dx, dy, length in zip(dxs, dys, lengths)]
+    return n, zip(oxs, oys, [x for x, _ in units], [y for _, y in units], limits)
+
+
+def _candidates(index: typing.Optional[AABBTree], count: int, x: float, y: float,
+                dx: float, dy: float, limit: float) -> Candidates:
+    """List the shapes a ray may hit, with lower bounds on their distances, in order."""
+    if index is None:
+        return zip(repeat(0.0), range(count))
+
+    return index.iter_ray((x, y), (dx, dy), limit)
+
+
+def _results(n: int) -> typing.Tuple[array, typing.List[float], typing.List[float],
+                                     typing.List[float], typing.List[float], array]:
+    return (_floats('d', [inf]) * n, [NAN] * n, [NAN] * n, [NAN] * n, [NAN] * n,
+            array('q', [-1]) * n)
+
+
+def raycast_segments(origins: typing.Any, directions: typing.Any,
+                     starts: typing.Any, ends: typing.Any,
+                     max_distance: typing.Any = inf,
+                     index: typing.Optional[AABBTree] = None) -> RayHits:
+    """Find where rays first hit segments.
+
+    :param origins: the origins of the rays.
+    :param directions: the directions of the rays, which do not need to be normalized.
+    :param starts: the start points of the segments.
+    :param ends: the end points of the segments.
+    :param max_distance: how far rays go; a scalar, or one distance per ray.
+    :param index: an :py:class:`~ppb_vector.broadphase.AABBTree` of the segments,
+      made with :py:func:`segment_index`.
+
+    ``origins`` and ``directions`` can be arrays, or single vector-likes shared by
+    all rays; likewise for ``starts`` and ``ends``. Segments include their
+    endpoints, and rays which are parallel to a segment do not hit it. If a ray
+    hits several segments at the same distance, the lowest index is reported.
+    """
+    m, [(qxs, qys), (exs, eys)] = _broadcast(starts, ends)
+    spans_x = [ex - qx for qx, ex in zip(qxs, exs)]
+    spans_y = [ey - qy for qy, ey in zip(qys, eys)]
+
+    n, rays = _rays(origins, directions, max_distance)
+    distances, xs, ys, nxs, nys, indices = _results(n)
+    for i, (px, py, dx, dy, limit) in enumerate(rays):
+        best_t, best = limit, -1
+        for entry, k in _candidates(index, m, px, py, dx, dy, limit):
+            if entry > best_t:
+                break
+
+            sx, sy = spans_x[k], spans_y[k]
+            denom = dx * sy - dy * sx
+            if denom == 0:
+                continue
+
+            wx, wy = qxs[k] - px, qys[k] - py
+            cross = wx * sy - wy * sx
+            exponent = 0
+            if not (_SAFE_MIN < abs(denom) < _SAFE_MAX and _SAFE_MIN < abs(cross) < _SAFE_MAX):
+                # The products may have overflowed or underflowed: scale the
+                #  segment by a power of 2, which scales t by the same power.
+                exponent, (wx, wy, sx, sy) = _rescale(wx, wy, sx, sy)
+                denom, cross = dx * sy - dy * sx, wx * sy - wy * sx
+
+            t = cross / denom
+            if exponent:
+                # Undo the scaling, rounding distances past the largest float to infinity
+                t = ldexp(t, -exponent) if frexp(t)[1] - exponent <= 1024 else copysign(inf, t)
+
+            if 0 <= t <= best_t and (t < best_t or best < 0 or k < best):
+                u = (wx * dy - wy * dx) / denom
+                if 0 <= u <= 1:
+                    best_t, best = t, k
+
+        if best < 0:
+            continue
+
+        sx, sy = spans_x[best], spans_y[best]
+        nx, ny = _direction(-sy, sx, hypot(sx, sy))
+        if nx * dx + ny * dy > 0:
+            nx, ny = -nx, -ny
+
+        distances[i], indices[i] = best_t, best
+        xs[i], ys[i] = px + best_t * dx, py + best_t * dy
+        nxs[i], nys[i] = nx, ny
+
+    return RayHits(
+        distances,
+        VectorArray._wrap(_floats('d', xs), _floats('d', ys)),
+        VectorArray._wrap(_floats('d', nxs), _floats('d', nys)),
+        indices,
+    )
+
+
+def raycast_circles(origins: typing.Any, directions: typing.Any,
+                    centers: typing.Any, radii: typing.Any,
+                    max_distance: typing.Any = inf,
+                    index: typing.Optional[AABBTree] = None) -> RayHits:
+    """Find where rays first hit circles.
+
+    :param centers: the centers of the circles.
+    :param radii: the radii of the circles; a scalar, or one radius per circle.
+    :param index: an :py:class:`~ppb_vector.broadphase.AABBTree` of the circles,
+      made with :py:func:`circle_index`.
+
+    The other parameters are as in :py:func:`raycast_segments`.
+
+    >>> hits = raycast_circles([(0, 0), (0, 5)], (1, 0), [(5, 0), (5, 5)], [1, 2])
+    >>> list(hits.distances)
+    [4.0, 3.0]
+    >>> hits.normals
+    VectorArray([Vector(-1.0, 0.0), Vector(-1.0, 0.0)])
+
+    Rays which start inside a circle hit it at their origin, with a normal
+    opposite to their direction.
+    """
+    m, cxs, cys, radii = _broadcast_circles(centers, radii)
+
+    n, rays = _rays(origins, directions, max_distance)
+    distances, xs, ys, nxs, nys, indices = _results(n)
+    for i, (px, py, dx, dy, limit) in enumerate(rays):
+        best_t, best = limit, -1
+        for entry, k in _candidates(index, m, px, py, dx, dy, limit):
+            if entry > best_t:
+                break
+
+            wx, wy = px - cxs[k], py - cys[k]
+            distance, radius = hypot(wx, wy), radii[k]
+            if distance <= radius:
+                t = 0.0
+            else:
+                b = wx * dx + wy * dy
+                if b > 0:
+                    # The circle is behind the origin
+                    continue
+
+                # The distance from the center to the ray's line
+                offset = abs(wx * dy - wy * dx)
+                if offset > radius:
+                    continue
+
+                t = max(-b - sqrt((radius - offset) * (radius + offset)), 0.0)
+
+            if t <= best_t and (t < best_t or best < 0 or k < best):
+                best_t, best = t, k
+
+        if best < 0:
+            continue
+
+        x, y = px + best_t * dx, py + best_t * dy
+        nx, ny = x - cxs[best], y - cys[best]
+        length = hypot(nx, ny)
+        if best_t == 0 or not length:
+            nx, ny = -dx, -dy
+        else:
+            nx, ny = _direction(nx, ny, length)
+
+        distances[i], indices[i] = best_t, best
+        xs[i], ys[i] = x, y
+        nxs[i], nys[i] = nx, ny
+
+    return RayHits(
+        distances,
+        VectorArray._wrap(_floats('d', xs), _floats('d', ys)),
+        VectorArray._wrap(_floats('d', nxs), _floats('d', nys)),
+        indices,
+    )
+
+
+def segment_index(starts: typing.Any, ends: typing.Any) -> AABBTree:
+    """Build an :py:class:`~ppb_vector.broadphase.AABBTree` of segments, for raycasting.
+
+    The handle of each segment's box is its index.
+    """
+    _, [(qxs, qys), (exs, eys)] = _broadcast(starts, ends)
+    tree = AABBTree(margin=0)
+    for qx, qy, ex, ey in zip(qxs, qys, exs, eys):
+        tree.add((min(qx, ex), min(qy, ey)), (max(qx, ex), max(qy, ey)))
+
+    return tree
+
+
+def circle_index(centers: typing.Any, radii: typing.Any) -> AABBTree:
+    """Build an :py:class:`~ppb_vector.broadphase.AABBTree` of circles, for raycasting.
+
+    The handle of each circle's box is its index.
+    """
+    _, cxs, cys, radii = _broadcast_circles(centers, radii)
+    tree = AABBTree(margin=0)
+    for cx, cy, r in zip(cxs, cys, radii):
+        tree.add((cx - r, cy - r), (cx + r, cy + r))
+
+    return tree
@@ -0,0 +1,319 @@
+"""Recording of streams of vectors.
+
+A :py:class:`Recorder` logs vectors, such as the positions of entities at each
+tick, with optional timestamps and integer ids. Records are kept in packed,
+growable arrays, rather than as individual objects, and can be flushed to a
+binary file in chunks, so that long recordings use bounded memory:
+
+>>> import io
+>>> from ppb_vector.recorder import read_chunks, Recorder
+>>> file = io.BytesIO()
+>>> recorder = Recorder(file, timestamps=True, chunk_size=2)
+>>> recorder.record((0, 0), timestamp=0.0)
+>>> recorder.record_many([(1, 0), (0, 1)], timestamp=0.5)
+>>> recorder.flush()
+>>> [chunk.vectors for chunk in read_chunks(file)]
+[VectorArray([Vector(0.0, 0.0), Vector(1.0, 0.0)]), VectorArray([Vector(0.0, 1.0)])]
+
+The file format is a header, followed by any number of chunks. The header is
+the magic bytes ``PPBV``, a format version, a byte of flags (1 for timestamps,
+2 for ids), and the typecode of the coordinates. Each chunk is a record count,
+then the coordinates in the ``'planar'`` layout of :py:mod:`ppb_vector.codec`,
+then the timestamps (as 64-bit floats) and ids (as 64-bit signed integers),
+if present. Everything is little-endian.
+"""
+import io
+import mmap
+import struct
+import sys
+import typing
+from array import array
+from contextlib import contextmanager
+
+from ppb_vector import Vector, VectorLike
+from ppb_vector.codec import decode_array, encode_many
+from ppb_vector.packed import _broadcast_scalars, _check_typecode, VectorArray
+
+__all__ = ('Recorder', 'Chunk', 'read_chunks', 'load')
+
+_MAGIC = b'PPBV'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBBc')
+_COUNT = struct.Struct('<Q')
+
+_TIMESTAMPS = 1
+_IDS = 2
+
+
+class Chunk(typing.NamedTuple):
+    """Records read from a file, as parallel arrays."""
+    vectors: VectorArray
+    timestamps: typing.Optional[array]
+    ids: typing.Optional[array]
+
+
+def _little_endian(data: array) -> bytes:
+    if sys.byteorder == 'little':
+        return data.tobytes()
+
+    data = array(data.typecode, data)
+    data.byteswap()
+    return data.tobytes()
+
+
+def _from_little_endian(typecode: str, buffer: typing.Any) -> array:
+    data = array(typecode)
+    data.frombytes(buffer)
+    if sys.byteorder != 'little':
+        data.byteswap()
+
+    return data
+
+
+class Recorder:
+    """An append-only log of vectors, with optional timestamps and ids.
+
+    :param file: a binary file opened for writing, to flush records to.
+      By default, records are only kept in memory.
+    :param timestamps: whether each record has a timestamp.
+    :param ids: whether each record has an integer id, such as that of the entity
+      whose position is recorded.
+    :param typecode: the typecode of the coordinates, as in
+      :py:class:`~ppb_vector.packed.VectorArray`.
+    :param chunk_size: the number of records after which they are flushed to
+      ``file``, if any.
+
+    The records not flushed yet are available as parallel arrays: :py:attr:`vectors`,
+    and :py:attr:`timestamps` and :py:attr:`ids` if enabled (otherwise ``None``).
+    They grow geometrically, so that recording takes amortized constant time.
+    """
+    vectors: VectorArray
+    timestamps: typing.Optional[array]
+    ids: typing.Optional[array]
+    file: typing.Optional[typing.BinaryIO]
+    chunk_size: int
+    count: int
+
+    __slots__ = ('vectors', 'timestamps', 'ids', 'file', 'chunk_size', 'count')
+
+    def __init__(self, file: typing.Optional[typing.BinaryIO] = None, *,
+                 timestamps: bool = False, ids: bool = False,
+                 typecode: str = 'd', chunk_size: int = 65536):
+        _check_typecode(typecode)
+        self.chunk_size = int(chunk_size)
+        if self.chunk_size < 1:
+            raise ValueError("Recorder takes a positive chunk_size.")
+
+        self.vectors = VectorArray(typecode=typecode)
+        self.timestamps = array('d') if timestamps else None
+        self.ids = array('q') if ids else None
+        self.count = 0
+
+        self.file = file
+        if file is not None:
+            flags = (_TIMESTAMPS if timestamps else 0) | (_IDS if ids else 0)
+            file.write(_HEADER.pack(_MAGIC, _VERSION, flags, typecode.encode('ascii')))
+
+    def __len__(self) -> int:
+        """The number of records not flushed yet."""
+        return len(self.vectors)
+
+    def __enter__(self) -> 'Recorder':
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.flush()
+
+    def _check_extras(self, timestamp: typing.Any, id: typing.Any) -> None:
+        if (timestamp is None) != (self.timestamps is None):
+            raise ValueError("Records must have a timestamp if and only if "
+                             "the recorder was created with timestamps=True")
+        if (id is None) != (self.ids is None):
+            raise ValueError("Records must have an id if and only if "
+                             "the recorder was created with ids=True")
+
+    def record(self, vector: VectorLike, timestamp: typing.Optional[float] = None,
+               id: typing.Optional[int] = None) -> None:
+        """Record a single vector."""
+        self._check_extras(timestamp, id)
+        # Convert everything first, so that a rejected record leaves the columns aligned
+        point = Vector._unpack(vector)
+        if self.timestamps is not None:
+            timestamp = float(timestamp)  # type: ignore
+        if self.ids is not None:
+            ids = array('q', [id])  # type: ignore  # Rejects non-integers and overflows
+
+        self.vectors.append(point)
+        if self.timestamps is not None:
+            self.timestamps.append(timestamp)  # type: ignore
+        if self.ids is not None:
+            self.ids.extend(ids)
+
+        self.count += 1
+        if len(self.vectors) >= self.chunk_size:
+            self.flush()
+
+    def record_many(self, vectors: typing.Iterable[VectorLike], timestamp: typing.Any = None,
+                    ids: typing.Optional[typing.Iterable[int]] = None) -> None:
+        """Record many vectors at once, such as the positions of all entities in a tick.
+
+        :param vectors: a :py:class:`~ppb_vector.packed.VectorArray`, or an iterable
+          of vector-likes.
+        :param timestamp: a single timestamp for all vectors, or one per vector.
+        :param ids: an iterable of ids, one per vector.
+        """
+        self._check_extras(timestamp, ids)
+        if not isinstance(vectors, VectorArray):
+            vectors = VectorArray(vectors, self.vectors.typecode)
+
+        n = len(vectors)
+        if timestamp is not None:
+            _, [timestamps] = _broadcast_scalars(timestamp, n=n)
+        if ids is not None:
+            ids = array('q', ids)
+            if len(ids) != n:
+                raise ValueError(f"Expected {n} ids, got {len(ids)}")
+
+        self.vectors.extend(vectors)
+        if self.timestamps is not None:
+            self.timestamps.extend(timestamps)
+        if self.ids is not None:
+            self.ids.extend(ids)  # type: ignore
+
+        self.count += n
+        if len(self.vectors) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the records not flushed yet to the file, in chunks of at most ``chunk_size``.
+
+        This does nothing if the recorder has no file.
+        """
+        file = self.file
+        if file is None:
+            return
+
+        vectors, timestamps, ids = self.vectors, self.timestamps, self.ids
+        typecode = vectors.typecode
+        for start in range(0, len(vectors), self.chunk_size):
+            stop = start + self.chunk_size
+            chunk = vectors[start:stop]
+            file.write(_COUNT.pack(len(chunk)))
+            file.write(encode_many(chunk, typecode, 'little', 'planar'))
+            if timestamps is not None:
+                file.write(_little_endian(timestamps[start:stop]))
+            if ids is not None:
+                file.write(_little_endian(ids[start:stop]))
+
+        self.vectors = VectorArray(typecode=typecode)
+        if timestamps is not None:
+            self.timestamps = array('d')
+        if ids is not None:
+            self.ids = array('q')
+
+
+@contextmanager
+def _mapped(file: typing.Union[str, typing.BinaryIO]) -> typing.Iterator[typing.Any]:
+    """Map a recording into memory, or read it if it cannot be mapped."""
+    if isinstance(file, str):
+        with open(file, 'rb') as f, _mapped(f) as buffer:
+            yield buffer
+        return
+
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, io.UnsupportedOperation, ValueError, OSError):
+        # Not a real file, or an empty one
+        file.seek(0)
+        yield file.read()
+        return
+
+    with mapped:
+        yield mapped
+
+
+def _header(buffer: typing.Any) -> typing.Tuple[int, str]:
+    """Parse the header of a recording, and return its flags and typecode."""
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Not a vector recording: missing header")
+
+    magic, version, flags, typecode = _HEADER.unpack_from(buffer, 0)
+    if magic != _MAGIC:
+        raise ValueError("Not a vector recording: bad magic bytes")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported recording version {version}")
+
+    typecode = typecode.decode('ascii')
+    _check_typecode(typecode)
+    return flags, typecode
+
+
+def _chunks(buffer: typing.Any, flags: int, typecode: str) -> typing.Iterator[Chunk]:
+    itemsize = array(typecode).itemsize
+    offset = _HEADER.size
+    while offset < len(buffer):
+        if offset + _COUNT.size > len(buffer):
+            raise ValueError("Truncated vector recording")
+        n, = _COUNT.unpack_from(buffer, offset)
+        offset += _COUNT.size
+
+        extras = bool(flags & _TIMESTAMPS) + bool(flags & _IDS)
+        if offset + (2 * itemsize + 8 * extras) * n > len(buffer):
+            raise ValueError("Truncated vector recording")
+
+        # Slicing a memory map copies a single chunk, which bounds memory use
+        vectors = decode_array(buffer[offset:offset + 2 * n * itemsize], typecode,
+                               'little', 'planar')
+        offset += 2 * n * itemsize
+
+        timestamps = ids = None
+        if flags & _TIMESTAMPS:
+            timestamps = _from_little_endian('d', buffer[offset:offset + 8 * n])
+            offset += 8 * n
+        if flags & _IDS:
+            ids = _from_little_endian('q', buffer[offset:offset + 8 * n])
+            offset += 8 * n
+
+        yield Chunk(vectors, timestamps, ids)
+
+
+def read_chunks(file: typing.Union[str, typing.BinaryIO]) -> typing.Iterator[Chunk]:
+    """Read the chunks of records written by a :py:class:`Recorder`, one at a time.
+
+    :param file: a path, or a binary file opened for reading.
+
+    Files are memory-mapped when possible, so that reading a recording chunk by
+    chunk uses bounded memory, however large the file is.
+    """
+    with _mapped(file) as buffer:
+        flags, typecode = _header(buffer)
+        yield from _chunks(buffer, flags, typecode)
+
+
+def load(file: typing.Union[str, typing.BinaryIO]) -> Chunk:
+    """Read a whole recording, as a single :py:class:`Chunk`.
+
+    >>> import io
+    >>> file = io.BytesIO()
+    >>> with Recorder(file, ids=True, chunk_size=1) as recorder:
+    ...     recorder.record_many([(1, 2), (3, 4)], ids=[7, 8])
+    >>> vectors, timestamps, ids = load(file)
+    >>> vectors
+    VectorArray([Vector(1.0, 2.0), Vector(3.0, 4.0)])
+    >>> ids
+    array('q', [7, 8])
+    """
+    with _mapped(file) as buffer:
+        flags, typecode = _header(buffer)
+        vectors = VectorArray(typecode=typecode)
+        timestamps = array('d') if flags & _TIMESTAMPS else None
+        ids = array('q') if flags & _IDS else None
+
+        for chunk in _chunks(buffer, flags, typecode):
+            vectors.extend(chunk.vectors)
+            if timestamps is not None:
+                timestamps.extend(chunk.timestamps)  # type: ignore
+            if ids is not None:
+                ids.extend(chunk.ids)  # type: ignore
+
+    return Chunk(vectors, timestamps, ids)
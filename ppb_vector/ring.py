@@ -0,0 +1,152 @@
+"""Fixed-capacity histories of vectors.
+
+A :py:class:`VectorRing` keeps the last few vectors appended to it, such as the
+recent positions of an entity for drawing trails or lag compensation.
+It behaves like a :py:class:`collections.deque` with a ``maxlen``, but stores
+vectors in packed arrays, allocated once:
+
+>>> from ppb_vector.ring import VectorRing
+>>> trail = VectorRing(3)
+>>> for position in [(0, 0), (1, 0), (2, 1), (3, 3)]:
+...     trail.append(position)
+>>> trail
+VectorRing([Vector(1.0, 0.0), Vector(2.0, 1.0), Vector(3.0, 3.0)], capacity=3)
+>>> trail[-1]
+Vector(3.0, 3.0)
+"""
+import operator
+import typing
+from math import floor
+
+from ppb_vector import Vector, VectorLike
+from ppb_vector.interpolate import lerp
+from ppb_vector.packed import VectorArray
+
+__all__ = ('VectorRing',)
+
+
+class VectorRing:
+    """A ring buffer of vectors, which drops its oldest vector when full.
+
+    :param capacity: the maximum number of vectors held.
+    :param typecode: the typecode of the vectors' storage, as in
+      :py:class:`~ppb_vector.packed.VectorArray`.
+
+    Vectors are indexed from the oldest one, at index 0, to the most recent one,
+    at index -1. Appending takes constant time, whether the ring is full or not.
+
+    Each vector is stored twice, in a buffer of twice the capacity, so that the
+    vectors held are always contiguous in storage. This lets :py:meth:`unrolled`
+    return them, in order, without copying.
+    """
+    __slots__ = ('_data', '_capacity', '_start', '_size')
+
+    def __init__(self, capacity: int, typecode: str = 'd'):
+        self._capacity = operator.index(capacity)
+        if self._capacity < 1:
+            raise ValueError("VectorRing takes a positive capacity.")
+
+        self._data = VectorArray.zeros(2 * self._capacity, typecode)
+        self._start = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of vectors held."""
+        return self._capacity
+
+    @property
+    def typecode(self) -> str:
+        """The typecode of the vectors' storage: ``'f'`` or ``'d'``."""
+        return self._data.typecode
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        suffix = "" if self.typecode == 'd' else f", typecode={self.typecode!r}"
+        return f"VectorRing({list(self)}, capacity={self._capacity}{suffix})"
+
+    def _position(self, index: int) -> int:
+        index = operator.index(index)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("VectorRing index out of range")
+
+        return self._start + index
+
+    def __getitem__(self, index: int) -> Vector:
+        position = self._position(index)
+        return Vector(self._data.x[position], self._data.y[position])
+
+    def __iter__(self) -> typing.Iterator[Vector]:
+        return iter(self.unrolled())
+
+    def append(self, value: VectorLike) -> None:
+        """Append a vector, dropping the oldest one if the ring is full."""
+        x, y = Vector._unpack(value)
+        capacity = self._capacity
+
+        if self._size < capacity:
+            position = (self._start + self._size) % capacity
+            self._size += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % capacity
+
+        xs, ys = self._data.x, self._data.y
+        xs[position] = xs[position + capacity] = x
+        ys[position] = ys[position + capacity] = y
+
+    def extend(self, values: typing.Iterable[VectorLike]) -> None:
+        """Append vectors from an iterable."""
+        for value in values:
+            self.append(value)
+
+    def clear(self) -> None:
+        """Remove all vectors."""
+        self._start = self._size = 0
+
+    def unrolled(self) -> VectorArray:
+        """Return the vectors held, from the oldest to the newest.
+
+        The result is a view of the ring's storage, which can be passed to
+        batch operations without copying:
+
+        >>> ring = VectorRing(2)
+        >>> ring.extend([(1, 0), (0, 1), (-1, 0)])
+        >>> ring.unrolled() * 2
+        VectorArray([Vector(0.0, 2.0), Vector(-2.0, 0.0)])
+
+        The view shares the ring's storage, so later appends may overwrite its
+        contents; copy it with :py:meth:`~ppb_vector.packed.VectorArray.copy`
+        to keep it around.
+        """
+        return self._data[self._start:self._start + self._size]
+
+    def interpolate(self, index: typing.SupportsFloat) -> Vector:
+        """Linearly interpolate between vectors at a fractional index.
+
+        >>> ring = VectorRing(4)
+        >>> ring.extend([(0, 0), (2, 0), (2, 4)])
+        >>> ring.interpolate(0.5)
+        Vector(1.0, 0.0)
+        >>> ring.interpolate(-1.25)
+        Vector(2.0, 3.0)
+
+        As with indices, negative values count from the newest vector, at -1.
+        Values between -1 and 0 are not supported, as they would interpolate
+        between the newest and the oldest vectors.
+        """
+        index = float(index)
+        if index < 0:
+            index += self._size
+        if not 0 <= index <= self._size - 1:
+            raise IndexError("VectorRing index out of range")
+
+        i = floor(index)
+        if i == index:
+            return self[i]
+
+        return lerp(self[i], self[i + 1], index - i)
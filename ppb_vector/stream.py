@@ -0,0 +1,120 @@
+"""Batching of asynchronous streams of vectors.
+
+Network code typically receives vectors one at a time, such as position updates
+read from a socket. :py:func:`batches` groups them into
+:py:class:`~ppb_vector.packed.VectorArray`, so that they can be processed with
+batch operations rather than one :py:class:`Vector` at a time:
+
+>>> import asyncio
+>>> from ppb_vector.stream import batches
+>>> async def main():
+...     updates = asyncio.Queue()
+...     for update in [(1, 0), (0, 2), (3, 4), None]:
+...         updates.put_nowait(update)
+...
+...     async for batch in batches(updates, max_size=2):
+...         print(batch)
+>>> loop = asyncio.new_event_loop()
+>>> loop.run_until_complete(main())
+VectorArray([Vector(1.0, 0.0), Vector(0.0, 2.0)])
+VectorArray([Vector(3.0, 4.0)])
+>>> loop.close()
+"""
+import asyncio
+import typing
+
+from ppb_vector import VectorLike
+from ppb_vector.packed import _check_typecode, VectorArray
+
+__all__ = ('batches',)
+
+Source = typing.Union['asyncio.Queue[typing.Any]', typing.AsyncIterable[VectorLike]]
+
+
+async def _feed(source: typing.AsyncIterable[VectorLike],
+                queue: 'asyncio.Queue[typing.Any]') -> None:
+    """Move the items of an async iterable into a queue, followed by ``None``."""
+    try:
+        async for item in source:
+            await queue.put(item)
+    finally:
+        queue.put_nowait(None)
+
+
+async def batches(source: Source, max_size: int = 1024,
+                  max_delay: typing.Optional[float] = None,
+                  transform: typing.Optional[typing.Callable[[VectorArray], typing.Any]] = None,
+                  typecode: str = 'd') -> typing.AsyncIterator[typing.Any]:
+    """Group the vector-likes from an asynchronous source into batches.
+
+    :param source: an :py:class:`asyncio.Queue`, in which ``None`` marks the
+      end of the stream, or an asynchronous iterable.
+    :param max_size: the maximum number of vectors in a batch.
+    :param max_delay: how long to wait, after receiving a vector, for more
+      vectors to fill its batch. By default, a batch is made of whatever vectors
+      are already available, without waiting.
+    :param transform: a function applied to each batch, such as a batch method
+      of :py:class:`~ppb_vector.packed.VectorArray`; its results are yielded
+      instead of the batches.
+    :param typecode: the typecode of the batches, as in
+      :py:class:`~ppb_vector.packed.VectorArray`.
+
+    This yields control to the event loop after each batch, so that a large
+    burst of vectors is processed in several chunks of ``max_size`` vectors,
+    without blocking other tasks for its whole duration.
+    """
+    max_size = int(max_size)
+    if max_size < 1:
+        raise ValueError("Batches must hold at least one vector.")
+
+    _check_typecode(typecode)
+
+    feeder: typing.Optional['asyncio.Future[None]'] = None
+    if isinstance(source, asyncio.Queue):
+        queue = source
+    else:
+        queue = asyncio.Queue()
+        feeder = asyncio.ensure_future(_feed(source, queue))
+
+    loop = asyncio.get_event_loop()
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+
+            batch = VectorArray(typecode=typecode)
+            batch.append(item)
+            deadline = None if max_delay is None else loop.time() + max_delay
+
+            while len(batch) < max_size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = None if deadline is None else deadline - loop.time()
+                    if timeout is None or timeout <= 0:
+                        break
+
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                if item is None:
+                    break
+
+                batch.append(item)
+
+            yield batch if transform is None else transform(batch)
+            if item is None:
+                break
+
+            await asyncio.sleep(0)
+
+        if feeder is not None:
+            # Raise the exceptions from the source, if any
+            await feeder
+
+    finally:
+        if feeder is not None:
+            feeder.cancel()
@@ -0,0 +1,91 @@
+"""Reflection against fixed surfaces.
+
+:py:meth:`Vector.reflect` validates its surface normal on every call. When the
+same surfaces are used again and again, such as the walls of a level,
+a :py:class:`Surface` validates its normal once and reflects single vectors or
+whole :py:class:`~ppb_vector.packed.VectorArray` with no further checks.
+"""
+import typing
+from math import isclose
+
+from ppb_vector import Vector, VectorLike
+from ppb_vector.packed import _store, VectorArray
+
+__all__ = ('Surface',)
+
+
+class Surface:
+    """A surface going through the origin, described by its normal vector.
+
+    :param normal: A :py:class:`Vector` or a vector-like, of unit length.
+
+    >>> from ppb_vector.surface import Surface
+    >>> wall = Surface( (-1, 0) )
+    >>> wall.reflect( (5, 3) )
+    Vector(-5.0, 3.0)
+
+    Reflecting against a :py:class:`Surface` gives exactly the same results as
+    :py:meth:`Vector.reflect`:
+
+    >>> floor = Surface( Vector(-1, -2).normalize() )
+    >>> assert floor.reflect( (5, 3) ) == Vector(5, 3).reflect(floor.normal)
+    """
+    __slots__ = ('_normal', '_normal_x', '_normal_y')
+
+    def __init__(self, normal: VectorLike):
+        normal = Vector(normal)
+        if not isclose(normal.length, 1):
+            raise ValueError("Reflection requires a normalized vector.")
+
+        self._normal = normal
+        self._normal_x, self._normal_y = normal.x, normal.y
+
+    @property
+    def normal(self) -> Vector:
+        """The unit normal of the surface, which cannot be changed."""
+        return self._normal
+
+    def __repr__(self) -> str:
+        return f"Surface({self.normal!r})"
+
+    def reflect(self, vector: VectorLike) -> Vector:
+        """Reflect a vector against the surface, like :py:meth:`Vector.reflect`.
+
+        :param vector: A :py:class:`Vector` or a vector-like.
+        """
+        if isinstance(vector, Vector):
+            x, y = vector.x, vector.y
+        else:
+            x, y = Vector._unpack(vector)
+
+        normal_x, normal_y = self._normal_x, self._normal_y
+        d = 2 * (x * normal_x + y * normal_y)
+        return Vector(x - d * normal_x, y - d * normal_y)
+
+    def reflect_many(self, vectors: typing.Iterable[VectorLike],
+                     out: typing.Optional[VectorArray] = None) -> VectorArray:
+        """Reflect many vectors against the surface.
+
+        :param vectors: a :py:class:`~ppb_vector.packed.VectorArray`,
+          or an iterable of vector-likes.
+        :param out: a :py:class:`~ppb_vector.packed.VectorArray` in which
+          the results are stored, instead of a new array. It can be
+          ``vectors`` itself, to reflect them in place.
+
+        >>> from ppb_vector.packed import VectorArray
+        >>> velocities = VectorArray([(5, 3), (-1, 1)])
+        >>> Surface( (-1, 0) ).reflect_many(velocities, out=velocities)
+        VectorArray([Vector(-5.0, 3.0), Vector(1.0, 1.0)])
+        >>> velocities
+        VectorArray([Vector(-5.0, 3.0), Vector(1.0, 1.0)])
+        """
+        if not isinstance(vectors, VectorArray):
+            vectors = VectorArray(vectors)
+
+        normal_x, normal_y = self._normal_x, self._normal_y
+        ds = [2 * (x * normal_x + y * normal_y) for x, y in zip(vectors.x, vectors.y)]
+        return _store(
+            out, vectors.typecode,
+            [x - d * normal_x for x, d in zip(vectors.x, ds)],
+            [y - d * normal_y for y, d in zip(vectors.y, ds)],
+        )
@@ -0,0 +1,274 @@
+"""Batch evaluation of tweens.
+
+A tween moves a value from a start vector to an end vector over some duration,
+following an easing curve. Rather than having each sprite or widget update its
+own tween every frame, a :py:class:`TweenScheduler` stores all active tweens in
+packed arrays and advances them together:
+
+>>> from ppb_vector.tween import TweenScheduler, ease_in
+>>> tweens = TweenScheduler()
+>>> slide = tweens.add((0, 0), (10, 0), duration=2)
+>>> fall = tweens.add((0, 10), (0, 0), duration=1, easing=ease_in)
+>>> tweens.step(0.5)
+{}
+>>> tweens[slide], tweens[fall]
+(Vector(2.5, 0.0), Vector(0.0, 7.5))
+
+Tweens which reach their end are retired, and returned by :py:meth:`~TweenScheduler.step`
+along with their final value:
+
+>>> tweens.step(0.5)
+{1: Vector(0.0, 0.0)}
+>>> len(tweens)
+1
+
+Easing curves are functions mapping the fraction of the duration elapsed,
+between 0 and 1, to the fraction of the way from start to end. They must map
+0 to 0 and 1 to 1. This module provides a few common curves, but any such
+function can be used.
+"""
+import itertools
+import typing
+from array import array
+from bisect import bisect_right
+
+from ppb_vector import Vector, VectorLike
+from ppb_vector.packed import _check_typecode, _floats, _store, VectorArray
+
+__all__ = (
+    'TweenScheduler',
+    'linear', 'ease_in', 'ease_out', 'ease_in_out', 'smoothstep',
+)
+
+Easing = typing.Callable[[float], float]
+BatchEasing = typing.Callable[[typing.List[float]], typing.List[float]]
+
+
+def linear(t: float) -> float:
+    """Move at a constant rate."""
+    return t
+
+
+def ease_in(t: float) -> float:
+    """Start slowly, and accelerate (quadratically)."""
+    return t * t
+
+
+def ease_out(t: float) -> float:
+    """Start quickly, and decelerate (quadratically)."""
+    return t * (2 - t)
+
+
+def ease_in_out(t: float) -> float:
+    """Accelerate over the first half, and decelerate over the second one."""
+    if t < 0.5:
+        return 2 * t * t
+
+    u = 1 - t
+    return 1 - 2 * u * u
+
+
+def smoothstep(t: float) -> float:
+    """Accelerate then decelerate, following a cubic curve."""
+    return t * t * (3 - 2 * t)
+
+
+# Batch forms of the built-in easing curves, which compute the same values
+#  without a Python call per tween.
+_BATCH_EASINGS: typing.Dict[Easing, BatchEasing] = {
+    linear: list,
+    ease_in: lambda ts: [t * t for t in ts],
+    ease_out: lambda ts: [t * (2 - t) for t in ts],
+    ease_in_out: lambda ts: [2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t) for t in ts],
+    smoothstep: lambda ts: [t * t * (3 - 2 * t) for t in ts],
+}
+
+
+def _batch_easing(easing: Easing) -> BatchEasing:
+    """Get a function evaluating an easing curve over a list of progress values."""
+    batch = _BATCH_EASINGS.get(easing)
+    if batch is not None:
+        return batch
+
+    return lambda ts: list(map(easing, ts))
+
+
+class TweenScheduler:
+    """A collection of tweens, advanced together.
+
+    :param typecode: the typecode of the vectors' storage, as in
+      :py:class:`~ppb_vector.packed.VectorArray`.
+
+    Each tween is identified by the handle returned by :py:meth:`add`, which
+    remains valid until the tween finishes or is cancelled. The current values
+    of all tweens are kept in :py:attr:`values`, in no particular order.
+
+    Tweens are stored in groups of consecutive slots, one per easing curve, so
+    that each curve is evaluated once per step over the progress of its whole
+    group. The built-in curves are evaluated without any per-tween function call;
+    other curves are called once per tween. Adding or removing a tween moves at
+    most one tween per group, so that the arrays stay packed and grouped.
+    """
+    values: VectorArray
+
+    __slots__ = (
+        'values', '_starts', '_ends', '_durations', '_elapsed', '_handles', '_slots',
+        '_easings', '_batches', '_group_ends', '_counter',
+    )
+
+    def __init__(self, typecode: str = 'd'):
+        _check_typecode(typecode)
+        self.values = VectorArray(typecode=typecode)
+        self._starts = VectorArray(typecode=typecode)
+        self._ends = VectorArray(typecode=typecode)
+        self._durations: array = _floats('d')
+        self._elapsed: array = _floats('d')
+        self._handles: typing.List[int] = []
+        self._slots: typing.Dict[int, int] = {}
+        # The easing curves of the groups, their batch forms, and the slots
+        #  at which the groups end.
+        self._easings: typing.List[Easing] = []
+        self._batches: typing.List[BatchEasing] = []
+        self._group_ends: typing.List[int] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, handle: typing.Any) -> bool:
+        return handle in self._slots
+
+    def __getitem__(self, handle: int) -> Vector:
+        """Get the current value of a tween."""
+        return self.values[self._slots[handle]]
+
+    def _columns(self) -> typing.Tuple[typing.MutableSequence[typing.Any], ...]:
+        return (
+            self.values.x, self.values.y, self._starts.x, self._starts.y,
+            self._ends.x, self._ends.y, self._durations, self._elapsed, self._handles,
+        )
+
+    def _move(self, source: int, target: int) -> None:
+        """Move the tween in the source slot to the target slot, overwriting it."""
+        if source == target:
+            return
+
+        for column in self._columns():
+            column[target] = column[source]
+        self._slots[self._handles[target]] = target
+
+    def add(self, start: VectorLike, end: VectorLike, duration: typing.SupportsFloat,
+            easing: Easing = linear) -> int:
+        """Start a new tween, and return its handle.
+
+        :param start: the value of the tween when it starts.
+        :param end: the value of the tween when ``duration`` has elapsed.
+        :param easing: the easing curve followed by the tween.
+        """
+        duration = float(duration)
+        if not duration >= 0:
+            raise ValueError("Tweens take a non-negative duration.")
+
+        if easing in self._easings:
+            group = self._easings.index(easing)
+        else:
+            group = len(self._easings)
+            self._easings.append(easing)
+            self._batches.append(_batch_easing(easing))
+            self._group_ends.append(len(self._handles))
+
+        # Append a slot, and make room for the tween at the end of its group by
+        #  moving the first tween of each following group to the end of that group.
+        handle = next(self._counter)
+        slot = len(self._handles)
+        for column in self._columns():
+            column.append(column[0] if slot else 0)  # type: ignore
+        for following in reversed(range(group + 1, len(self._group_ends))):
+            first = self._group_ends[following - 1]
+            self._move(first, slot)
+            slot = first
+
+        group_ends = self._group_ends
+        for following in range(group, len(group_ends)):
+            group_ends[following] += 1
+
+        start_x, start_y = Vector._unpack(start)
+        end_x, end_y = Vector._unpack(end)
+        self.values.x[slot], self.values.y[slot] = start_x, start_y
+        self._starts.x[slot], self._starts.y[slot] = start_x, start_y
+        self._ends.x[slot], self._ends.y[slot] = end_x, end_y
+        self._durations[slot] = duration
+        self._elapsed[slot] = 0.0
+        self._handles[slot] = handle
+        self._slots[handle] = slot
+        return handle
+
+    def cancel(self, handle: int) -> Vector:
+        """Stop a tween, and return its current value.
+
+        Raise :py:exc:`KeyError` if there is no such tween.
+        """
+        value = self[handle]
+        self._remove(self._slots[handle])
+        return value
+
+    def _remove(self, slot: int) -> None:
+        """Remove a tween, only moving tweens from slots after its own."""
+        del self._slots[self._handles[slot]]
+
+        # Fill the hole with the last tween of its group, then the hole left
+        #  by that tween with the last tween of the following group, and so on.
+        group_ends = self._group_ends
+        group = bisect_right(group_ends, slot)
+        for following in range(group, len(group_ends)):
+            last = group_ends[following] - 1
+            self._move(last, slot)
+            slot = last
+            group_ends[following] -= 1
+
+        for column in self._columns():
+            column.pop()
+
+        if group_ends[group] == (group_ends[group - 1] if group else 0):
+            # Forget the curves of empty groups, which may be one-off functions
+            del self._easings[group], self._batches[group], group_ends[group]
+
+    def step(self, dt: typing.SupportsFloat) -> typing.Dict[int, Vector]:
+        """Advance all tweens by ``dt``.
+
+        Return the tweens which finished during this step, as a dictionary
+        mapping their handles to their final values.
+        """
+        dt = float(dt)
+        # Update in place, reusing the storage
+        self._elapsed[:] = _floats('d', [elapsed + dt for elapsed in self._elapsed])
+
+        ts = [
+            elapsed / duration if elapsed < duration else 1.0
+            for elapsed, duration in zip(self._elapsed, self._durations)
+        ]
+        fractions: typing.List[float] = []
+        group_start = 0
+        for batch, group_end in zip(self._batches, self._group_ends):
+            fractions += batch(ts[group_start:group_end])
+            group_start = group_end
+
+        # See ppb_vector.interpolate.lerp
+        starts, ends = self._starts, self._ends
+        _store(self.values, self.values.typecode, [
+            (1 - f) * start_x + f * end_x
+            for start_x, end_x, f in zip(starts.x, ends.x, fractions)
+        ], [
+            (1 - f) * start_y + f * end_y
+            for start_y, end_y, f in zip(starts.y, ends.y, fractions)
+        ])
+
+        finished = {}
+        # Retire tweens from the end, so that the ones moved into their slots
+        #  have already been checked.
+        for slot in reversed(range(len(ts))):
+            if ts[slot] >= 1.0:
+                finished[self._handles[slot]] = self.values[slot]
+                self._remove(slot)
+
+        return finished
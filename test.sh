@@ -10,5 +10,5 @@ else
 fi
 
 
-run ${PY} -m doctest README.md ppb_vector/__init__.py
+run ${PY} -m doctest README.md ppb_vector/__init__.py ppb_vector/codec.py ppb_vector/packed.py ppb_vector/geometry.py ppb_vector/surface.py ppb_vector/integrate.py ppb_vector/interpolate.py ppb_vector/tween.py ppb_vector/stream.py ppb_vector/memo.py ppb_vector/ring.py ppb_vector/recorder.py ppb_vector/broadphase.py ppb_vector/raycast.py ppb_vector/narrowphase.py
 run ${PY} -m pytest "${PYTEST_OPTIONS[@]}"
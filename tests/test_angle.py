@@ -1,8 +1,12 @@
+from math import atan2, degrees
+
+import hypothesis.strategies as st
 import pytest  # type: ignore
-from hypothesis import assume, given
+from hypothesis import assume, example, given
 
 from ppb_vector import Vector
-from utils import angle_isclose, floats, vectors
+from ppb_vector.packed import angles, headings, VectorArray
+from utils import angle_isclose, floats, UNIT_X, vectors
 
 
 data = [
@@ -55,3 +59,39 @@ def test_angle_aligned(x: Vector, scalar: float):
     assume(scalar != 0)
     y = scalar * x
     assert angle_isclose(x.angle(y), 0 if scalar > 0 else 180)
+
+
+def reference_angle(left: Vector, right: Vector) -> float:
+    """The two-atan2 implementation of Vector.angle, prior to ppb-vector 1.1."""
+    rv = degrees(atan2(right.x, -right.y) - atan2(left.x, -left.y))
+    if rv <= -180:
+        rv += 360
+    elif rv > 180:
+        rv -= 360
+
+    return rv
+
+
+@given(left=vectors(), right=vectors())
+@example(left=Vector(1e200, 0), right=Vector(0, 1e200))
+@example(left=Vector(1e-200, 0), right=Vector(1e-200, 1e-200))
+@example(left=Vector(0, 0), right=Vector(1, 1))
+def test_angle_reference(left: Vector, right: Vector):
+    """Vector.angle agrees with the two-atan2 implementation."""
+    assert angle_isclose(left.angle(right), reference_angle(left, right))
+
+
+@given(left=st.lists(vectors()), right=vectors())
+def test_angles_batch(left, right):
+    """ppb_vector.packed.angles agrees with Vector.angle."""
+    expected = [v.angle(right) for v in left]
+    assert angles(left, right).tolist() == expected
+    assert VectorArray(left).angle([right] * len(left)).tolist() == expected
+
+
+@given(vs=st.lists(vectors()))
+def test_headings(vs):
+    result = headings(vs)
+    assert result.typecode == 'd'
+    assert result.tolist() == [UNIT_X.angle(v) for v in vs]
+    assert all(-180 < h <= 180 for h in result)
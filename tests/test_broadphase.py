@@ -0,0 +1,238 @@
+import typing
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.broadphase import _contains, _union, AABBTree, SweepAndPrune
+from ppb_vector.packed import VectorArray
+
+coordinates = st.integers(-20, 20).map(float)  # Small integers, for many ties and overlaps
+sizes = st.integers(0, 8).map(float)
+boxes = st.tuples(coordinates, coordinates, sizes, sizes).map(
+    lambda box: (Vector(box[0], box[1]), Vector(box[0] + box[2], box[1] + box[3])),
+)
+
+
+def overlap(a: typing.Tuple[Vector, Vector], b: typing.Tuple[Vector, Vector]) -> bool:
+    (a_min, a_max), (b_min, b_max) = a, b
+    return all(a_min[k] <= b_max[k] and b_min[k] <= a_max[k] for k in range(2))
+
+
+def overlapping(corners: typing.Dict[int, typing.Tuple[Vector, Vector]]) -> typing.Set:
+    return {
+        (a, b) for a in corners for b in corners
+        if a < b and overlap(corners[a], corners[b])
+    }
+
+
+@given(initial=st.lists(boxes, max_size=40), data=st.data())
+def test_sweep_and_prune(initial, data):
+    """SweepAndPrune reports the same overlaps as a brute-force search, across steps."""
+    sap = SweepAndPrune()
+    corners = {sap.add(*box): box for box in initial}
+    previous: typing.Set = set()
+
+    for _ in range(4):
+        for handle in data.draw(st.lists(st.sampled_from(sorted(corners)) if corners
+                                         else st.nothing(), unique=True)):
+            if data.draw(st.booleans()):
+                corners[handle] = data.draw(boxes)
+                sap.move(handle, *corners[handle])
+            else:
+                del corners[handle]
+                sap.remove(handle)
+
+        for box in data.draw(st.lists(boxes, max_size=20)):
+            corners[sap.add(*box)] = box
+
+        began, ended = sap.step()
+        expected = overlapping(corners)
+        assert sap.pairs == expected
+        assert began == expected - previous
+        assert ended == previous - expected
+        assert {handle: sap[handle] for handle in corners} == corners
+        previous = expected
+
+
+def test_sweep_and_prune_move_many():
+    sap = SweepAndPrune()
+    handles = [sap.add((x, 0), (x + 1, 1)) for x in range(0, 10, 2)]
+    assert sap.step() == (set(), set())
+
+    sap.move_many(handles, VectorArray([(x, 0) for x in range(5)]),
+                  [(x + 1, 1) for x in range(5)])
+    assert sap.step() == ({(0, 1), (1, 2), (2, 3), (3, 4)}, set())
+
+    sap.move_many(handles[:2], (20, 20), (21, 21))
+    assert sap.step() == (set(), {(1, 2)})
+    assert sap.pairs == {(0, 1), (2, 3), (3, 4)}
+
+
+def test_sweep_and_prune_touching():
+    sap = SweepAndPrune()
+    sap.add((0, 0), (1, 1))
+    sap.add((1, 1), (2, 2))
+    sap.add((0, 1.5), (0, 1.5))
+    assert sap.step() == ({(0, 1)}, set())
+
+
+def test_sweep_and_prune_errors():
+    sap = SweepAndPrune()
+    with pytest.raises(ValueError):
+        sap.add((1, 0), (0, 1))
+
+    with pytest.raises(ValueError):
+        sap.add((0, float('nan')), (1, 1))
+
+    handle = sap.add((0, 0), (1, 1))
+    with pytest.raises(ValueError):
+        sap.move(handle, (0, 2), (1, 1))
+
+    sap.remove(handle)
+    assert handle not in sap
+    with pytest.raises(KeyError):
+        sap.move(handle, (0, 0), (1, 1))
+
+    with pytest.raises(KeyError):
+        sap.remove(handle)
+
+
+def check_tree(tree: AABBTree) -> None:
+    """Check the structure of an AABBTree: nodes contain their children, and are balanced."""
+    def check(node: int) -> int:
+        children = tree._children[node]
+        if children is None:
+            assert tree._heights[node] == 0
+            return 1
+
+        first, second = children
+        assert tree._parents[first] == tree._parents[second] == node
+        assert abs(tree._heights[first] - tree._heights[second]) <= 1
+        assert tree._heights[node] == 1 + max(tree._heights[first], tree._heights[second])
+        assert tree._boxes[node] == _union(tree._boxes[first], tree._boxes[second])
+        return check(first) + check(second)
+
+    if tree._root >= 0:
+        assert tree._parents[tree._root] == -1
+        assert check(tree._root) == len(tree)
+    for handle, leaf in tree._leaves.items():
+        assert _contains(tree._boxes[leaf], tree._tight[handle])
+
+
+@given(initial=st.lists(boxes, max_size=40), data=st.data())
+def test_aabb_tree(initial, data):
+    """AABBTree queries agree with brute-force searches, as boxes are added, moved and removed."""
+    tree = AABBTree(margin=data.draw(st.sampled_from([0, 0.5, 4])))
+    corners = {tree.add(*box): box for box in initial}
+
+    for _ in range(3):
+        for handle in data.draw(st.lists(st.sampled_from(sorted(corners)) if corners
+                                         else st.nothing(), unique=True)):
+            if data.draw(st.booleans()):
+                corners[handle] = data.draw(boxes)
+                tree.move(handle, *corners[handle])
+            else:
+                del corners[handle]
+                tree.remove(handle)
+
+        for box in data.draw(st.lists(boxes, max_size=20)):
+            corners[tree.add(*box)] = box
+
+        check_tree(tree)
+        assert len(tree) == len(corners)
+        assert {handle: tree[handle] for handle in corners} == corners
+
+        point = Vector(data.draw(coordinates), data.draw(coordinates))
+        assert sorted(tree.query_point(point)) == sorted(
+            handle for handle, box in corners.items() if overlap(box, (point, point))
+        )
+
+        query = data.draw(boxes)
+        assert sorted(tree.query_box(*query)) == sorted(
+            handle for handle, box in corners.items() if overlap(box, query)
+        )
+
+        radius = data.draw(sizes)
+        assert sorted(tree.query_radius(point, radius)) == sorted(
+            handle for handle, (low, high) in corners.items()
+            if (point - Vector(min(max(point.x, low.x), high.x),
+                               min(max(point.y, low.y), high.y))).length <= radius
+        )
+
+
+@pytest.mark.parametrize("direction", [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-2, 1)])
+def test_aabb_tree_ray(direction):
+    tree = AABBTree()
+    tree.add((-0.5, -0.5), (0.5, 0.5))  # Contains the origin
+    for distance in [3, 1, 2]:
+        center = Vector(direction).scale_to(distance)
+        tree.add(center - (0.1, 0.1), center + (0.1, 0.1))
+    tree.add((10, 20), (11, 21))
+
+    hits = tree.query_ray((0, 0), direction)
+    assert [handle for _, handle in hits] == [0, 2, 3, 1]
+    assert hits[0][0] == 0
+    assert [d for d, _ in hits] == sorted(d for d, _ in hits)
+    assert hits[1][0] == pytest.approx(1 - 0.1 / max(map(abs, Vector(direction).normalize())))
+
+    assert [handle for _, handle in tree.query_ray((0, 0), direction, 2.5)] == [0, 2, 3]
+    assert tree.query_ray((20, 20), direction, 2.5) == []
+
+    with pytest.raises(ZeroDivisionError):
+        tree.query_ray((0, 0), (0, 0))
+
+
+def test_aabb_tree_fat():
+    """Small moves stay within the fat boxes, and do not update the tree."""
+    tree = AABBTree(margin=1)
+    handle = tree.add((0, 0), (1, 1))
+    assert not tree.move(handle, (0.5, 0.5), (1.5, 1.5))
+    assert tree.query_point((1.25, 1.25)) == [handle]
+    assert tree.query_point((0.25, 0.25)) == []
+    assert tree.move(handle, (5, 5), (6, 6))
+    assert tree.query_point((5, 5)) == [handle]
+
+
+@pytest.mark.parametrize("margin", [0, 1])
+def test_aabb_tree_move_in_place(margin):
+    """Moving a box to where it already is does not update the tree."""
+    tree = AABBTree(margin=margin)
+    handles = [tree.add((x, 0), (x + 1, 1)) for x in range(3)]
+    for handle in handles:
+        assert not tree.move(handle, (handle, 0), (handle + 1, 1))
+
+    assert tree.move(handles[0], (5, 5), (6, 6))
+    assert tree.query_point((5.5, 5.5)) == [handles[0]]
+
+
+def test_aabb_tree_height():
+    """The tree stays balanced as boxes are added in order, and moved across."""
+    tree = AABBTree()
+    handles = [tree.add((x, 0), (x + 1, 1)) for x in range(1024)]
+    assert tree.height <= 2 * 10
+
+    for handle in handles[::2]:
+        tree.move(handle, (-handle, 5), (-handle + 1, 6))
+    check_tree(tree)
+    assert tree.height <= 2 * 10
+
+    for handle in handles:
+        tree.remove(handle)
+    assert tree.height == -1
+    assert tree.query_point((0, 0)) == []
+
+
+def test_aabb_tree_errors():
+    with pytest.raises(ValueError):
+        AABBTree(margin=-1)
+
+    tree = AABBTree()
+    with pytest.raises(ValueError):
+        tree.add((1, 0), (0, 1))
+
+    handle = tree.add((0, 0), (1, 1))
+    tree.remove(handle)
+    with pytest.raises(KeyError):
+        tree.move(handle, (0, 0), (1, 1))
@@ -0,0 +1,112 @@
+import struct
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.codec import decode_array, decode_many, encode_many
+from ppb_vector.packed import VectorArray
+from utils import float32, vectors
+
+
+FORMATS = [
+    (typecode, byteorder)
+    for typecode in ('f', 'd')
+    for byteorder in ('little', 'big')
+]
+LAYOUTS = ('interleaved', 'planar')
+
+
+@pytest.mark.parametrize("typecode, byteorder", FORMATS)
+@given(v=vectors(max_magnitude=1e30))
+def test_bytes_roundtrip(typecode, byteorder, v: Vector):
+    data = v.to_bytes(typecode, byteorder)
+    expected = v if typecode == 'd' else float32(v)
+    assert Vector.from_bytes(data, typecode, byteorder) == expected
+
+
+@given(v=vectors())
+def test_bytes_struct(v: Vector):
+    """Vector.to_bytes matches the per-vector struct encoding."""
+    assert v.to_bytes() == struct.pack('<dd', *v)
+    assert v.to_bytes(byteorder='big') == struct.pack('>dd', *v)
+
+
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_bytes_buffers(buffer_type):
+    data = buffer_type(Vector(1, 2).to_bytes())
+    assert Vector.from_bytes(data) == (1, 2)
+    assert decode_many(data) == [Vector(1, 2)]
+
+
+@pytest.mark.parametrize("typecode, byteorder", [('q', 'little'), ('d', 'native')])
+def test_bytes_bad_format(typecode, byteorder):
+    with pytest.raises(ValueError):
+        Vector(1, 2).to_bytes(typecode, byteorder)
+
+    with pytest.raises(ValueError):
+        encode_many([Vector(1, 2)], typecode, byteorder)
+
+
+def test_bytes_bad_size():
+    with pytest.raises(ValueError):
+        Vector.from_bytes(bytes(15))
+
+    with pytest.raises(ValueError):
+        decode_many(bytes(24))
+
+
+def test_bytes_bad_layout():
+    with pytest.raises(ValueError):
+        encode_many([Vector(1, 2)], layout='striped')
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+@pytest.mark.parametrize("typecode, byteorder", FORMATS)
+@given(vs=st.lists(vectors(max_magnitude=1e30)))
+def test_many_roundtrip(typecode, byteorder, layout, vs):
+    data = encode_many(vs, typecode, byteorder, layout)
+    assert len(data) == len(vs) * len(Vector(0, 0).to_bytes(typecode))
+
+    expected = vs if typecode == 'd' else list(map(float32, vs))
+    assert decode_many(data, typecode, byteorder, layout) == expected
+
+
+@pytest.mark.parametrize("typecode, byteorder", FORMATS)
+@given(vs=st.lists(vectors()))
+def test_many_interleaved(typecode, byteorder, vs):
+    """Interleaved encoding is the concatenation of Vector.to_bytes."""
+    vs = [float32(v) for v in vs] if typecode == 'f' else vs
+    expected = b''.join(v.to_bytes(typecode, byteorder) for v in vs)
+    assert encode_many(vs, typecode, byteorder) == expected
+
+
+@given(vs=st.lists(vectors()))
+def test_many_planar(vs):
+    data = encode_many(vs, layout='planar')
+    n = len(vs)
+    assert struct.unpack(f'<{2 * n}d', data) == tuple(v.x for v in vs) + tuple(v.y for v in vs)
+
+
+def test_many_vector_likes():
+    assert decode_many(encode_many([(1, 2), [3, 4], {'x': 5, 'y': 6}])) == [
+        Vector(1, 2), Vector(3, 4), Vector(5, 6),
+    ]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+@pytest.mark.parametrize("typecode, byteorder", FORMATS)
+@given(vs=st.lists(vectors(max_magnitude=1e30)))
+def test_array_roundtrip(typecode, byteorder, layout, vs):
+    array = VectorArray(vs, typecode)
+    data = encode_many(array, typecode, byteorder, layout)
+    assert data == encode_many(vs, typecode, byteorder, layout)
+    assert decode_array(data, typecode, byteorder, layout) == array
+
+
+def test_array_storage():
+    data = encode_many([(1, 2), (3, 4)])
+    array = decode_array(data, storage='f')
+    assert array.typecode == 'f'
+    assert list(array) == [Vector(1, 2), Vector(3, 4)]
@@ -0,0 +1,57 @@
+import hypothesis.strategies as st
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.packed import VectorArray
+from utils import isclose, UNIT_X, UNIT_Y, vectors
+
+
+def test_cross_axis():
+    assert UNIT_X.cross(UNIT_Y) == 1
+    assert UNIT_Y.cross(UNIT_X) == -1
+
+
+@given(x=vectors(), y=vectors())
+def test_cross_antisymmetric(x: Vector, y: Vector):
+    assert x.cross(y) == -y.cross(x)
+
+
+@given(x=vectors())
+def test_cross_self(x: Vector):
+    assert x.cross(x) == 0
+
+
+@given(x=vectors(), y=vectors())
+def test_cross_perp(x: Vector, y: Vector):
+    """x.cross(y) == x.perp() * y"""
+    assert x.cross(y) == x.perp() * y
+
+
+@given(x=vectors(max_magnitude=1e75), y=vectors(max_magnitude=1e75))
+def test_cross_angle(x: Vector, y: Vector):
+    """The sign of x × y is that of the angle from x to y.
+
+    Angles which are very close to ±180° may round to 180°, which is positive.
+    """
+    cross, angle = x.cross(y), x.angle(y)
+    if cross > 0:
+        assert angle >= 0
+    elif cross < 0:
+        assert angle <= 0 or angle == 180
+
+
+@given(x=vectors())
+def test_perp(x: Vector):
+    p = x.perp()
+    assert p.length == x.length
+    assert isclose(p * x, 0, rel_to=[x.length ** 2])
+    assert p.perp() == -x
+    assert p == x.rotate(90)
+
+
+@given(xs=st.lists(vectors()), y=vectors())
+def test_cross_batch(xs, y: Vector):
+    array = VectorArray(xs)
+    assert array.cross(y).tolist() == [x.cross(y) for x in xs]
+    assert array.cross(array).tolist() == [0.0] * len(xs)
+    assert array.perp().tolist() == [x.perp() for x in xs]
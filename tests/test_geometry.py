@@ -0,0 +1,263 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector
+from ppb_vector.geometry import (
+    convex_hull, pairs_within, pairwise_distance_blocks, pairwise_distances, points_in_polygon,
+    polygon_area, polygon_centroid, segment_intersections,
+)
+from ppb_vector.packed import VectorArray
+from utils import vectors
+
+
+segment_data = [
+    # a_start, a_end, b_start, b_end, expected
+    ((0, 0), (2, 2), (0, 2), (2, 0), (1, 1)),
+    ((0, 0), (1, 0), (1, 0), (1, 1), (1, 0)),  # Touching endpoints
+    ((0, 0), (1, 0), (0, 1), (1, 1), None),    # Parallel
+    ((0, 0), (2, 0), (1, 0), (3, 0), (1, 0)),  # Collinear & overlapping
+    ((3, 0), (0, 0), (1, 0), (2, 0), (2, 0)),  # Collinear, nearest to a's start
+    ((0, 0), (4, 0), (3, 0), (-1, 0), (0, 0)),  # Collinear, covering a's start
+    ((0, 0), (1, 0), (1, 0), (2, 0), (1, 0)),  # Collinear & touching
+    ((0, 0), (1, 0), (2, 0), (3, 0), None),    # Collinear & disjoint
+    ((1, 1), (1, 1), (0, 0), (2, 2), (1, 1)),  # Zero-length, on the other segment
+    ((0, 0), (2, 2), (1, 1), (1, 1), (1, 1)),  # Zero-length, on the first segment
+    ((1, 1), (1, 1), (1, 0), (2, 2), None),    # Zero-length, off the other segment
+    ((3, 3), (3, 3), (0, 0), (2, 2), None),    # Zero-length, on the line only
+    ((1, 2), (1, 2), (1, 2), (1, 2), (1, 2)),  # Equal points
+    ((1, 2), (1, 2), (2, 1), (2, 1), None),    # Distinct points
+    ((0, 0), (1, 0), (2, -1), (2, 1), None),   # Lines intersect, not segments
+    ((-1e200, -1e200), (1e200, 1e200), (-1e200, 1e200), (1e200, -1e200), (0, 0)),  # Huge
+    ((0, 0), (2e-200, 2e-200), (0, 2e-200), (2e-200, 0), (1e-200, 1e-200)),  # Tiny
+]
+
+
+@pytest.mark.parametrize("a_start, a_end, b_start, b_end, expected", segment_data)
+def test_segment_intersections(a_start, a_end, b_start, b_end, expected):
+    [mask], points = segment_intersections([a_start], [a_end], [b_start], [b_end])
+    assert mask == (expected is not None)
+    if mask:
+        assert points[0].isclose(expected, abs_tol=0, rel_tol=1e-9) or points[0] == expected
+    else:
+        assert points[0] != points[0]  # NaN
+
+
+def test_segment_intersections_broadcast():
+    mask, points = segment_intersections(
+        (0, 0), (4, 0), VectorArray([(1, 1), (5, 1)]), [(1, -1), (5, -1)],
+    )
+    assert mask == [True, False]
+    assert points[0] == (1, 0)
+
+    with pytest.raises(ValueError):
+        segment_intersections([(0, 0)], [(1, 1), (2, 2)], (0, 1), (1, 0))
+
+
+@given(segments=st.lists(st.tuples(*[vectors(max_magnitude=1e10)] * 4)))
+def test_segment_intersections_symmetric(segments):
+    a_starts, a_ends, b_starts, b_ends = (
+        [segment[k] for segment in segments] for k in range(4)
+    )
+    mask, points = segment_intersections(a_starts, a_ends, b_starts, b_ends)
+    swapped, _ = segment_intersections(b_starts, b_ends, a_starts, a_ends)
+    assert len(mask) == len(points) == len(segments)
+    assert mask == swapped
+
+
+@given(p=vectors(1e3), q=vectors(1e3), t=st.floats(0.01, 0.99), angle=st.floats(1, 179))
+def test_segment_intersections_point(p: Vector, q: Vector, t: float, angle: float):
+    """A segment through a point of another intersects it at that point."""
+    assume((q - p).length > 1e-3)
+    point = p + (q - p).scale_by(t)
+    direction = (q - p).rotate(angle)
+    [mask], points = segment_intersections(
+        [p], [q], [point - direction], [point + direction],
+    )
+    assert mask
+    assert points[0].isclose(point, abs_tol=1e-6, rel_to=[p, q])
+
+
+@given(p=st.tuples(st.integers(-100, 100), st.integers(-100, 100)),
+       d=st.tuples(st.integers(-10, 10), st.integers(-10, 10)),
+       i=st.integers(-10, 10), j=st.integers(-10, 10), k=st.integers(0, 10))
+def test_segment_intersections_collinear(p, d, i: int, j: int, k: int):
+    """Collinear segments intersect where they first overlap along the first one."""
+    p, d = Vector(p), Vector(d)
+    [mask], points = segment_intersections([p], [p + k * d], [p + i * d], [p + j * d])
+    if not d:
+        assert mask and points[0] == p
+        return
+
+    low, high = max(min(i, j), 0), min(max(i, j), k)
+    assert mask == (low <= high)
+    if mask:
+        assert points[0] == p + low * d
+
+
+square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+polygon_data = [
+    ((1, 1), True),
+    ((3, 1), False),
+    ((1, 3), False),
+    ((-1, -1), False),
+    ((1.999, 0.001), True),
+]
+
+
+@pytest.mark.parametrize("point, expected", polygon_data)
+def test_points_in_polygon(point, expected):
+    assert points_in_polygon([point], square) == [expected]
+    assert points_in_polygon([point], reversed(square)) == [expected]
+
+
+def test_points_in_polygon_concave():
+    arrow = [(0, 0), (4, 2), (0, 4), (1, 2)]
+    assert points_in_polygon([(0.5, 2), (2, 2), (3, 1)], arrow) == [False, True, False]
+
+
+@pytest.mark.parametrize("polygon", [[], [(0, 0)], [(0, 0), (1, 1)]])
+def test_points_in_polygon_degenerate(polygon):
+    assert points_in_polygon([(0, 0), (0.5, 0.5)], polygon) == [False, False]
+
+
+@given(y=st.floats(0, 2, exclude_max=True))
+def test_points_in_polygon_shared_edges(y):
+    """Points on the shared edge of two polygons are in exactly one of them."""
+    left = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    right = [(2, 0), (4, 0), (4, 2), (2, 2)]
+    assert points_in_polygon([(2, y)], left) != points_in_polygon([(2, y)], right)
+
+
+@given(a=st.lists(vectors(1e10), max_size=20), b=st.lists(vectors(1e10), max_size=20),
+       tile_size=st.integers(1, 8))
+def test_pairwise_distances(a, b, tile_size: int):
+    distances = pairwise_distances(a, b, tile_size)
+    assert list(distances) == [(p - q).length for p in a for q in b]
+
+    condensed = pairwise_distances(VectorArray(a), tile_size=tile_size)
+    assert list(condensed) == [(p - q).length for i, p in enumerate(a) for q in a[i + 1:]]
+
+
+@given(a=st.lists(vectors(1e10), max_size=20), b=st.lists(vectors(1e10), max_size=20),
+       tile_size=st.integers(1, 8))
+def test_pairwise_distance_blocks(a, b, tile_size: int):
+    """Blocks of rows, concatenated, are the whole distance matrix."""
+    for other in (b, None):
+        blocks = list(pairwise_distance_blocks(a, other, tile_size))
+        assert [start for start, _ in blocks] == list(range(0, len(a), tile_size))
+        assert all(len(distances) <= tile_size * len(a if other is None else b)
+                   for _, distances in blocks)
+        assert [d for _, distances in blocks for d in distances] == list(
+            pairwise_distances(a, other, tile_size))
+
+
+@given(a=st.lists(vectors(100), max_size=30), b=st.lists(vectors(100), max_size=30),
+       radius=st.floats(0, 200), tile_size=st.integers(1, 8))
+def test_pairs_within(a, b, radius: float, tile_size: int):
+    """pairs_within finds the same pairs as a brute-force search."""
+    i, j, distances = pairs_within(a, radius, b, tile_size)
+    assert sorted(zip(i, j, distances)) == [
+        (k, m, (p - q).length)
+        for k, p in enumerate(a) for m, q in enumerate(b)
+        if (p - q).length <= radius
+    ]
+
+    i, j, distances = pairs_within(VectorArray(a), radius, tile_size=tile_size)
+    assert sorted(zip(i, j, distances)) == [
+        (k, m, (a[k] - a[m]).length)
+        for k in range(len(a)) for m in range(k + 1, len(a))
+        if (a[k] - a[m]).length <= radius
+    ]
+
+
+def test_pairs_within_non_finite():
+    nan, inf = float('nan'), float('inf')
+    i, j, distances = pairs_within([(0, 0), (nan, 0), (inf, 0), (0, 1), (0, 0)], 1)
+    assert sorted(zip(i, j, distances)) == [(0, 3, 1.0), (0, 4, 0.0), (3, 4, 1.0)]
+
+
+def shoelace(polygon):
+    """Compute the signed area of a polygon, with Vector math."""
+    return sum(polygon[i - 1].cross(polygon[i]) for i in range(len(polygon))) / 2
+
+
+@given(polygon=st.lists(vectors(100), max_size=20), offset=vectors(1e3))
+def test_polygon_area(polygon, offset: Vector):
+    area = polygon_area(polygon)
+    assert area == pytest.approx(shoelace(polygon), abs=1e-9)
+    assert polygon_area(polygon[::-1]) == pytest.approx(-area, abs=1e-9)
+
+    # The area does not depend on the polygon's position
+    assert polygon_area([p + offset for p in polygon]) == pytest.approx(area, abs=1e-6)
+
+
+@given(triangle=st.lists(vectors(100), min_size=3, max_size=3))
+def test_polygon_centroid_triangle(triangle):
+    assume(abs(polygon_area(triangle)) > 1e-3)
+    mean = sum(triangle, Vector(0, 0)) / 3
+    assert polygon_centroid(triangle).isclose(mean, abs_tol=1e-6)
+
+
+def test_polygon_centroid():
+    # An L shape, made of a 2x1 and a 1x1 rectangles
+    polygon = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+    assert polygon_area(polygon) == 3
+    assert polygon_centroid(polygon).isclose((5 / 6, 5 / 6))
+
+    far = [Vector(1e9, 1e9) + p for p in polygon]
+    assert polygon_centroid(far).isclose(Vector(1e9, 1e9) + (5 / 6, 5 / 6))
+
+
+@pytest.mark.parametrize("polygon", [[], [(1, 2)], [(0, 0), (1, 1)], [(0, 0), (1, 1), (2, 2)]])
+def test_polygon_centroid_degenerate(polygon):
+    assert polygon_area(polygon) == 0
+    with pytest.raises(ZeroDivisionError):
+        polygon_centroid(polygon)
+
+
+@given(points=st.lists(vectors(100), max_size=30))
+def test_convex_hull(points):
+    hull = list(convex_hull(points))
+    unique = {tuple(p) for p in points}
+    assert {tuple(p) for p in hull} <= unique
+    assert len({tuple(p) for p in hull}) == len(hull)
+    if len(unique) < 3:
+        assert sorted(map(tuple, hull)) == sorted(unique)
+        return
+
+    # The hull is convex, counter-clockwise, and contains all points
+    for i in range(len(hull)):
+        a, b = hull[i - 1], hull[i]
+        edge = b - a
+        scale = 1e-9 * edge.length * 100
+        assert edge.cross(hull[(i + 1) % len(hull)] - b) >= -scale
+        for p in points:
+            assert edge.cross(p - a) >= -scale
+
+    assert hull[0] == min(points, key=tuple)
+
+
+def test_convex_hull_collinear():
+    nan = float('nan')
+    points = [(1, 1), (0, 0), (3, 3), (2, 2), (nan, 0), (1, 1)]
+    assert list(convex_hull(points)) == [(0, 0), (3, 3)]
+    assert list(convex_hull([(1, 2), (1, 2)])) == [(1, 2)]
+    assert len(convex_hull([])) == 0
+
+
+@pytest.mark.parametrize("points", [
+    [(0, 0), (1e-310, 0)],
+    [(0, 5e-324), (0, 0), (5e-324, 5e-324)],
+    [(1e308, -1e308), (-1e308, 1e308), (1e308, 1e308 - 1e292)],
+])
+def test_pairs_within_extreme_spans(points):
+    """Points spanning tiny or huge ranges are tiled without overflows."""
+    points = [Vector(p) for p in points]
+    for tile_size in (1, 64):
+        i, j, distances = pairs_within(points, 1, tile_size=tile_size)
+        assert sorted(zip(i, j, distances)) == [
+            (k, m, (points[k] - points[m]).length)
+            for k in range(len(points)) for m in range(k + 1, len(points))
+            if (points[k] - points[m]).length <= 1
+        ]
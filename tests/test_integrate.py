@@ -0,0 +1,113 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.integrate import euler, FixedTimestep, semi_implicit_euler, verlet
+from ppb_vector.packed import VectorArray
+from utils import isclose, lengths, vectors
+
+
+particles = st.lists(st.tuples(vectors(1e10), vectors(1e10), vectors(1e10)))
+timesteps = st.floats(min_value=0, max_value=1)
+max_speeds = st.one_of(st.none(), lengths(max_value=1e10))
+
+
+def unpack(particles):
+    return [VectorArray(p[k] for p in particles) for k in range(3)]
+
+
+@given(particles=particles, dt=timesteps, max_speed=max_speeds)
+def test_euler(particles, dt, max_speed):
+    positions, velocities, accelerations = unpack(particles)
+    euler(positions, velocities, accelerations, dt, max_speed)
+
+    for (p, v, a), new_p, new_v in zip(particles, positions, velocities):
+        expected_v = v + a.scale_by(dt)
+        if max_speed is not None:
+            expected_v = expected_v.truncate(max_speed)
+        assert new_p == p + v.scale_by(dt)
+        assert new_v == expected_v
+
+
+@given(particles=particles, dt=timesteps, max_speed=max_speeds)
+def test_semi_implicit_euler(particles, dt, max_speed):
+    positions, velocities, accelerations = unpack(particles)
+    semi_implicit_euler(positions, velocities, accelerations, dt, max_speed)
+
+    for (p, v, a), new_p, new_v in zip(particles, positions, velocities):
+        expected_v = v + a.scale_by(dt)
+        if max_speed is not None:
+            expected_v = expected_v.truncate(max_speed)
+        assert new_v == expected_v
+        assert new_p == p + expected_v.scale_by(dt)
+
+
+@given(particles=particles, dt=timesteps, max_speed=max_speeds)
+def test_verlet(particles, dt, max_speed):
+    positions, previous, accelerations = unpack(particles)
+    verlet(positions, previous, accelerations, dt, max_speed)
+
+    for (p, q, a), new_p, new_q in zip(particles, positions, previous):
+        displacement = p - q + a.scale_by(dt * dt)
+        if max_speed is not None:
+            displacement = displacement.truncate(max_speed * dt)
+        assert new_q == p
+        assert new_p.isclose(p + displacement, rel_to=[p, q, displacement])
+
+
+@pytest.mark.parametrize("integrator", [euler, semi_implicit_euler, verlet])
+def test_integrate_broadcast(integrator):
+    """A single acceleration is applied to all particles."""
+    positions, velocities = VectorArray([(0, 0), (1, 1)]), VectorArray([(0, 0), (0, 0)])
+    gravity = Vector(0, -1)
+    integrator(positions, velocities, gravity, 1)
+
+    expected = VectorArray(positions)
+    positions, velocities = VectorArray([(0, 0), (1, 1)]), VectorArray([(0, 0), (0, 0)])
+    integrator(positions, velocities, [gravity] * 2, 1)
+    assert positions == expected
+
+
+@pytest.mark.parametrize("integrator", [euler, semi_implicit_euler, verlet])
+def test_integrate_errors(integrator):
+    with pytest.raises(TypeError):
+        integrator([(0, 0)], VectorArray([(0, 0)]), (0, 0), 1)
+
+    with pytest.raises(ValueError):
+        integrator(VectorArray([(0, 0)]), VectorArray([(0, 0)] * 2), (0, 0), 1)
+
+    with pytest.raises(ValueError):
+        integrator(VectorArray([(0, 0)]), VectorArray([(0, 0)]), (0, 0), 1, max_speed=-1)
+
+
+def test_integrate_storage():
+    """Arrays are updated in place."""
+    positions, velocities = VectorArray([(0, 0)]), VectorArray([(1, 1)], typecode='f')
+    storage = positions.x, positions.y, velocities.x, velocities.y
+    semi_implicit_euler(positions, velocities, (0, 0), 1)
+    assert (positions.x, positions.y, velocities.x, velocities.y) == storage
+    assert all(a is b for a, b in zip(storage, (positions.x, positions.y,
+                                                velocities.x, velocities.y)))
+
+
+@given(dt=st.floats(min_value=1e-3, max_value=1),
+       elapsed=st.lists(st.floats(min_value=0, max_value=1)))
+def test_fixed_timestep(dt, elapsed):
+    positions, velocities = VectorArray([(0, 0)]), VectorArray([(1, 0)])
+    physics = FixedTimestep(dt, euler)
+
+    steps = sum(physics.advance(e, positions, velocities, (0, 0)) for e in elapsed)
+    assert isclose(positions[0].x, steps * dt)
+    assert 0 <= physics.alpha < 1 + 1e-9
+    assert isclose(steps * dt + physics.accumulator, sum(elapsed), rel_to=[len(elapsed) * dt])
+
+
+def test_fixed_timestep_max_steps():
+    positions, velocities = VectorArray([(0, 0)]), VectorArray([(1, 0)])
+    physics = FixedTimestep(0.1, max_steps=3)
+    assert physics.advance(1, positions, velocities, (0, 0)) == 3
+    assert physics.alpha == 0
+
+    with pytest.raises(ValueError):
+        FixedTimestep(0)
@@ -0,0 +1,92 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector
+from ppb_vector.interpolate import (
+    cubic_bezier, cubic_bezier_many, lerp, lerp_many,
+    quadratic_bezier, quadratic_bezier_many, slerp, slerp_many,
+)
+from ppb_vector.packed import VectorArray
+from utils import angle_isclose, isclose, vectors
+
+
+params = st.floats(min_value=0, max_value=1)
+
+
+@given(a=vectors(1e75), b=vectors(1e75))
+def test_lerp_ends(a: Vector, b: Vector):
+    assert lerp(a, b, 0) == a
+    assert lerp(a, b, 1) == b
+
+
+@given(a=vectors(1e75), b=vectors(1e75), t=params)
+def test_lerp(a: Vector, b: Vector, t: float):
+    assert lerp(a, b, t).isclose(a + (b - a).scale_by(t), rel_to=[a, b])
+
+
+@given(a=vectors(1e10), b=vectors(1e10))
+def test_slerp_ends(a: Vector, b: Vector):
+    assert slerp(a, b, 0).isclose(a)
+    assert slerp(a, b, 1).isclose(b, rel_tol=1e-8, rel_to=[a])
+
+
+@given(a=vectors(1e10), b=vectors(1e10), t=params)
+def test_slerp_arc(a: Vector, b: Vector, t: float):
+    """slerp rotates at a constant rate, while interpolating lengths."""
+    assume(a.length > 1e-5 and b.length > 1e-5)
+    assume(not angle_isclose(a.angle(b), 180, epsilon=1e-3))
+    v = slerp(a, b, t)
+    assert isclose(v.length, (1 - t) * a.length + t * b.length, rel_tol=1e-8)
+    if v.length > 1e-5:
+        assert angle_isclose(a.angle(v), t * a.angle(b), epsilon=1e-5)
+
+
+def test_slerp_null():
+    assert slerp((0, 0), (2, 2), 0.5) == lerp((0, 0), (2, 2), 0.5)
+    assert slerp((2, 2), (0, 0), 0.25) == lerp((2, 2), (0, 0), 0.25)
+
+
+@given(p0=vectors(1e75), p1=vectors(1e75), p2=vectors(1e75), p3=vectors(1e75))
+def test_bezier_ends(p0: Vector, p1: Vector, p2: Vector, p3: Vector):
+    assert quadratic_bezier(p0, p1, p2, 0) == p0
+    assert quadratic_bezier(p0, p1, p2, 1) == p2
+    assert cubic_bezier(p0, p1, p2, p3, 0) == p0
+    assert cubic_bezier(p0, p1, p2, p3, 1) == p3
+
+
+@given(p0=vectors(1e10), p1=vectors(1e10), p2=vectors(1e10), p3=vectors(1e10), t=params)
+def test_bezier_de_casteljau(p0: Vector, p1: Vector, p2: Vector, p3: Vector, t: float):
+    """Bézier curves agree with De Casteljau's algorithm."""
+    q0, q1, q2 = lerp(p0, p1, t), lerp(p1, p2, t), lerp(p2, p3, t)
+    r0, r1 = lerp(q0, q1, t), lerp(q1, q2, t)
+    rel_to = [p0, p1, p2, p3]
+    assert quadratic_bezier(p0, p1, p2, t).isclose(r0, abs_tol=1e-6, rel_to=rel_to)
+    assert cubic_bezier(p0, p1, p2, p3, t).isclose(lerp(r0, r1, t), abs_tol=1e-6, rel_to=rel_to)
+
+
+@given(a=st.lists(vectors(1e10)), b=vectors(1e10), ts=st.lists(params))
+def test_interpolate_many(a, b, ts):
+    """Batch forms agree with the single forms, for each element."""
+    ts = (ts * len(a))[:len(a)] if ts else [0.5] * len(a)
+    for single, many in [(lerp, lerp_many), (slerp, slerp_many)]:
+        expected = [single(x, b, t) for x, t in zip(a, ts)]
+        assert many(a, b, ts).tolist() == expected
+        assert many(VectorArray(a), b, ts).tolist() == expected
+
+
+@given(p0=vectors(1e10), p1=vectors(1e10), p2=vectors(1e10), p3=vectors(1e10),
+       ts=st.lists(params))
+def test_bezier_many(p0: Vector, p1: Vector, p2: Vector, p3: Vector, ts):
+    """Batch forms can sample a single curve at many parameters."""
+    assert quadratic_bezier_many(p0, p1, p2, ts).tolist() == [
+        quadratic_bezier(p0, p1, p2, t) for t in ts
+    ]
+    assert cubic_bezier_many(p0, p1, p2, p3, ts).tolist() == [
+        cubic_bezier(p0, p1, p2, p3, t) for t in ts
+    ]
+
+
+def test_interpolate_many_mismatched():
+    with pytest.raises(ValueError):
+        lerp_many([(0, 0), (1, 1)], (2, 2), [0, 0.5, 1])
@@ -0,0 +1,94 @@
+import json
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.codec import decode_json, decode_json_array, encode_json
+from ppb_vector.packed import VectorArray
+from utils import float32, vectors
+
+layouts = st.sampled_from(['interleaved', 'planar'])
+
+
+@given(vs=st.lists(vectors()), layout=layouts)
+def test_json_roundtrip(vs, layout: str):
+    data = encode_json(vs, layout)
+    assert decode_json(data) == vs
+    assert decode_json(json.loads(data)) == vs
+    assert decode_json_array(data) == VectorArray(vs)
+    assert decode_json_array(data.encode(), 'f') == VectorArray(vs, 'f')
+
+
+@given(vs=st.lists(vectors()), layout=layouts)
+def test_json_array(vs, layout: str):
+    """Encoding a VectorArray, or a view of one, is the same as encoding its vectors."""
+    array = VectorArray(vs)
+    assert encode_json(array, layout) == encode_json(vs, layout)
+    assert encode_json(array[::2], layout) == encode_json(vs[::2], layout)
+
+
+@given(vs=st.lists(vectors(max_magnitude=1e30)))
+def test_json_float32(vs):
+    array = VectorArray(vs, 'f')
+    assert decode_json(encode_json(array)) == [float32(v) for v in vs]
+
+
+@given(vs=st.lists(vectors()))
+def test_json_asdict(vs):
+    """Both layouts hold the same coordinates as Vector.asdict."""
+    dicts = [v.asdict() for v in vs]
+    assert json.loads(encode_json(vs)) == [[d['x'], d['y']] for d in dicts]
+    assert json.loads(encode_json(vs, 'planar')) == {
+        'x': [d['x'] for d in dicts],
+        'y': [d['y'] for d in dicts],
+    }
+
+
+def test_json_vector_likes():
+    assert encode_json([(1, 2), [3, 4], {'x': 5, 'y': 6}]) == '[[1.0,2.0],[3.0,4.0],[5.0,6.0]]'
+    assert decode_json('[[1, 2], [3.5, -4e3]]') == [Vector(1, 2), Vector(3.5, -4000)]
+
+
+@pytest.mark.parametrize("data", [
+    '{"x": [1, 2], "y": [3]}',
+    '{"x": [1], "y": [2], "z": [3]}',
+    '{"x": 1, "y": 2}',
+    '[[1, 2, 3]]',
+    '[[1, 2], [3]]',
+    '[{"x": 1, "y": 2}]',
+    '[["1", 2]]',
+    '[[true, 2]]',
+    '[[null, 2]]',
+    '"xy"',
+    '42',
+])
+def test_json_invalid(data: str):
+    with pytest.raises(ValueError):
+        decode_json(data)
+
+    with pytest.raises(ValueError):
+        decode_json_array(data)
+
+
+@pytest.mark.parametrize("vector", [(float('inf'), 0), (0, float('-inf')), (float('nan'), 1)])
+@pytest.mark.parametrize("layout", ['interleaved', 'planar'])
+def test_json_non_finite(vector, layout: str):
+    """Non-finite coordinates are rejected, rather than encoded as invalid JSON."""
+    with pytest.raises(ValueError):
+        encode_json([vector], layout)
+
+    with pytest.raises(ValueError):
+        encode_json(VectorArray([vector], 'f'), layout)
+
+
+def test_json_float32_overflow():
+    assert decode_json_array('{"x": [1e300], "y": [-1e39]}', 'f').tolist() == [
+        Vector(float('inf'), float('-inf')),
+    ]
+
+
+def test_json_bad_layout():
+    with pytest.raises(ValueError):
+        encode_json([Vector(1, 2)], layout='striped')
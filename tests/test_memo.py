@@ -0,0 +1,96 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.memo import VectorCache
+from utils import angles, vectors
+
+
+@given(calls=st.lists(st.tuples(vectors(), vectors(), angles())), maxsize=st.integers(1, 10))
+def test_cache_results(calls, maxsize):
+    """Cached results are identical to uncached ones, and the cache stays bounded."""
+    cache = VectorCache(maxsize)
+    for _ in range(2):
+        for x, y, angle in calls:
+            assert cache.rotate(x, angle) == x.rotate(angle)
+            assert cache.angle(x, y) == x.angle(y)
+            if x:
+                assert cache.normalize(x) == x.normalize()
+            assert len(cache) <= maxsize
+
+    info = cache.info()
+    assert info.hits + info.misses >= 4 * len(calls)
+    assert info.misses - info.evictions == info.currsize == len(cache)
+
+
+def test_cache_equal_keys():
+    """Vectors which are equal share cache entries."""
+    cache = VectorCache()
+    cache.rotate(Vector(1, 0), 90)
+    cache.rotate((1, 0), 90.0)
+    cache.rotate({'x': 1.0, 'y': -0.0}, 90)
+    assert cache.info().hits == 2
+    assert len(cache) == 1
+
+    cache.rotate((1, 0), 45)
+    cache.normalize((1, 0))
+    assert len(cache) == 3
+
+
+@pytest.mark.parametrize("angle", [2 ** 53 + 1, 2 ** 60 + 30, -(2 ** 53) - 1])
+def test_cache_large_int_angles(angle: int):
+    """Int angles which round to the same float are not merged."""
+    cache = VectorCache()
+    v = Vector(1, 0)
+    cache.rotate(v, float(angle))
+    assert cache.rotate(v, angle) == v.rotate(angle)
+    assert cache.rotate(v, angle + 360) == v.rotate(angle)
+    assert cache.info().hits == 1
+
+
+def test_cache_lru():
+    cache = VectorCache(maxsize=2)
+    a, b, c = Vector(1, 0), Vector(0, 1), Vector(1, 1)
+    cache.normalize(a)
+    cache.normalize(b)
+    cache.normalize(a)  # a is now the most recently used
+    cache.normalize(c)  # evicts b
+    assert cache.info().evictions == 1
+
+    cache.normalize(a)
+    assert cache.info().hits == 2
+    cache.normalize(b)
+    assert cache.info().misses == 4
+
+
+def test_cache_nan():
+    cache = VectorCache()
+    nan = float('nan')
+    v = Vector(nan, 0)
+    cache.rotate(v, 30)
+    cache.rotate(v, 30)
+    assert len(cache) == 0
+    assert cache.info().hits == 0
+    assert cache.info().misses == 2  # Calls with NaN keys are counted, but not cached
+
+
+def test_cache_errors():
+    cache = VectorCache()
+    for _ in range(2):
+        with pytest.raises(ZeroDivisionError):
+            cache.normalize((0, 0))
+    assert len(cache) == 0
+    assert cache.info().misses == 2
+
+    with pytest.raises(ValueError):
+        VectorCache(maxsize=0)
+
+
+def test_cache_clear():
+    cache = VectorCache()
+    cache.angle((1, 0), (0, 1))
+    cache.angle((1, 0), (0, 1))
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info() == (0, 0, 0, cache.maxsize, 0)
@@ -0,0 +1,99 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.narrowphase import circle_contacts, separate_circles
+from utils import lengths, vectors
+
+
+circles = st.lists(st.tuples(vectors(100), lengths(max_value=50)), min_size=2, max_size=10)
+
+
+def all_pairs(n):
+    return [(a, b) for a in range(n) for b in range(a + 1, n)]
+
+
+@given(circles=circles)
+def test_circle_contacts(circles):
+    centers, radii = [c for c, _ in circles], [r for _, r in circles]
+    i, j = zip(*all_pairs(len(circles)))
+    contacts = circle_contacts(centers, radii, i, j)
+
+    for k, (a, b) in enumerate(zip(i, j)):
+        distance = (centers[b] - centers[a]).length
+        depth = radii[a] + radii[b] - distance
+        assert contacts.overlapping[k] == (depth > 0)
+        assert contacts.depths[k] == pytest.approx(depth)
+
+        separation = contacts.separations[k]
+        if not contacts.overlapping[k]:
+            assert separation == (0, 0)
+            continue
+
+        assert separation.length == pytest.approx(depth)
+        if distance:
+            # Moving the second circle by the separation makes the circles touch
+            moved = (centers[b] + separation - centers[a]).length
+            scale = 1e-9 * (radii[a] + radii[b])
+            assert moved == pytest.approx(radii[a] + radii[b], abs=scale)
+
+
+def test_circle_contacts_coincident():
+    contacts = circle_contacts([(1, 2), (1, 2), (1, 2)], [1, 2, 0], [0, 1, 0], [1, 2, 2])
+    assert contacts.overlapping == [True, True, True]
+    assert list(contacts.depths) == [3, 2, 1]
+    assert list(contacts.separations) == [(3, 0), (2, 0), (1, 0)]
+
+
+def test_circle_contacts_touching():
+    contacts = circle_contacts([(0, 0), (3, 4)], [2, 3], [0], [1])
+    assert contacts.overlapping == [False]
+    assert list(contacts.depths) == [0]
+    assert contacts.separations[0] == (0, 0)
+
+
+def test_circle_contacts_subnormal():
+    separation = circle_contacts([(0, 0), (5e-324, 5e-324)], 1, [0], [1]).separations[0]
+    assert separation.isclose(Vector(2, 2).scale_to(2))
+
+
+@given(circles=circles)
+def test_separate_pair(circles):
+    (c0, r0), (c1, r1) = circles[:2]
+    moved = separate_circles([c0, c1], [r0, r1], [0], [1])
+    if (c1 - c0).length >= r0 + r1:
+        assert list(moved) == [c0, c1]
+        return
+
+    # Both circles move by the same distance, and just touch
+    # (up to rounding, as moves much smaller than the centers' coordinates are lost)
+    scale = 1e-9 * (r0 + r1 + c0.length + c1.length)
+    assert (moved[0] - c0).length == pytest.approx((moved[1] - c1).length, abs=scale)
+    assert (moved[1] - moved[0]).length == pytest.approx(r0 + r1, abs=scale)
+
+
+def test_separate_circles_chain():
+    centers = [(0, 0), (1, 0), (2, 0)]
+    moved = separate_circles(centers, 1, [0, 1], [1, 2])
+    assert list(moved) == [(-0.5, 0), (1, 0), (2.5, 0)]
+
+
+def test_circle_contacts_errors():
+    with pytest.raises(ValueError):
+        circle_contacts([(0, 0), (1, 0)], -1, [0], [1])
+    with pytest.raises(ValueError):
+        circle_contacts([(0, 0), (1, 0)], [1, 2, 3], [0], [1])
+    with pytest.raises(ValueError):
+        circle_contacts([(0, 0), (1, 0)], 1, [0, 1], [1])
+    with pytest.raises(IndexError):
+        circle_contacts([(0, 0), (1, 0)], 1, [0], [2])
+
+
+@pytest.mark.parametrize("i, j", [([-1], [0]), ([0], [-2]), ([0, 3], [1, 1]), ([0, 1], [2, 3])])
+def test_circle_indices_out_of_range(i, j):
+    with pytest.raises(IndexError):
+        circle_contacts([(0, 0), (1, 0), (2, 0)], 1, i, j)
+
+    with pytest.raises(IndexError):
+        separate_circles([(0, 0), (1, 0), (2, 0)], 1, i, j)
@@ -0,0 +1,270 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector
+from ppb_vector.packed import VectorArray
+from utils import angles, float32, vector_arrays, vector_likes, vectors
+
+
+@given(vs=st.lists(vectors()))
+def test_array_roundtrip(vs):
+    array = VectorArray(vs)
+    assert len(array) == len(vs)
+    assert list(array) == array.tolist() == vs
+    assert all(array[i] == v for i, v in enumerate(vs))
+
+
+@given(vs=st.lists(vectors(max_magnitude=1e30)))
+def test_array_float32(vs):
+    array = VectorArray(vs, typecode='f')
+    assert array.typecode == 'f'
+    assert array.nbytes == VectorArray(vs).nbytes // 2
+    assert list(array) == [float32(v) for v in vs]
+
+
+@pytest.mark.parametrize("vector_like", vector_likes(), ids=lambda x: type(x).__name__)
+def test_array_vector_likes(vector_like):
+    array = VectorArray([vector_like])
+    assert array[0] == vector_like
+
+    array.append(vector_like)
+    array[0] = (0, 0)
+    assert array.tolist() == [Vector(0, 0), Vector(vector_like)]
+
+
+def test_array_bad_typecode():
+    with pytest.raises(ValueError):
+        VectorArray([], typecode='i')
+
+
+def test_array_index():
+    array = VectorArray([(1, 2), (3, 4)])
+    assert array[-1] == (3, 4)
+
+    with pytest.raises(IndexError):
+        array[2]
+
+    with pytest.raises(TypeError):
+        array['x']
+
+
+def test_array_from_xy():
+    assert VectorArray.from_xy([1, 3], [2, 4]) == VectorArray([(1, 2), (3, 4)])
+
+    with pytest.raises(ValueError):
+        VectorArray.from_xy([1, 2], [3])
+
+
+@given(array=vector_arrays(), typecode=st.sampled_from(['f', 'd']))
+def test_array_astype(array: VectorArray, typecode):
+    copy = array.astype(typecode)
+    assert copy.typecode == typecode
+    assert copy.astype('d').astype(typecode) == copy
+
+    assert array.copy() == array
+    assert array.copy().x is not array.x
+
+
+@given(array=vector_arrays(), angle=angles())
+def test_array_rotate(array: VectorArray, angle: float):
+    assert array.rotate(angle).tolist() == [v.rotate(angle) for v in array]
+
+
+@given(array=vector_arrays(max_magnitude=1e30, typecode='f'), angle=angles())
+def test_array_rotate_float32(array: VectorArray, angle: float):
+    rotated = array.rotate(angle)
+    assert rotated.typecode == 'f'
+    assert rotated.tolist() == [float32(v.rotate(angle)) for v in array]
+
+
+@pytest.mark.parametrize("typecode", ['f', 'd'])
+@given(vs=st.lists(vectors(max_magnitude=1e30)))
+def test_array_normalize(typecode, vs):
+    array = VectorArray(vs, typecode)
+    assume(all(array))
+    round = float32 if typecode == 'f' else Vector
+    assert array.normalize().tolist() == [round(v.normalize()) for v in array]
+
+
+def test_array_normalize_null():
+    with pytest.raises(ZeroDivisionError):
+        VectorArray([(1, 1), (0, 0)]).normalize()
+
+
+@given(array=vector_arrays(), v=vectors())
+def test_array_add_sub(array: VectorArray, v: Vector):
+    """Operators between arrays and vectors agree with Vector operators."""
+    assert (array + v).tolist() == [a + v for a in array]
+    assert (v + array).tolist() == [v + a for a in array]
+    assert (array - v).tolist() == [a - v for a in array]
+    assert (v - array).tolist() == [v - a for a in array]
+    assert ((v.x, v.y) - array).tolist() == [v - a for a in array]
+    assert (array + array).tolist() == [a + a for a in array]
+    assert (array - [v] * len(array)).tolist() == [a - v for a in array]
+
+
+@given(array=vector_arrays(), v=vectors(), scalar=st.floats(-1e75, 1e75))
+def test_array_mul(array: VectorArray, v: Vector, scalar: float):
+    assert (array * scalar).tolist() == [a * scalar for a in array]
+    assert (scalar * array).tolist() == [scalar * a for a in array]
+    assert (-array).tolist() == [-a for a in array]
+    assert list(array * v) == [a * v for a in array]
+    assert list(v * array) == [v * a for a in array]
+    assert list(array.dot(array)) == [a.dot(a) for a in array]
+    if scalar:
+        assert (array / scalar).tolist() == [a / scalar for a in array]
+
+
+@given(array=vector_arrays(), data=st.data())
+def test_array_per_element(array: VectorArray, data):
+    n = len(array)
+    scalars = data.draw(st.lists(st.floats(-1e75, 1e75), min_size=n, max_size=n))
+    angles_ = data.draw(st.lists(angles(), min_size=n, max_size=n))
+    assert array.scale_by(scalars).tolist() == [a.scale_by(k) for a, k in zip(array, scalars)]
+    assert array.rotate(angles_).tolist() == [a.rotate(t) for a, t in zip(array, angles_)]
+
+
+def test_array_inplace():
+    array = VectorArray([(1, 2), (3, 4)], typecode='f')
+    alias = array
+    array += (1, 1)
+    array -= VectorArray([(1, 0), (0, 1)])
+    array *= 2
+    array /= 4
+    assert array is alias
+    assert array == VectorArray([(0.5, 1.5), (2, 2)], typecode='f')
+
+
+def test_array_typecodes():
+    single, double = VectorArray([(1, 2)], 'f'), VectorArray([(1, 2)])
+    assert (single + (1, 1)).typecode == 'f'
+    assert ((1, 1) - single).typecode == 'f'
+    assert (single + single).typecode == 'f'
+    assert (single + double).typecode == 'd'
+    assert (double - single).typecode == 'd'
+    assert (single * 2).typecode == 'f'
+
+
+@pytest.mark.parametrize("other", ["ab", b"xyz", 1.0, object(), {'x': 1}])
+def test_array_bad_operands(other):
+    array = VectorArray([(1, 2)])
+    for op in (lambda: array + other, lambda: other - array):
+        with pytest.raises(TypeError):
+            op()
+
+
+def test_array_mismatched_operands():
+    with pytest.raises(ValueError):
+        VectorArray([(1, 2)]) + VectorArray([(1, 2), (3, 4)])
+
+    with pytest.raises(ValueError):
+        VectorArray([(1, 2)]).rotate([1, 2])
+
+
+def test_vector_div_not_implemented():
+    """Vector / x returns NotImplemented rather than raising, for other types to handle."""
+    class Scalars:
+        def __rtruediv__(self, other):
+            return 'rtruediv'
+
+    assert Vector(1, 2) / Scalars() == 'rtruediv'
+
+
+@given(array=vector_arrays(), start=st.none() | st.integers(-10, 10),
+       stop=st.none() | st.integers(-10, 10), step=st.none() | st.integers(-3, 3))
+def test_array_slice(array: VectorArray, start, stop, step):
+    assume(step != 0)
+    s = slice(start, stop, step)
+    view = array[s]
+    assert view.tolist() == array.tolist()[s]
+    assert view.typecode == array.typecode
+    assert view.copy() == VectorArray(array.tolist()[s], array.typecode)
+
+
+def test_array_view_shares_storage():
+    array = VectorArray([(0, 0), (1, 1), (2, 2), (3, 3)], typecode='f')
+    view = array[1::2]
+    assert view.typecode == 'f'
+    assert view.nbytes == 16
+
+    view[0] = (5, 5)
+    array[3] = (6, 6)
+    assert view == VectorArray([(5, 5), (6, 6)])
+    assert array[1] == (5, 5)
+
+    view[1:][0] = (7, 7)
+    assert array[3] == (7, 7)
+
+    assert view.rotate(90) == VectorArray([(-5, 5), (-7, 7)])
+    view.truncate(1, out=view)
+    assert array[0] == (0, 0)
+    assert array[1].isclose(Vector(5, 5).normalize(), rel_tol=1e-7)
+
+    with pytest.raises(TypeError):
+        view.append((0, 0))
+
+    with pytest.raises(BufferError):
+        array.append((0, 0))
+
+    del view
+    array.append((0, 0))
+
+
+def test_array_set_slice():
+    array = VectorArray.zeros(4)
+    array[::2] = (1, 1)
+    array[1::2] = [(2, 2), (3, 3)]
+    assert array == VectorArray([(1, 1), (2, 2), (1, 1), (3, 3)])
+
+    with pytest.raises(ValueError):
+        array[:2] = [(1, 1), (2, 2), (3, 3)]
+
+
+@given(array=vector_arrays(), data=st.data())
+def test_array_mask(array: VectorArray, data):
+    mask = data.draw(st.lists(st.booleans(), min_size=len(array), max_size=len(array)))
+    expected = [v for v, m in zip(array, mask) if m]
+    assert array[mask].tolist() == expected
+
+    array[[not m for m in mask]] = (0, 0)
+    assert all(v == (0, 0) for v, m in zip(array, mask) if not m)
+
+    array.compress(mask)
+    assert array.tolist() == expected
+
+
+def test_array_mask_errors():
+    array = VectorArray([(1, 2), (3, 4)])
+    with pytest.raises(ValueError):
+        array[[True]]
+
+    with pytest.raises(TypeError):
+        array[[0, 1]]
+
+    with pytest.raises(TypeError):
+        array[::2].compress([True])
+
+
+@given(array=vector_arrays(min_size=1), data=st.data())
+def test_array_take_put(array: VectorArray, data):
+    n = len(array)
+    indices = data.draw(st.lists(st.integers(-n, n - 1)))
+    assert array.take(indices).tolist() == [array[i] for i in indices]
+
+    values = data.draw(st.lists(vectors(), min_size=len(indices), max_size=len(indices)))
+    expected = array.tolist()
+    for i, v in zip(indices, values):
+        expected[i] = v
+    array.put(indices, values)
+    assert array.tolist() == expected
+
+
+def test_array_put_errors():
+    array = VectorArray([(1, 2), (3, 4)])
+    with pytest.raises(IndexError):
+        array.put([0, 2], (0, 0))
+    assert array == VectorArray([(1, 2), (3, 4)])
+
+    with pytest.raises(IndexError):
+        array.take([2])
@@ -0,0 +1,107 @@
+import pickle
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import CachedVector, Vector
+from ppb_vector.packed import VectorArray
+from utils import angle_isclose, angles, isclose, lengths, UNIT_X, vectors
+
+
+polar_data = [
+    ((1, 0), (1, 0)),
+    ((0, 2), (2, 90)),
+    ((-3, 0), (3, 180)),
+    ((0, -4), (4, -90)),
+    ((1, 1), (2 ** 0.5, 45)),
+    ((0, 0), (0, 0)),
+    ((-0.0, 0), (0, 0)),
+    ((-0.0, -0.0), (0, 0)),
+    ((0, -0.0), (0, 0)),
+]
+
+
+@pytest.mark.parametrize("vector, polar", polar_data)
+def test_to_polar(vector, polar):
+    length, heading = Vector(vector).to_polar()
+    assert isclose(length, polar[0])
+    assert isclose(heading, polar[1])
+    assert CachedVector(vector).to_polar() == (length, heading)
+
+    lengths, headings = VectorArray([vector]).to_polar()
+    assert (lengths[0], headings[0]) == (length, heading)
+
+
+def test_to_polar_negated_null():
+    assert (-Vector(0, 0)).to_polar() == (0, 0)
+
+
+@given(v=vectors())
+def test_to_polar_heading(v: Vector):
+    length, heading = v.to_polar()
+    assert length == v.length
+    assert -180 < heading <= 180
+    if v:
+        assert angle_isclose(heading, UNIT_X.angle(v))
+
+
+@given(v=vectors())
+def test_polar_roundtrip(v: Vector):
+    # Vector._trig trades some accuracy on the smaller of cos and sin,
+    #  for better preservation of lengths.
+    assert Vector.from_polar(*v.to_polar()).isclose(v, rel_tol=1e-8)
+
+
+@given(length=lengths(), angle=angles())
+def test_from_polar(length: float, angle: float):
+    v = Vector.from_polar(length, angle)
+    assert v.isclose(Vector(length, 0).rotate(angle))
+    assert isclose(v.length, length)
+
+
+@given(v=vectors())
+def test_cached_vector(v: Vector):
+    cached = CachedVector(v)
+    assert isinstance(cached, Vector)
+    assert cached == v
+    assert cached.length == v.length
+    assert cached.to_polar() == v.to_polar()
+    # Cached values are reused
+    assert cached.to_polar() is cached.to_polar()
+
+
+def test_cached_vector_operations():
+    v = CachedVector(3, 4)
+    assert type(v + (1, 1)) is Vector
+    assert type(v.rotate(90)) is Vector
+    assert Vector(v) is v
+
+
+def test_cached_vector_pickle():
+    v = CachedVector(3, 4)
+    v.length
+    copy = pickle.loads(pickle.dumps(v))
+    assert type(copy) is CachedVector
+    assert copy == v
+
+
+@given(vs=st.lists(vectors()))
+def test_polar_batch(vs):
+    array = VectorArray(vs)
+    lengths, headings = array.to_polar()
+    assert list(zip(lengths, headings)) == [v.to_polar() for v in vs]
+
+    back = VectorArray.from_polar(lengths, headings)
+    assert back.tolist() == [Vector.from_polar(*v.to_polar()) for v in vs]
+
+
+@given(length=lengths(), angles=st.lists(angles()))
+def test_from_polar_broadcast(length, angles):
+    array = VectorArray.from_polar(length, angles)
+    assert array.tolist() == [Vector.from_polar(length, angle) for angle in angles]
+
+
+def test_from_polar_mismatched():
+    with pytest.raises(ValueError):
+        VectorArray.from_polar([1, 2], [0, 90, 180])
@@ -0,0 +1,63 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector
+from ppb_vector.packed import VectorArray
+from utils import isclose, units, vectors
+
+
+@given(x=vectors(), y=vectors())
+def test_project_decomposition(x: Vector, y: Vector):
+    """x == x.project_onto(y) + x.reject_from(y)"""
+    assume(y)
+    assert x.isclose(x.project_onto(y) + x.reject_from(y))
+
+
+@given(x=vectors(max_magnitude=1e10), y=vectors(max_magnitude=1e10))
+def test_project_orthogonal(x: Vector, y: Vector):
+    assume(y.length > 1e-10)
+    assert isclose(x.reject_from(y) * y, 0, abs_tol=1e-3, rel_to=[x.length * y.length])
+    assert isclose(x.project_onto(y).cross(y), 0, abs_tol=1e-3, rel_to=[x.length * y.length])
+
+
+@given(x=vectors(), y=vectors(), scalar=st.floats(min_value=1e-10, max_value=1e10))
+def test_project_scale_invariant(x: Vector, y: Vector, scalar: float):
+    """Projection only depends on the direction of what is projected onto."""
+    # Scaling must preserve the direction exactly, which it may not if it rounds
+    #  subnormal coordinates off.
+    assume(y and (scalar * y) / scalar == y)
+    assert x.project_onto(y).isclose(x.project_onto(scalar * y), rel_to=[x])
+
+
+@given(x=vectors(), unit=units())
+def test_project_unit(x: Vector, unit: Vector):
+    assert x.project_onto(unit).isclose((x * unit) * unit, rel_to=[x])
+
+
+def test_project_null():
+    with pytest.raises(ZeroDivisionError):
+        Vector(1, 1).project_onto((0, 0))
+
+    with pytest.raises(ZeroDivisionError):
+        Vector(1, 1).reject_from((0, 0))
+
+
+@given(xs=st.lists(vectors()), ys=st.lists(vectors()))
+def test_project_batch(xs, ys):
+    pairs = [(x, y) for x, y in zip(xs, ys) if y]
+    array = VectorArray(x for x, _ in pairs)
+    others = VectorArray(y for _, y in pairs)
+    assert array.project_onto(others).tolist() == [x.project_onto(y) for x, y in pairs]
+    assert array.reject_from(others).tolist() == [x.reject_from(y) for x, y in pairs]
+
+
+@pytest.mark.parametrize("other", [(5e-324, 1e-323), (1e-310, 2e-310), (-5e-324, 0)])
+def test_project_subnormal(other):
+    """Subnormal vectors are projected onto along their exact direction."""
+    unit = Vector(other).scale_by(2.0 ** 600).normalize()
+    x = Vector(1, 2)
+    assert x.project_onto(other).isclose((x * unit) * unit)
+    assert x.reject_from(other).isclose(x - (x * unit) * unit)
+    assert VectorArray([x]).project_onto(other)[0] == x.project_onto(other)
+    assert VectorArray([x]).reject_from(other)[0] == x.reject_from(other)
@@ -0,0 +1,161 @@
+import math
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector
+from ppb_vector.raycast import (
+    circle_index, raycast_circles, raycast_segments, segment_index,
+)
+from utils import units, vectors
+
+
+def nearest_segment(origin: Vector, direction: Vector, segments):
+    """Find the nearest segment hit by a ray, with Vector math."""
+    direction = direction.normalize()
+    best = (math.inf, -1)
+    for k, (start, end) in enumerate(segments):
+        span = end - start
+        denom = direction.cross(span)
+        if denom == 0:
+            continue
+
+        t = (start - origin).cross(span) / denom
+        u = (start - origin).cross(direction) / denom
+        if t >= 0 and 0 <= u <= 1:
+            best = min(best, (t, k))
+
+    return best
+
+
+@given(origin=vectors(100), direction=units(),
+       segments=st.lists(st.tuples(vectors(100), vectors(100)), max_size=20))
+def test_raycast_segments(origin: Vector, direction: Vector, segments):
+    starts, ends = [s for s, _ in segments], [e for _, e in segments]
+    hits = raycast_segments([origin], [direction], starts, ends)
+    indexed = raycast_segments([origin], [direction], starts, ends,
+                               index=segment_index(starts, ends))
+    if repr(hits) != repr(indexed):  # NaN for misses
+        # Only rays grazing the end of a segment may be reported differently
+        [k] = hits.indices if hits.indices[0] >= 0 else indexed.indices
+        point = hits.points[0] if hits.indices[0] >= 0 else indexed.points[0]
+        scale = 1e-9 * max(origin.length, starts[k].length, ends[k].length, 1)
+        assert min((point - starts[k]).length, (point - ends[k]).length) <= scale
+
+    t, k = nearest_segment(origin, direction, segments)
+    assert hits.indices[0] == k
+    if k < 0:
+        assert hits.distances[0] == math.inf
+        assert hits.points[0] != hits.points[0]  # NaN
+        return
+
+    assert hits.distances[0] == pytest.approx(t)
+    assert hits.points[0].isclose(origin + t * direction.normalize(), abs_tol=1e-6)
+
+    normal = hits.normals[0]
+    span = ends[k] - starts[k]
+    assert normal.length == pytest.approx(1)
+    assert normal * span == pytest.approx(0, abs=1e-9 * span.length)
+    assert normal * direction <= 0
+    assert direction.reflect(normal) * normal >= 0
+
+
+@given(origin=vectors(100), direction=vectors(10),
+       circles=st.lists(st.tuples(vectors(100), st.floats(0, 50)), max_size=20))
+def test_raycast_circles(origin: Vector, direction: Vector, circles):
+    assume(direction.length > 1e-3)
+    centers, radii = [c for c, _ in circles], [r for _, r in circles]
+    hits = raycast_circles(origin, direction, centers, radii)
+    indexed = raycast_circles(origin, direction, centers, radii,
+                              index=circle_index(centers, radii))
+    if repr(hits) != repr(indexed):  # NaN for misses
+        # Only rays grazing a circle may be reported differently
+        [k] = hits.indices if hits.indices[0] >= 0 else indexed.indices
+        offset = abs((origin - centers[k]).cross(direction.normalize()))
+        scale = 1e-9 * max(origin.length, centers[k].length, 1)
+        assert offset == pytest.approx(radii[k], abs=scale)
+
+    [k] = hits.indices
+    if k < 0:
+        # The ray misses all circles
+        unit = direction.normalize()
+        for center, radius in circles:
+            t = max((center - origin) * unit, 0)
+            assert (origin + t * unit - center).length > radius * (1 - 1e-9)
+        return
+
+    point = hits.points[0]
+    if hits.distances[0] == 0:
+        # The ray starts inside the circle
+        assert (origin - centers[k]).length <= radii[k] * (1 + 1e-9)
+        assert hits.normals[0] == -direction.normalize()
+        return
+
+    assert (point - centers[k]).length == pytest.approx(radii[k], abs=1e-6)
+    assert hits.normals[0].length == pytest.approx(1)
+    assert hits.normals[0] * direction <= 1e-9
+
+
+def test_raycast_inside_circle():
+    hits = raycast_circles([(0, 0), (9, 0)], (0, 2), [(1, 0), (10, 0)], [2, 1])
+    assert list(hits.distances) == [0.0, 0.0]
+    assert list(hits.indices) == [0, 1]
+    assert hits.normals.tolist() == [Vector(0, -1), Vector(0, -1)]
+
+
+def test_raycast_max_distance():
+    starts, ends = [(1, -1), (3, -1)], [(1, 1), (3, 1)]
+    hits = raycast_segments((0, 0), (1, 0), starts, ends, max_distance=[0.5, 1, 2])
+    assert list(hits.indices) == [-1, 0, 0]
+
+    hits = raycast_segments((2, 0), [(1, 0), (-1, 0)], starts, ends, max_distance=0.9)
+    assert list(hits.indices) == [-1, -1]
+
+
+def test_raycast_ties():
+    """Rays hitting several shapes at the same distance report the lowest index."""
+    hits = raycast_segments((0, 0), (1, 0), [(1, 0), (1, -1), (1, 0)], [(1, 1), (1, 1), (2, 0)])
+    assert list(hits.indices) == [0]
+
+    hits = raycast_segments((0, 0), (1, 0), [(1, -1)] * 3, [(1, 1)] * 3,
+                            index=segment_index([(1, -1)] * 3, [(1, 1)] * 3))
+    assert list(hits.indices) == [0]
+
+
+@pytest.mark.parametrize("scale", [1e-300, 1e-170, 1e170, 1e300])
+def test_raycast_segments_magnitudes(scale: float):
+    """Rays hit segments whose coordinates' products overflow or underflow."""
+    segment = [(scale, -scale)], [(scale, scale)]
+    for index in (None, segment_index(*segment)):
+        hits = raycast_segments((0, 0), (1, 0), *segment, index=index)
+        assert list(hits.indices) == [0]
+        assert list(hits.distances) == [scale]
+        assert hits.points.tolist() == [Vector(scale, 0)]
+        assert hits.normals.tolist() == [Vector(-1, 0)]
+
+
+@pytest.mark.parametrize("direction", [(5e-324, 0), (1e-310, 1e-310), (1e300, 1e300)])
+def test_raycast_direction_magnitudes(direction):
+    """Directions of any length are normalized exactly."""
+    unit = Vector(direction).scale_by(2.0 ** 600 if abs(direction[0]) < 1 else 1).normalize()
+    segments = [(1, -3), (-3, 1)], [(1, 3), (3, 1)]
+    for index in (None, segment_index(*segments)):
+        hits = raycast_segments((0, 0), direction, *segments, index=index)
+        assert list(hits.indices) == [0]
+        assert hits.points[0].isclose(hits.distances[0] * unit)
+
+    hits = raycast_circles((0, 0), direction, 5 * unit, 1)
+    assert hits.distances[0] == pytest.approx(4)
+    assert hits.normals[0].isclose(-unit)
+
+
+def test_raycast_errors():
+    with pytest.raises(ZeroDivisionError):
+        raycast_segments((0, 0), [(1, 0), (0, 0)], [(1, 0)], [(1, 1)])
+
+    with pytest.raises(ValueError):
+        raycast_circles((0, 0), (1, 0), [(1, 0), (2, 0)], [1, 2, 3])
+
+    with pytest.raises(ValueError):
+        raycast_circles((0, 0), (1, 0), [(1, 0)], -1)
@@ -0,0 +1,126 @@
+import io
+import os
+import tempfile
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector.packed import VectorArray
+from ppb_vector.recorder import load, read_chunks, Recorder
+from utils import vectors
+
+
+@given(vs=st.lists(vectors()), chunk_size=st.integers(1, 5), typecode=st.sampled_from(['f', 'd']))
+def test_recorder_roundtrip(vs, chunk_size: int, typecode: str):
+    file = io.BytesIO()
+    with Recorder(file, timestamps=True, ids=True, typecode=typecode,
+                  chunk_size=chunk_size) as recorder:
+        for i, v in enumerate(vs):
+            recorder.record(v, timestamp=i / 2, id=-i)
+            assert len(recorder) < chunk_size
+
+    assert recorder.count == len(vs)
+
+    chunks = list(read_chunks(file))
+    assert all(len(chunk.vectors) == chunk_size for chunk in chunks[:-1])
+
+    vectors, timestamps, ids = load(file)
+    assert vectors == VectorArray(vs, typecode)
+    assert vectors.typecode == typecode
+    assert timestamps is not None and list(timestamps) == [i / 2 for i in range(len(vs))]
+    assert ids is not None and list(ids) == [-i for i in range(len(vs))]
+
+
+@given(batches=st.lists(st.lists(vectors())), chunk_size=st.integers(1, 5))
+def test_recorder_many(batches, chunk_size: int):
+    """Batches larger than a chunk are split when flushed."""
+    file = io.BytesIO()
+    with Recorder(file, timestamps=True, chunk_size=chunk_size) as recorder:
+        for t, batch in enumerate(batches):
+            recorder.record_many(batch, timestamp=t)
+
+    chunks = list(read_chunks(file))
+    assert all(0 < len(chunk.vectors) <= chunk_size for chunk in chunks)
+
+    vectors, timestamps, ids = load(file)
+    assert vectors.tolist() == [v for batch in batches for v in batch]
+    assert timestamps is not None
+    assert list(timestamps) == [t for t, batch in enumerate(batches) for _ in batch]
+    assert ids is None
+
+
+def test_recorder_memory():
+    """Without a file, records are kept in memory."""
+    recorder = Recorder(ids=True, chunk_size=2)
+    recorder.record_many(VectorArray([(1, 2), (3, 4), (5, 6)]), ids=[1, 2, 3])
+    recorder.flush()
+    assert len(recorder) == 3
+    assert recorder.vectors == VectorArray([(1, 2), (3, 4), (5, 6)])
+    assert list(recorder.ids) == [1, 2, 3]
+    assert recorder.timestamps is None
+
+
+def test_recorder_file():
+    """Recordings on disk are memory-mapped, and can be read by path."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'recording')
+        with open(path, 'wb') as file, Recorder(file, chunk_size=2) as recorder:
+            recorder.record_many([(1, 2), (3, 4), (5, 6)])
+
+        with open(path, 'rb') as file:
+            assert [len(chunk.vectors) for chunk in read_chunks(file)] == [2, 1]
+
+        assert load(path).vectors == VectorArray([(1, 2), (3, 4), (5, 6)])
+
+
+def test_recorder_empty():
+    file = io.BytesIO()
+    Recorder(file, timestamps=True, typecode='f').flush()
+    vectors, timestamps, ids = load(file)
+    assert len(vectors) == 0 and vectors.typecode == 'f'
+    assert timestamps is not None and len(timestamps) == 0
+    assert ids is None
+
+
+def test_recorder_errors():
+    recorder = Recorder(timestamps=True)
+    with pytest.raises(ValueError):
+        recorder.record((1, 2))
+
+    with pytest.raises(ValueError):
+        recorder.record((1, 2), timestamp=0, id=1)
+
+    with pytest.raises(ValueError):
+        recorder.record_many([(1, 2), (3, 4)], timestamp=[0])
+
+    assert len(recorder) == 0
+
+    with pytest.raises(ValueError):
+        Recorder(chunk_size=0)
+
+    with pytest.raises(ValueError):
+        Recorder(typecode='i')
+
+
+@pytest.mark.parametrize("timestamp, id", [(0, 'x'), (0, 2 ** 63), (0, 1.5), ('x', 1)])
+def test_recorder_rejected_record(timestamp, id):
+    """A rejected record leaves the recorder flushable, and is not recorded."""
+    file = io.BytesIO()
+    recorder = Recorder(file, timestamps=True, ids=True)
+    recorder.record((1, 2), timestamp=0, id=7)
+    with pytest.raises((TypeError, ValueError, OverflowError)):
+        recorder.record((3, 4), timestamp=timestamp, id=id)
+
+    recorder.flush()
+    vectors, timestamps, ids = load(file)
+    assert list(vectors) == [(1, 2)]
+    assert list(timestamps) == [0]
+    assert list(ids) == [7]
+
+
+@pytest.mark.parametrize("data", [b"", b"PPBV", b"PPBX\x01\x00d", b"PPBV\x02\x00d",
+                                  b"PPBV\x01\x00d\x02\x00\x00\x00\x00\x00\x00\x00"])
+def test_read_invalid(data: bytes):
+    with pytest.raises(ValueError):
+        list(read_chunks(io.BytesIO(data)))
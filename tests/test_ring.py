@@ -0,0 +1,73 @@
+import typing
+from collections import deque
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.interpolate import lerp
+from ppb_vector.ring import VectorRing
+from utils import vectors
+
+
+@given(capacity=st.integers(1, 10), vs=st.lists(vectors()))
+def test_ring_deque(capacity: int, vs):
+    """VectorRing behaves like a deque with a maxlen."""
+    ring = VectorRing(capacity)
+    reference: typing.Deque[Vector] = deque(maxlen=capacity)
+    for v in vs:
+        ring.append(v)
+        reference.append(v)
+
+        assert len(ring) == len(reference)
+        assert list(ring) == list(reference)
+        assert ring.unrolled().tolist() == list(reference)
+        assert ring[0] == reference[0]
+        assert ring[-1] == reference[-1]
+
+
+@given(vs=st.lists(vectors(1e10), min_size=1, max_size=10), data=st.data())
+def test_ring_interpolate(vs, data):
+    ring = VectorRing(len(vs))
+    ring.extend(vs)
+
+    index = data.draw(st.floats(0, len(vs) - 1))
+    i = int(index)
+    expected = vs[i] if i == index else lerp(vs[i], vs[i + 1], index - i)
+    assert ring.interpolate(index) == expected
+
+    for i, v in enumerate(vs):
+        assert ring.interpolate(i) == ring.interpolate(i - len(vs)) == v
+
+
+def test_ring_errors():
+    ring = VectorRing(3)
+    with pytest.raises(IndexError):
+        ring[0]
+    with pytest.raises(IndexError):
+        ring.interpolate(0)
+
+    ring.extend([(0, 0), (1, 1)])
+    for index in [2, -3]:
+        with pytest.raises(IndexError):
+            ring[index]
+    for index in [1.5, -0.5, -2.5]:
+        with pytest.raises(IndexError):
+            ring.interpolate(index)
+
+    with pytest.raises(ValueError):
+        VectorRing(0)
+
+
+def test_ring_clear():
+    ring = VectorRing(2, typecode='f')
+    ring.extend([(0.1, 0), (1, 1), (2, 2)])
+    assert ring.typecode == 'f'
+    assert ring.capacity == 2
+    assert ring.unrolled().typecode == 'f'
+
+    ring.clear()
+    assert len(ring) == 0
+    ring.append((3, 3))
+    assert list(ring) == [Vector(3, 3)]
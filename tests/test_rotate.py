@@ -1,4 +1,5 @@
 import math
+from decimal import Decimal, localcontext
 from math import cos, fabs, radians, sin, sqrt
 
 import hypothesis.strategies as st
@@ -74,6 +75,63 @@ def test_remarkable_angles(angle, trig):
     assert isclose(cos_t, cos_m, abs_tol=0, rel_tol=1e-14)
 
 
+@pytest.mark.parametrize("angle", range(-360, 721, 90))
+def test_trig_quarter_turns(angle):
+    r_cos, r_sin = Vector._trig(angle)
+    assert {abs(r_cos), abs(r_sin)} == {0, 1}
+    assert (r_cos, r_sin) == (round(cos(radians(angle))), round(sin(radians(angle))))
+    assert Vector._trig(float(angle)) == (r_cos, r_sin)
+
+
+@given(angle=st.integers(min_value=-10_000, max_value=10_000))
+def test_trig_integral(angle: int):
+    """Whole-degree angles are looked up modulo 360°, whether ints or floats."""
+    assert Vector._trig(angle) == Vector._trig(float(angle)) == Vector._trig(angle % 360)
+
+
+PI = Decimal('3.14159265358979323846264338327950288419716939937510582097494')
+
+
+def decimal_trig(angle: int):
+    """Compute the cosine and sine of an angle in degrees, to 50 digits."""
+    quadrant, angle = divmod(angle, 90)
+    with localcontext() as ctx:
+        ctx.prec = 60
+        r = PI * angle / 180
+        # Taylor series, where term is (-1)**k * r**(2k) / (2k)!
+        r_cos, r_sin, term = Decimal(0), Decimal(0), Decimal(1)
+        for k in range(60):
+            r_cos += term
+            r_sin += term * r / (2 * k + 1)
+            term = -term * r * r / ((2 * k + 1) * (2 * k + 2))
+
+    # Rotating by 90° maps (cos, sin) to (-sin, cos), exactly
+    for _ in range(quadrant):
+        r_cos, r_sin = -r_sin, r_cos
+
+    return r_cos, r_sin
+
+
+def ulp(x: float) -> Decimal:
+    return Decimal(2.0 ** (math.frexp(x)[1] - 53)) if x else Decimal(5e-324)
+
+
+@pytest.mark.parametrize("angle", range(360))
+def test_trig_table(angle: int):
+    """Whole-degree angles are faithfully rounded, and preserve lengths unless correctly rounded."""
+    r_cos, r_sin = Vector._trig(angle)
+    exact_cos, exact_sin = decimal_trig(angle)
+    assert abs(Decimal(r_cos) - exact_cos) < ulp(r_cos)
+    assert abs(Decimal(r_sin) - exact_sin) < ulp(r_sin)
+
+    correctly_rounded = (float(exact_cos) + 0.0, float(exact_sin) + 0.0)
+    if (r_cos, r_sin) != correctly_rounded:
+        assert r_cos * r_cos + r_sin * r_sin == 1
+
+    if angle % 90 == 0:
+        assert (r_cos, r_sin) == correctly_rounded
+
+
 data_close = [
     (Vector(1, 0), angle, Vector(cos_t, sin_t))
     for (angle, (cos_t, sin_t)) in remarkable_angles.items()
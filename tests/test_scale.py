@@ -2,7 +2,8 @@ from hypothesis import assume, given, strategies as st
 from pytest import raises  # type: ignore
 
 from ppb_vector import Vector
-from utils import angle_isclose, isclose, lengths, vectors
+from ppb_vector.packed import VectorArray
+from utils import angle_isclose, floats, isclose, lengths, vector_arrays, vectors
 
 
 @given(v=vectors(), length=st.floats(max_value=0))
@@ -25,3 +26,41 @@ def test_scale_aligned(x: Vector, length: float):
     """Test that x.scale_to(length) is aligned with x."""
     assume(length > 0 and x)
     assert angle_isclose(x.scale_to(length).angle(x), 0)
+
+
+def outcome(f, *args):
+    """Return the result of f(*args), or the type of the exception it raises."""
+    try:
+        return f(*args)
+    except Exception as e:
+        return type(e)
+
+
+@given(array=vector_arrays(), data=st.data())
+def test_scale_to_batch(array: VectorArray, data):
+    """VectorArray.scale_to agrees with Vector.scale_to, including errors."""
+    length = data.draw(st.one_of(
+        floats(), st.lists(floats(), min_size=len(array), max_size=len(array)),
+    ))
+    per_element = length if isinstance(length, list) else [length] * len(array)
+
+    expected = [outcome(Vector.scale_to, v, m) for v, m in zip(array, per_element)]
+    errors = [e for e in expected if isinstance(e, type)]
+    if errors:
+        with raises(errors[0]):
+            array.scale_to(length)
+    else:
+        assert array.scale_to(length).tolist() == expected
+
+
+def test_scale_to_batch_out():
+    array = VectorArray([(3, 4), (0, 0)])
+    assert array.scale_to([10, 0], out=array) is array
+    assert array == VectorArray([(6, 8), (0, 0)])
+
+    with raises(ZeroDivisionError):
+        array.scale_to(1, out=array)
+    assert array == VectorArray([(6, 8), (0, 0)])
+
+    with raises(ValueError):
+        array.scale_to([1, 2, 3])
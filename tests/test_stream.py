@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest  # type: ignore
+
+from ppb_vector import Vector
+from ppb_vector.packed import VectorArray
+from ppb_vector.stream import batches
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(*args, **kwargs):
+    return [batch async for batch in batches(*args, **kwargs)]
+
+
+def queue_of(items):
+    queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+    queue.put_nowait(None)
+    return queue
+
+
+async def iterate(items, delay=0):
+    for item in items:
+        await asyncio.sleep(delay)
+        yield item
+
+
+vectors = [Vector(i, -i) for i in range(10)]
+
+
+@pytest.mark.parametrize("max_size", [1, 3, 10, 100])
+def test_batches_size(max_size):
+    async def main():
+        return await collect(queue_of(vectors), max_size=max_size)
+
+    result = run(main())
+    assert all(0 < len(batch) <= max_size for batch in result)
+    assert [v for batch in result for v in batch] == vectors
+    assert len(result) == -(-len(vectors) // max_size)
+
+
+def test_batches_iterable():
+    async def main():
+        return await collect(iterate(vectors), max_size=4, max_delay=1)
+
+    result = run(main())
+    assert [len(batch) for batch in result] == [4, 4, 2]
+    assert [v for batch in result for v in batch] == vectors
+
+
+def test_batches_delay():
+    """Vectors arriving within max_delay of each other are batched together."""
+    async def main():
+        queue = asyncio.Queue()
+
+        async def produce():
+            for v in vectors[:3]:
+                await queue.put(v)
+            await asyncio.sleep(0.2)
+            for v in vectors[3:]:
+                await queue.put(v)
+            await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        result = await collect(queue, max_delay=0.05)
+        await producer
+        return result
+
+    assert [len(batch) for batch in run(main())] == [3, 7]
+
+
+def test_batches_transform():
+    async def main():
+        return await collect(queue_of(vectors), max_size=5, transform=VectorArray.perp)
+
+    result = run(main())
+    assert [v for batch in result for v in batch] == [v.perp() for v in vectors]
+
+
+def test_batches_typecode():
+    async def main():
+        return await collect(queue_of([(0.1, 0.2)]), typecode='f')
+
+    [batch] = run(main())
+    assert batch == VectorArray([(0.1, 0.2)], typecode='f')
+
+
+def test_batches_cooperative():
+    """Other tasks run between the batches of a burst."""
+    async def main():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+        counts = []
+        async for _ in batches(queue_of(vectors), max_size=2):
+            counts.append(len(ticks))
+        task.cancel()
+        return counts
+
+    counts = run(main())
+    assert len(counts) == 5
+    assert counts == sorted(set(counts))
+
+
+def test_batches_source_error():
+    async def failing():
+        yield (0, 0)
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        run(collect(failing()))
+
+
+@pytest.mark.parametrize("kwargs", [{'max_size': 0}, {'typecode': 'i'}])
+def test_batches_invalid(kwargs):
+    with pytest.raises(ValueError):
+        run(collect(queue_of([]), **kwargs))
@@ -0,0 +1,54 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.packed import VectorArray
+from ppb_vector.surface import Surface
+from utils import units, vector_likes, vectors
+
+
+@given(initial=vectors(), normal=units())
+def test_surface_reflect(initial: Vector, normal: Vector):
+    """Surface.reflect gives exactly the same results as Vector.reflect."""
+    assert Surface(normal).reflect(initial) == initial.reflect(normal)
+
+
+@pytest.mark.parametrize(
+    "vector_like", vector_likes(Vector(5, 3)), ids=lambda x: type(x).__name__,
+)
+def test_surface_vector_likes(vector_like):
+    assert Surface((-1, 0)).reflect(vector_like) == (-5, 3)
+
+
+@pytest.mark.parametrize("normal", [(0, 0), (1, 1), (0, 2)])
+def test_surface_not_normalized(normal):
+    with pytest.raises(ValueError):
+        Surface(normal)
+
+
+def test_surface_normal_read_only():
+    surface = Surface((-1, 0))
+    with pytest.raises(AttributeError):
+        surface.normal = Vector(0, 1)  # type: ignore
+
+    assert surface.normal == (-1, 0)
+    assert surface.reflect((5, 3)) == (-5, 3)
+
+
+@given(initials=st.lists(vectors()), normal=units())
+def test_surface_reflect_many(initials, normal: Vector):
+    surface = Surface(normal)
+    expected = [v.reflect(normal) for v in initials]
+    assert surface.reflect_many(initials).tolist() == expected
+
+    array = VectorArray(initials)
+    x_storage = array.x
+    assert surface.reflect_many(array, out=array) is array
+    assert array.x is x_storage
+    assert array.tolist() == expected
+
+
+def test_surface_reflect_many_bad_output():
+    with pytest.raises(ValueError):
+        Surface((1, 0)).reflect_many([(1, 1)], out=VectorArray.zeros(2))
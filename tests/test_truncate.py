@@ -1,9 +1,10 @@
 from typing import Type, Union
 
-from hypothesis import assume, event, example, given, note
+from hypothesis import assume, event, example, given, note, strategies as st
 
 from ppb_vector import Vector
-from utils import floats, lengths, vectors
+from ppb_vector.packed import VectorArray
+from utils import floats, lengths, vector_arrays, vectors
 
 
 @given(x=vectors(), max_length=lengths())
@@ -49,3 +50,25 @@ def test_truncate_equivalent_to_scale(x: Vector, max_length: float):
 
     else:
         assert scale == truncate
+
+
+@given(array=vector_arrays(), data=st.data())
+def test_truncate_batch(array: VectorArray, data):
+    """VectorArray.truncate agrees with Vector.truncate."""
+    max_length = data.draw(st.one_of(
+        lengths(), st.lists(lengths(), min_size=len(array), max_size=len(array)),
+    ))
+    per_element = max_length if isinstance(max_length, list) else [max_length] * len(array)
+
+    expected = [v.truncate(m) for v, m in zip(array, per_element)]
+    assert array.truncate(max_length).tolist() == expected
+
+    assert array.truncate(max_length, out=array) is array
+    assert array.tolist() == expected
+
+
+def test_truncate_batch_float32():
+    array = VectorArray([(0.3, 0.4), (0.1, 0.1)], typecode='f')
+    truncated = array.truncate(0.25)
+    assert truncated.typecode == 'f'
+    assert truncated.tolist() == VectorArray([v.truncate(0.25) for v in array], 'f').tolist()
@@ -0,0 +1,130 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector
+from ppb_vector.interpolate import lerp
+from ppb_vector.tween import ease_in, ease_in_out, ease_out, linear, smoothstep, TweenScheduler
+from utils import vectors
+
+
+EASINGS = [linear, ease_in, ease_out, ease_in_out, smoothstep]
+
+
+@pytest.mark.parametrize("easing", EASINGS)
+def test_easing_ends(easing):
+    assert easing(0.0) == 0
+    assert easing(1.0) == 1
+
+
+@pytest.mark.parametrize("easing", EASINGS)
+@given(t=st.floats(0, 1), u=st.floats(0, 1))
+def test_easing_monotonic(easing, t: float, u: float):
+    t, u = min(t, u), max(t, u)
+    assert 0 <= easing(t) <= easing(u) <= 1
+
+
+def ease_cubic(t: float) -> float:
+    """A custom easing curve, which the scheduler calls once per tween."""
+    return t * t * t
+
+
+tweens = st.lists(st.tuples(
+    vectors(1e10), vectors(1e10), st.floats(0, 10), st.sampled_from(EASINGS + [ease_cubic]),
+))
+
+
+@given(specs=tweens, dts=st.lists(st.floats(0, 5), max_size=5))
+def test_scheduler(specs, dts):
+    """Tweens advanced together agree with tweens evaluated one at a time."""
+    scheduler = TweenScheduler()
+    handles = [scheduler.add(*spec) for spec in specs]
+    assert len(set(handles)) == len(handles)
+
+    elapsed = 0.0
+    finished = {}
+    for dt in dts:
+        elapsed += dt
+        done = scheduler.step(dt)
+        assert not done.keys() & finished.keys()
+        finished.update(done)
+
+        for handle, (start, end, duration, easing) in zip(handles, specs):
+            if handle in finished:
+                assert handle not in scheduler
+                assert finished[handle] == end
+                continue
+
+            assert scheduler[handle] == lerp(start, end, easing(elapsed / duration))
+
+    assert len(scheduler) + len(finished) == len(specs)
+    assert sorted(map(tuple, scheduler.values)) == sorted(
+        tuple(scheduler[h]) for h in handles if h in scheduler
+    )
+
+
+@given(specs=tweens, cancelled=st.sets(st.integers(0, 20)), dt=st.floats(0, 5))
+def test_scheduler_mixed(specs, cancelled, dt):
+    """Tweens keep their values when others are added or cancelled."""
+    scheduler = TweenScheduler()
+    handles = []
+    for index, spec in enumerate(specs):
+        handles.append(scheduler.add(*spec))
+        if index in cancelled and handles[index // 2] in scheduler:
+            scheduler.cancel(handles[index // 2])
+
+    expected = {
+        handle: lerp(start, end, easing(dt / duration) if dt < duration else 1.0)
+        for handle, (start, end, duration, easing) in zip(handles, specs)
+        if handle in scheduler
+    }
+    finished = scheduler.step(dt)
+    assert finished.keys() <= expected.keys()
+    for handle, value in expected.items():
+        assert (finished[handle] if handle in finished else scheduler[handle]) == value
+
+
+def test_scheduler_zero_duration():
+    scheduler = TweenScheduler()
+    handle = scheduler.add((0, 0), (1, 1), 0)
+    assert scheduler[handle] == (0, 0)
+    assert scheduler.step(0) == {handle: Vector(1, 1)}
+    assert len(scheduler) == 0
+
+
+def test_scheduler_cancel():
+    scheduler = TweenScheduler()
+    a = scheduler.add((0, 0), (4, 0), 4)
+    b = scheduler.add((0, 0), (0, 4), 2)
+    scheduler.step(1)
+
+    assert scheduler.cancel(a) == (1, 0)
+    assert a not in scheduler
+    assert scheduler[b] == (0, 2)
+    with pytest.raises(KeyError):
+        scheduler.cancel(a)
+
+    assert scheduler.step(1) == {b: Vector(0, 4)}
+
+
+def test_scheduler_storage_reused():
+    scheduler = TweenScheduler()
+    scheduler.add((0, 0), (1, 1), 2)
+    elapsed, x_storage = scheduler._elapsed, scheduler.values.x
+    scheduler.step(1)
+    assert scheduler._elapsed is elapsed
+    assert scheduler.values.x is x_storage
+
+
+def test_scheduler_single_precision():
+    scheduler = TweenScheduler(typecode='f')
+    handle = scheduler.add((0, 0), (0.1, 0.1), 1)
+    scheduler.step(0.5)
+    assert scheduler.values.typecode == 'f'
+    assert scheduler[handle].isclose((0.05, 0.05), rel_tol=1e-6)
+
+
+@pytest.mark.parametrize("duration", [-1, float('nan')])
+def test_scheduler_invalid_duration(duration):
+    with pytest.raises(ValueError):
+        TweenScheduler().add((0, 0), (1, 1), duration)
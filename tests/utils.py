@@ -1,8 +1,10 @@
+import struct
 from typing import Sequence, Union
 
 import hypothesis.strategies as st
 
 from ppb_vector import Vector
+from ppb_vector.packed import VectorArray
 
 
 UNIT_X, UNIT_Y = Vector(1, 0), Vector(0, 1)
@@ -28,6 +30,14 @@ def vectors(max_magnitude=1e75):
     )
 
 
+def vector_arrays(max_magnitude=1e75, typecode='d', min_size=0, max_size=None):
+    return st.builds(
+        VectorArray,
+        st.lists(vectors(max_magnitude), min_size=min_size, max_size=max_size),
+        st.just(typecode),
+    )
+
+
 def units():
     return st.builds(UNIT_X.rotate, angles())
 
@@ -59,11 +69,19 @@ def isclose(
     return diff <= rel_max * rel_tol or diff <= abs_tol
 
 
+def float32(v: Vector) -> Vector:
+    """Round a vector to single precision."""
+    return Vector(*struct.unpack('ff', struct.pack('ff', *v)))
+
+
 # List of operations that (Vector, Vector) -> Vector
-BINARY_OPS = frozenset({Vector.__add__, Vector.__sub__, Vector.reflect})
+BINARY_OPS = frozenset({
+    Vector.__add__, Vector.__sub__, Vector.reflect,
+    Vector.project_onto, Vector.reject_from,
+})
 
 # List of (Vector, Vector) -> scalar operations
-BINARY_SCALAR_OPS = frozenset({Vector.angle, Vector.dot})
+BINARY_SCALAR_OPS = frozenset({Vector.angle, Vector.cross, Vector.dot})
 
 # List of (Vector, Vector) -> bool operations
 BOOL_OPS = frozenset({Vector.__eq__, Vector.isclose})
@@ -74,7 +92,7 @@ SCALAR_OPS = frozenset({
 })
 
 # List of operations that (Vector) -> Vector
-UNARY_OPS = frozenset({Vector.__neg__, Vector, Vector.normalize})
+UNARY_OPS = frozenset({Vector.__neg__, Vector, Vector.normalize, Vector.perp})
 
 # List of (Vector) -> scalar operations
 UNARY_SCALAR_OPS = frozenset({